@@ -4,16 +4,20 @@ Document endpoints for upload, download, and management
 import os
 from typing import Optional, List
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, Query
+from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel
 
 from config.database import get_db
+from config.settings import get_settings
 from api.v1.middleware.middleware import JWTAuth
 from services.documents.document_service import DocumentService
-from common.types import DBDocumentPermissionLevel
+from models.schemas.request.document import BatchRetrievalRequest
+from common.types import DBDocumentPermissionLevel, DocumentProcessingStatus
 from utils.logging import get_logger
 
 logger = get_logger(__name__)
+settings = get_settings()
 router = APIRouter()
 
 
@@ -28,6 +32,9 @@ async def upload_document(
 ):
     """
     Upload document to specified collection
+    With DOCUMENT_INGESTION_ASYNC the file is stored and queued, and 202 is returned with the
+    document ID; parsing and indexing progress follows through the document progress events.
+    Without a live ingestion worker the document is processed inline and 200 is returned.
     """
     try:
         tenant_id = user_context.get("tenant_id")
@@ -48,6 +55,36 @@ async def upload_document(
 
         doc_service = DocumentService(db)
 
+        if settings.DOCUMENT_INGESTION_ASYNC:
+            result = await doc_service.enqueue_document(
+                tenant_id=tenant_id,
+                department_id=department_id,
+                uploaded_by=user_id,
+                file_name=file.filename,
+                file_bytes=file_content,
+                file_mime_type=file.content_type or "application/octet-stream",
+                access_level=db_access_level,
+                collection_name=collection_name,
+                folder_id=folder_id
+            )
+            if result and not result.error:
+                queued = result.status == DocumentProcessingStatus.PENDING.value
+                return JSONResponse(status_code=202 if queued else 200, content={
+                    "success": True,
+                    "document_id": result.document_id,
+                    "file_name": result.file_name,
+                    "bucket": result.bucket,
+                    "storage_key": result.storage_key,
+                    "status": result.status,
+                    "chunks": result.chunks,
+                    "collection": collection_name,
+                    "access_level": access_level
+                })
+            raise HTTPException(
+                status_code=500,
+                detail=result.error if result else "Upload failed"
+            )
+
         if folder_id:
             result = await doc_service.upload_document_to_folder(
                 tenant_id=tenant_id,
@@ -96,6 +133,56 @@ async def upload_document(
         raise HTTPException(status_code=500, detail=f"Upload failed: {str(e)}")
 
 
+@router.put("/{document_id}/content")
+async def update_document_content(
+    document_id: str,
+    file: UploadFile = File(...),
+    user_context: dict = Depends(JWTAuth.get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Replace a document's file; only changed chunks are re-embedded and re-indexed
+    """
+    try:
+        tenant_id = user_context.get("tenant_id")
+        department_id = user_context.get("department_id")
+
+        if not tenant_id or not department_id:
+            raise HTTPException(status_code=400, detail="Tenant and department context required")
+
+        file_content = await file.read()
+
+        doc_service = DocumentService(db)
+        result = await doc_service.update_document_content(
+            tenant_id=tenant_id,
+            department_id=department_id,
+            document_id=document_id,
+            file_name=file.filename,
+            file_bytes=file_content,
+            file_mime_type=file.content_type or "application/octet-stream"
+        )
+
+        if result and result.error == "not_found":
+            raise HTTPException(status_code=404, detail="Document not found")
+        if result and not result.error:
+            return {
+                "success": True,
+                "document_id": result.document_id,
+                "file_name": result.file_name,
+                "chunks": result.chunks
+            }
+        raise HTTPException(
+            status_code=500,
+            detail=result.error if result else "Update failed"
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Update document content failed: {e}")
+        raise HTTPException(status_code=500, detail=f"Update failed: {str(e)}")
+
+
 @router.get("/collections")
 async def get_department_collections(
     department_name: str = Query(..., description="Department name"),
@@ -130,6 +217,87 @@ async def get_department_collections(
         raise HTTPException(status_code=500, detail=f"Failed to get collections: {str(e)}")
 
 
+@router.post("/retrieve/batch")
+async def batch_retrieve(
+    request: BatchRetrievalRequest,
+    user_context: dict = Depends(JWTAuth.get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Retrieve ranked chunks for many queries against a department knowledge base in one call
+    (queries embedded in one batch, one multi-vector search per collection)
+    """
+    try:
+        user_id = user_context.get("user_id")
+
+        if request.access_scope not in ["public", "private", "both"]:
+            raise HTTPException(status_code=400, detail="Access scope must be 'public', 'private' or 'both'")
+        if len(request.queries) > settings.RETRIEVAL_BATCH_MAX_QUERIES:
+            raise HTTPException(
+                status_code=400,
+                detail=f"At most {settings.RETRIEVAL_BATCH_MAX_QUERIES} queries per request"
+            )
+
+        from services.auth.permission_service import RAGPermissionService
+        from services.vector.milvus_service import milvus_service
+
+        permission_service = RAGPermissionService(db)
+        access_levels = ["public", "private"] if request.access_scope == "both" else [request.access_scope]
+        collection_names = []
+        for access_level in access_levels:
+            has_access, accessible_collections, _ = await permission_service.check_rag_access_with_override(
+                user_id=user_id,
+                department_name=request.department_name,
+                requested_access_level=access_level
+            )
+            if has_access:
+                collection_names.extend(accessible_collections)
+        collection_names = list(dict.fromkeys(collection_names))
+
+        if not collection_names:
+            raise HTTPException(status_code=403, detail="No accessible collections for requested access scope")
+
+        search = await milvus_service.batch_search_collections(
+            queries=request.queries,
+            collection_names=collection_names,
+            top_k=request.top_k,
+            final_top_k=request.final_top_k,
+            score_threshold=request.score_threshold,
+            enable_hybrid_search=request.enable_hybrid_search,
+            use_mmr=request.use_mmr
+        )
+
+        return {
+            "department": request.department_name,
+            "collections_searched": search["collections_searched"],
+            "collections_failed": search["collections_failed"],
+            "results": [
+                {
+                    "query": query,
+                    "documents": [
+                        {
+                            "document_id": result.get("id"),
+                            "chunk_id": result.get("chunk_id"),
+                            "content": result.get("content", ""),
+                            "score": result.get("score", 0.0),
+                            "collection": result.get("collection"),
+                            "collection_type": result.get("collection_type"),
+                            "metadata": result.get("metadata", {})
+                        }
+                        for result in results
+                    ]
+                }
+                for query, results in zip(request.queries, search["results"])
+            ]
+        }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Batch retrieval failed: {e}")
+        raise HTTPException(status_code=500, detail=f"Batch retrieval failed: {str(e)}")
+
+
 @router.post("/folders")
 async def create_folder(
     folder_name: str = Form(...),
@@ -1,4 +1,5 @@
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import JSONResponse
 from typing import Dict, Any
 import time
 
@@ -8,10 +9,12 @@ from models.schemas.responses.health import (
     BasicHealthResponse,
     ReadinessResponse,
     LivenessResponse,
+    ModelReadinessResponse,
     ErrorResponse,
     HealthStatus,
 )
 from config.database import test_connection
+from utils.lazy_model import model_registry
 
 router = APIRouter()
 logger = get_logger(__name__)
@@ -47,6 +50,21 @@ async def readiness_check():
         raise HTTPException(status_code=503, detail="Service not ready")
 
 
+@router.get("/models", response_model=ModelReadinessResponse)
+async def models_readiness_check():
+    """
+    Readiness of lazily loaded models (embedding, tokenizer, Docling).
+    Returns 503 until every registered model is warm; /ready does not wait for models.
+    """
+    ready = model_registry.is_ready()
+    response = ModelReadinessResponse(
+        status=HealthStatus.READY if ready else HealthStatus.DEGRADED,
+        models=model_registry.status(),
+        timestamp=time.time(),
+    )
+    return JSONResponse(status_code=200 if ready else 503, content=response.model_dump())
+
+
 @router.get("/live", response_model=LivenessResponse)
 async def liveness_check():
     """Kubernetes liveness probe"""
@@ -259,3 +259,21 @@ async def get_detailed_health(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to get detailed health: {str(e)}"
         )
+
+
+@router.get("/milvus/stats", summary="Get Milvus collection statistics (MAINTAINER only)")
+async def get_milvus_stats(
+    refresh: bool = Query(False, description="Collect fresh figures instead of serving the background snapshot"),
+    maintainer: dict = Depends(RequireOnlyMaintainer())
+) -> Dict[str, Any]:
+    """Row counts, index and load state of all collections, from the background stats snapshot (MAINTAINER only)"""
+    try:
+        from services.vector.milvus_service import milvus_service
+
+        return await milvus_service.get_collection_stats(refresh=refresh)
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to get Milvus stats: {str(e)}"
+        )
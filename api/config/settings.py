@@ -167,16 +167,139 @@ class Settings(BaseSettings):
         "m": 8,                     # PQ parameter
         "nbits": 8                  # PQ parameter
     }
+    # Index profiles selected from collection size (flat -> hnsw -> ivf_sq8; ivf_rabitq only explicitly);
+    # when disabled, MILVUS_INDEX_TYPE / MILVUS_INDEX_PARAMS are used for new collections
+    MILVUS_INDEX_AUTO_PROFILE: bool = True
+    # Rebuild grown collections into their larger profile after inserts; a rebuild releases the
+    # collection until the new index is loaded, so it is opt-in (never applied to the shared collection);
+    # when off, new collections start on HNSW instead of FLAT
+    MILVUS_INDEX_AUTO_REBUILD: bool = False
+    MILVUS_INDEX_FLAT_MAX_ROWS: int = 20000
+    MILVUS_INDEX_HNSW_MAX_ROWS: int = 2000000
+    # Filter indexes: scalar fields (field -> index type) and chunk metadata JSON paths (key -> cast type),
+    # created with new collections and backfilled on existing ones
+    MILVUS_FILTER_INDEXES_ENABLED: bool = True
+    MILVUS_SCALAR_INDEXES: Dict[str, str] = {
+        "document_id": "INVERTED",
+        "chunk_id": "INVERTED",
+        "department": "INVERTED",
+        "created_at": "STL_SORT"
+    }
+    MILVUS_JSON_PATH_INDEXES: Dict[str, str] = {
+        "file_type": "varchar",
+        "folder_id": "varchar",
+        "doc_id": "varchar"
+    }
+
+    # MMR diversification of search results (candidates over-fetched with vectors, re-ranked locally)
+    MMR_ENABLED: bool = True
+    MMR_LAMBDA_DEFAULT: float = 0.5
+    MMR_TOP_K_DEFAULT: int = 10
+    MMR_FETCH_MULTIPLIER: int = 4
+
+    # Storage layout: per_collection ({tenant}-{dept}-public/private collections) or partition_key
+    # (one shared collection per instance, logical collections separated by a partition key)
+    MILVUS_COLLECTION_LAYOUT: str = "per_collection"
+    MILVUS_SHARED_COLLECTION_NAME: str = "rag_documents"
+    MILVUS_PARTITION_KEY_NUM_PARTITIONS: int = 64
+
+    # Multi-collection search: per-collection rankings fused by rank (rrf) or raw score (score)
+    MILVUS_FUSION_METHOD: str = "rrf"
+    MILVUS_FUSION_RRF_K: int = 60
+
+    # Retrieval tuning (measure with scripts/benchmark_retrieval.py); MILVUS_SEARCH_EF 0 = index profile default
+    RAG_SEARCH_TOP_K: int = 10
+    RAG_SEARCH_FINAL_TOP_K: int = 15
+    RAG_SCORE_THRESHOLD: float = 0.7
+    MILVUS_HYBRID_RRF_K: int = 60
+    MILVUS_SEARCH_EF: int = 0
+
+    # Retrieval result cache (per-collection version counters invalidate on writes)
+    RETRIEVAL_CACHE_ENABLED: bool = True
+    RETRIEVAL_CACHE_TTL_S: int = 3600
+    # Writes bump the version again after this delay (Bounded consistency staleness), 0 disables
+    RETRIEVAL_CACHE_VISIBILITY_DELAY_S: float = 5.0
+    # Batch retrieval endpoint (/documents/retrieve/batch): queries per request
+    RETRIEVAL_BATCH_MAX_QUERIES: int = 500
+
+    # Vector store backend: milvus | local (in-process float16 store, no Milvus needed) |
+    # auto (new collections start local and move to Milvus above VECTOR_LOCAL_MAX_ROWS)
+    VECTOR_STORE_BACKEND: str = "milvus"
+    VECTOR_LOCAL_STORE_DIR: str = "data/vector_store"
+    VECTOR_LOCAL_MAX_ROWS: int = 20000
+
+    # Chunk bodies in Postgres (document_chunks): Milvus returns ids and scores, text is fetched
+    # for the final results only (Milvus keeps text solely as BM25 input when hybrid search is on)
+    MILVUS_CHUNK_STORE_ENABLED: bool = True
+
+    # Collection residency: least recently used collections are released from query-node memory
+    # (budget per instance; memory budget uses index memory estimates, 0 disables it)
+    MILVUS_RESIDENCY_ENABLED: bool = True
+    MILVUS_MAX_LOADED_COLLECTIONS: int = 64
+    MILVUS_LOADED_MEMORY_BUDGET_MB: int = 0
+    MILVUS_COLLECTION_IDLE_RELEASE_S: int = 21600
+    MILVUS_RESIDENCY_SWEEP_INTERVAL_S: int = 300
+
+    # Deferred compaction: deletes mark collections dirty; a background scheduler compacts each at most
+    # once per window (sooner above the deleted-row ratio), outside peak hours ("8-12,13-18", system TZ)
+    MILVUS_COMPACTION_SCHEDULER_ENABLED: bool = True
+    MILVUS_COMPACTION_WINDOW_S: int = 3600
+    MILVUS_COMPACTION_DELETED_RATIO: float = 0.2
+    MILVUS_COMPACTION_PEAK_HOURS: str = "8-18"
+    MILVUS_COMPACTION_CHECK_INTERVAL_S: int = 60
+
+    # Bulk backfill: vectors staged as Parquet in Milvus' own MinIO bucket, then bulk-imported
+    MILVUS_BULK_IMPORT_BUCKET: str = "a-bucket"
+    MILVUS_BULK_IMPORT_PREFIX: str = "bulk_import"
+    MILVUS_BULK_IMPORT_ROWS_PER_FILE: int = 20000
+    MILVUS_BULK_IMPORT_POLL_INTERVAL_S: int = 10
+    BULK_BACKFILL_CONCURRENCY: int = 4  # files stored and chunked concurrently
+
+    # Collection stats: row counts, index and load state refreshed in the background (Redis snapshot + gauges)
+    MILVUS_STATS_COLLECTOR_ENABLED: bool = True
+    MILVUS_STATS_REFRESH_INTERVAL_S: int = 60
 
     # Performance Tuning
     MILVUS_CONNECTION_POOL_SIZE: int = 10
     MILVUS_QUERY_TIMEOUT_MS: int = 30000
     MILVUS_LOAD_TIMEOUT_MS: int = 60000
+    MILVUS_MAX_CONCURRENT_CALLS: int = 8  # per instance (public/private), per worker
+    # Streaming insert: chunks are embedded and inserted in windows, with bounded pending inserts
+    MILVUS_INSERT_BATCH_SIZE: int = 256
+    MILVUS_INSERT_MAX_IN_FLIGHT: int = 2
     
     # Embedding
     EMBEDDING_MODEL: str = "BAAI/bge-m3"
+    EMBEDDING_MODEL_REVISION: str = "main"
     EMBEDDING_DIMENSIONS: int = 1024
     EMBEDDING_BATCH_SIZE: int = 12
+    EMBEDDING_BACKEND: str = "torch"  # torch | onnx_int8
+    EMBEDDING_ONNX_DIR: str = "models/onnx/bge-m3"
+    EMBEDDING_ONNX_THREADS: int = 0  # 0 = onnxruntime default
+    # Document encoding: length-sorted batches sized by a padded-token budget instead of a fixed count
+    EMBEDDING_LENGTH_BUCKETING_ENABLED: bool = True
+    EMBEDDING_MAX_BATCH_TOKENS: int = 16384
+    EMBEDDING_MAX_DOCUMENT_BATCH_SIZE: int = 64
+    EMBEDDING_QUERY_BATCH_SIZE: int = 32
+    EMBEDDING_BATCH_MAX_WAIT_MS: float = 5.0
+
+    # Shared embedding server (one model process per node, workers connect over a Unix socket)
+    EMBEDDING_SERVER_ENABLED: bool = False
+    EMBEDDING_SERVER_SOCKET: str = "/tmp/aichatbot-embedding.sock"
+    EMBEDDING_SERVER_POOL_SIZE: int = 4
+    EMBEDDING_SERVER_TIMEOUT_S: float = 60.0
+
+    # Query embedding cache (L1 in-process LRU, L2 Redis float16)
+    EMBEDDING_QUERY_CACHE_ENABLED: bool = True
+    EMBEDDING_QUERY_CACHE_L1_SIZE: int = 2048
+    EMBEDDING_QUERY_CACHE_TTL_S: int = 86400
+
+    # Document chunk embedding store (Redis, keyed by content hash + model version)
+    EMBEDDING_CHUNK_STORE_ENABLED: bool = True
+    EMBEDDING_CHUNK_STORE_TTL_S: int = 2592000
+
+    # Heavy models (embedding, tokenizer, Docling) load lazily; warm them in the background at startup
+    MODEL_WARMUP_ENABLED: bool = True
 
     # Device
     DEVICE: str = "cpu"
@@ -266,6 +389,13 @@ class Settings(BaseSettings):
         return self
     KAFKA_DOCUMENT_TOPIC: str = "document_processing"
     KAFKA_CONSUMER_GROUP: str = "document_processors"
+
+    # Asynchronous ingestion (upload stores object + DB row, ingestion worker parses/embeds/indexes)
+    DOCUMENT_INGESTION_ASYNC: bool = True
+    KAFKA_INGESTION_TOPIC: str = "document_processing"  # jobs share the progress topic by default (type-tagged)
+    INGESTION_WORKER_ENABLED: bool = True  # start.sh runs the worker next to the API; disable for a dedicated worker
+    INGESTION_WORKER_CONCURRENCY: int = 2  # documents processed concurrently per worker
+    INGESTION_JOB_STALE_S: int = 1800  # pending/processing documents older than this are re-enqueued
     
     # Configuration Objects
     llm_providers: Dict[str, LLMProviderConfig] = Field(default_factory=dict)
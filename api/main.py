@@ -50,6 +50,38 @@ async def _sync_registries() -> None:
         logger.error(f"Failed to sync registries: {e}")
 
 
+def _start_model_warmup() -> None:
+    """Register heavy models and start loading them in the background."""
+    try:
+        from services.embedding.embedding_service import embedding_service  # noqa: F401
+        from utils.file_processor import get_tokenizer_handle
+        from utils.lazy_model import model_registry
+
+        get_tokenizer_handle(settings.embedding.model_name)
+        model_registry.start_warmup()
+        logger.info(f"Model warm-up started: {', '.join(model_registry.status())}")
+    except Exception as e:
+        logger.error(f"Failed to start model warm-up: {e}")
+
+
+def _start_milvus_background_services() -> None:
+    """Start the collection residency sweep, the compaction scheduler and the stats collector."""
+    try:
+        from services.vector.milvus_service import milvus_service
+
+        if milvus_service.residency:
+            milvus_service.residency.start(settings.MILVUS_RESIDENCY_SWEEP_INTERVAL_S)
+            logger.info("Milvus collection residency manager started")
+        if milvus_service.compaction_scheduler:
+            milvus_service.compaction_scheduler.start(settings.MILVUS_COMPACTION_CHECK_INTERVAL_S)
+            logger.info("Milvus compaction scheduler started")
+        if milvus_service.stats_collector:
+            milvus_service.stats_collector.start()
+            logger.info("Milvus collection stats collector started")
+    except Exception as e:
+        logger.error(f"Failed to start Milvus background services: {e}")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager with minimal, robust initialization."""
@@ -61,6 +93,11 @@ async def lifespan(app: FastAPI):
 
         await _sync_registries()
 
+        if settings.MODEL_WARMUP_ENABLED:
+            _start_model_warmup()
+
+        _start_milvus_background_services()
+
         yield
 
     except Exception as e:
@@ -71,6 +108,17 @@ async def lifespan(app: FastAPI):
 
     try:
         from config.database import close_db
+        from services.vector.milvus_service import milvus_service
+        from utils.lazy_model import model_registry
+
+        await model_registry.stop_warmup()
+
+        if milvus_service.residency:
+            await milvus_service.residency.stop()
+        if milvus_service.compaction_scheduler:
+            await milvus_service.compaction_scheduler.stop()
+        if milvus_service.stats_collector:
+            await milvus_service.stats_collector.stop()
 
         await close_db()
         logger.info("Application shutdown complete")
@@ -300,4 +300,53 @@ class Document(BaseModel):
         return True
     
     def __repr__(self) -> str:
-        return f"<Document(title='{self.title}', access='{self.access_level}')>"
\ No newline at end of file
+        return f"<Document(title='{self.title}', access='{self.access_level}')>"
+
+class DocumentChunk(BaseModel):
+    """
+    Chunk bodies of indexed documents
+    Milvus keeps vectors and filterable fields only; text and metadata are fetched
+    from here by chunk id for the final search results.
+    """
+    
+    __tablename__ = "document_chunks"
+    
+    document_id = Column(
+        String(255),
+        nullable=False,
+        index=True,
+        comment="Document ID (same value as the Milvus document_id field)"
+    )
+    
+    collection_name = Column(
+        String(100),
+        nullable=False,
+        index=True,
+        comment="Logical Milvus collection name"
+    )
+    
+    chunk_index = Column(
+        Integer,
+        nullable=False,
+        default=0,
+        comment="Position of the chunk within the document"
+    )
+    
+    content = Column(
+        Text,
+        nullable=False,
+        comment="Chunk text"
+    )
+    
+    chunk_metadata = Column(
+        JSONB,
+        nullable=True,
+        comment="Chunk metadata (page, headings, source, ...)"
+    )
+    
+    __table_args__ = (
+        Index('idx_chunk_document_index', 'document_id', 'chunk_index'),
+    )
+    
+    def __repr__(self) -> str:
+        return f"<DocumentChunk(document_id='{self.document_id}', index={self.chunk_index})>"
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import List, Optional
 
 class DocumentRequest(BaseModel):
     """Request model for document"""
@@ -8,3 +8,14 @@ class DocumentRequest(BaseModel):
 class MutipleDocumentRequest(BaseModel):
     """Request model for multiple document"""
     pass
+
+class BatchRetrievalRequest(BaseModel):
+    """Batch retrieval request (evaluation and multi-query workloads)"""
+    queries: List[str] = Field(..., min_length=1, description="Queries to retrieve chunks for")
+    department_name: str = Field(..., description="Department whose knowledge base is searched")
+    access_scope: str = Field("both", description="Access scope: 'public', 'private', or 'both'")
+    top_k: int = Field(10, ge=1, le=100, description="Results per collection and query")
+    final_top_k: int = Field(15, ge=1, le=100, description="Fused results per query")
+    score_threshold: float = Field(0.0, description="Minimum score per collection result")
+    enable_hybrid_search: bool = Field(True, description="Vector + BM25 search when available")
+    use_mmr: Optional[bool] = Field(None, description="Override MMR diversification (default from settings)")
@@ -224,6 +224,30 @@ class ReadinessResponse(BaseModel):
             }
         }
 
+class ModelLoadStatus(BaseModel):
+    """Load status of one lazily loaded model"""
+    state: str
+    load_seconds: Optional[float] = None
+    error: Optional[str] = None
+
+class ModelReadinessResponse(BaseModel):
+    """Model warm-up readiness response"""
+    status: HealthStatus
+    models: Dict[str, ModelLoadStatus]
+    timestamp: float
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "status": "ready",
+                "models": {
+                    "embedding": {"state": "ready", "load_seconds": 18.4, "error": None},
+                    "docling_converter": {"state": "loading", "load_seconds": None, "error": None}
+                },
+                "timestamp": 1699123456.789
+            }
+        }
+
 class LivenessResponse(BaseModel):
     """Kubernetes liveness probe response"""
     status: HealthStatus
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Create the configured filter indexes (MILVUS_SCALAR_INDEXES, MILVUS_JSON_PATH_INDEXES) on existing
+Milvus collections. Collections created before the indexes were declared otherwise get them only
+when an API worker first touches them.
+
+Usage:
+    python scripts/backfill_filter_indexes.py [--instance public|private|both] [--dry-run]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import List
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from common.types import DBDocumentPermissionLevel
+from services.vector.filter_indexes import configured_filter_indexes, create_filter_indexes
+from services.vector.milvus_service import milvus_service
+
+
+def backfill_instance(milvus_instance: str, dry_run: bool) -> List[str]:
+    client = milvus_service._get_client(milvus_instance)
+    indexes = configured_filter_indexes()
+    collections = client.list_collections()
+    print(f"🚀 {milvus_instance}: {len(collections)} collections, {len(indexes)} filter indexes declared")
+
+    failed = []
+    for collection_name in collections:
+        try:
+            existing = set(client.list_indexes(collection_name) or [])
+            missing = [index for index in indexes if index.index_name not in existing]
+            if not missing:
+                print(f"✅ {collection_name}: up to date")
+                continue
+            if dry_run:
+                print(f"  {collection_name}: would create {', '.join(index.index_name for index in missing)}")
+                continue
+
+            created = create_filter_indexes(client, collection_name, missing)
+            if len(created) != len(missing):
+                print(f"❌ {collection_name}: created {len(created)}/{len(missing)} indexes")
+                failed.append(collection_name)
+                continue
+            print(f"✅ {collection_name}: created {', '.join(created)}")
+
+        except Exception as e:
+            print(f"❌ {collection_name}: {e}")
+            failed.append(collection_name)
+
+    return failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Create declared filter indexes on existing Milvus collections")
+    parser.add_argument("--instance", choices=["public", "private", "both"], default="both")
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+
+    instances = []
+    if args.instance in ("public", "both"):
+        instances.append(DBDocumentPermissionLevel.PUBLIC.value)
+    if args.instance in ("private", "both"):
+        instances.append(DBDocumentPermissionLevel.PRIVATE.value)
+
+    failed = []
+    for milvus_instance in instances:
+        failed.extend(backfill_instance(milvus_instance, args.dry_run))
+
+    if failed:
+        print(f"\n❌ {len(failed)} collections failed: {', '.join(failed)}")
+        sys.exit(1)
+    print("\n✅ Filter indexes backfilled" + (" (dry run)" if args.dry_run else ""))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Benchmark document-chunk encoding: fixed-count batches in upload order vs. length-bucketed batches
+
+Chunks real uploaded files with FileProcessor (same settings as DocumentService) and reports
+tokens/sec and padding overhead for both strategies.
+
+Usage:
+    python scripts/benchmark_document_encoding.py path/to/manual.pdf [more.pdf ...] [--backend torch]
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from config.settings import get_settings
+from services.embedding.embedding_backends import EmbeddingBackend, create_embedding_backend
+from utils.file_processor import FileProcessor
+
+settings = get_settings()
+
+
+async def load_chunks(paths: List[str]) -> List[str]:
+    """Chunk files the same way the upload pipeline does"""
+    processor = FileProcessor(
+        tokenizer_name=settings.embedding.model_name,
+        max_tokens=getattr(settings.embedding, 'max_length', 1500),
+        enable_hybrid_chunking=True,
+    )
+    texts = []
+    for path in paths:
+        chunks = await processor.process_file(file_path=path, file_name=Path(path).name, doc_id="benchmark")
+        texts.extend(chunk.page_content for chunk in chunks)
+    return texts
+
+
+def padded_tokens(lengths: List[int], batches: List[List[int]]) -> int:
+    return sum(max(lengths[i] for i in batch) * len(batch) for batch in batches)
+
+
+def run_fixed(backend: EmbeddingBackend, texts: List[str], batch_size: int) -> float:
+    start = time.perf_counter()
+    for i in range(0, len(texts), batch_size):
+        backend.encode(texts[i:i + batch_size], batch_size=batch_size)
+    return time.perf_counter() - start
+
+
+def run_bucketed(backend: EmbeddingBackend, texts: List[str]) -> float:
+    start = time.perf_counter()
+    backend.encode_bucketed(
+        texts,
+        max_batch_tokens=settings.EMBEDDING_MAX_BATCH_TOKENS,
+        max_batch_size=settings.EMBEDDING_MAX_DOCUMENT_BATCH_SIZE
+    )
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark length-bucketed document encoding")
+    parser.add_argument("files", nargs="+", help="Documents to chunk and encode (PDF, DOCX, ...)")
+    parser.add_argument("--backend", default=settings.EMBEDDING_BACKEND)
+    parser.add_argument("--batch-size", type=int, default=settings.EMBEDDING_BATCH_SIZE)
+    args = parser.parse_args()
+
+    texts = asyncio.run(load_chunks(args.files))
+    if not texts:
+        print("❌ No chunks extracted")
+        return
+
+    backend = create_embedding_backend(args.backend)
+    lengths = backend.count_tokens(texts)
+    total_tokens = sum(lengths)
+
+    fixed_batches = [list(range(i, min(i + args.batch_size, len(texts)))) for i in range(0, len(texts), args.batch_size)]
+    bucketed_batches = backend.plan_token_batches(
+        lengths, settings.EMBEDDING_MAX_BATCH_TOKENS, settings.EMBEDDING_MAX_DOCUMENT_BATCH_SIZE
+    )
+
+    backend.encode(texts[:2], batch_size=2)
+    results: Dict[str, Dict[str, float]] = {
+        "fixed": {"seconds": run_fixed(backend, texts, args.batch_size), "padded": padded_tokens(lengths, fixed_batches), "batches": len(fixed_batches)},
+        "bucketed": {"seconds": run_bucketed(backend, texts), "padded": padded_tokens(lengths, bucketed_batches), "batches": len(bucketed_batches)},
+    }
+
+    print(f"🚀 {len(texts)} chunks, {total_tokens} tokens, backend {backend.name}\n")
+    print(f"{'strategy':<10} {'batches':>8} {'seconds':>10} {'tokens/s':>10} {'padding %':>10}")
+    for name, stats in results.items():
+        padding = 100 * (stats["padded"] - total_tokens) / max(1, stats["padded"])
+        print(
+            f"{name:<10} {stats['batches']:>8} {stats['seconds']:>10.2f} "
+            f"{total_tokens / stats['seconds']:>10.1f} {padding:>10.1f}"
+        )
+
+    print(f"\n✅ Speedup: {results['fixed']['seconds'] / results['bucketed']['seconds']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Benchmark embedding backends (torch vs. onnx_int8) on a fixed multilingual corpus
+
+Reports throughput, single-query p50/p99 latency and cosine parity against torch.
+
+Usage:
+    python scripts/benchmark_embedding.py [--backends torch onnx_int8] [--runs 50] [--batch-size 12]
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import numpy as np
+
+from services.embedding.embedding_backends import (
+    BACKEND_ONNX_INT8,
+    BACKEND_TORCH,
+    EmbeddingBackend,
+    create_embedding_backend,
+)
+
+CORPUS: List[str] = [
+    # Vietnamese
+    "Chính sách nghỉ phép năm của công ty áp dụng cho nhân viên chính thức.",
+    "Nhân viên cần nộp đơn xin nghỉ phép trước ít nhất ba ngày làm việc.",
+    "Quy trình hoàn ứng chi phí công tác được thực hiện qua hệ thống tài chính nội bộ.",
+    "Mật khẩu tài khoản phải được thay đổi định kỳ chín mươi ngày một lần.",
+    "Bảo hiểm sức khỏe bao gồm khám chữa bệnh nội trú và ngoại trú cho người lao động.",
+    # English
+    "How many days of annual leave does a full-time employee receive?",
+    "Expense reports must be submitted within thirty days of the business trip.",
+    "The VPN client is required when accessing internal systems from outside the office.",
+    "Quarterly budget reviews are held during the first week after the quarter closes.",
+    "Employees may work remotely up to two days per week with manager approval.",
+    # Japanese
+    "年次有給休暇の申請は少なくとも三営業日前までに提出してください。",
+    "出張費の精算は社内の財務システムを通じて行います。",
+    "社外から社内システムにアクセスする場合はVPNの利用が必要です。",
+    "健康保険は入院および外来の診療をカバーします。",
+    "パスワードは九十日ごとに変更する必要があります。",
+    # Korean
+    "연차 휴가 신청은 최소 3영업일 전에 제출해야 합니다.",
+    "출장비 정산은 사내 재무 시스템을 통해 진행됩니다.",
+    "외부에서 사내 시스템에 접속할 때는 VPN을 사용해야 합니다.",
+    "건강보험은 입원 및 외래 진료를 보장합니다.",
+    "분기별 예산 검토는 분기 마감 후 첫 주에 진행됩니다.",
+    # Longer passages
+    (
+        "Employees who have completed their probation period are entitled to twelve days of paid "
+        "annual leave per year. Unused leave may be carried over to the following year up to a "
+        "maximum of five days, after which the remaining balance expires on March 31st."
+    ),
+    (
+        "Người lao động đã hoàn thành thời gian thử việc được hưởng mười hai ngày nghỉ phép có "
+        "lương mỗi năm. Số ngày phép chưa sử dụng có thể được chuyển sang năm sau tối đa năm ngày."
+    ),
+]
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * (len(ordered) - 1)))))
+    return ordered[index]
+
+
+def benchmark_backend(backend: EmbeddingBackend, runs: int, batch_size: int) -> Dict[str, float]:
+    """Measure batch throughput and single-query latency"""
+    backend.encode(CORPUS[:2], batch_size=batch_size)
+
+    start = time.perf_counter()
+    for _ in range(runs):
+        backend.encode(CORPUS, batch_size=batch_size)
+    elapsed = time.perf_counter() - start
+    throughput = runs * len(CORPUS) / elapsed
+
+    latencies = []
+    for i in range(runs):
+        text = CORPUS[i % len(CORPUS)]
+        t0 = time.perf_counter()
+        backend.encode([text], batch_size=1)
+        latencies.append((time.perf_counter() - t0) * 1000)
+
+    return {
+        "throughput": throughput,
+        "p50_ms": statistics.median(latencies),
+        "p99_ms": _percentile(latencies, 99),
+    }
+
+
+def cosine_parity(reference: np.ndarray, candidate: np.ndarray) -> Dict[str, float]:
+    """Row-wise cosine similarity between two embedding matrices of normalized vectors"""
+    cosines = np.sum(reference * candidate, axis=1)
+    return {"mean": float(cosines.mean()), "min": float(cosines.min())}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark embedding backends")
+    parser.add_argument("--backends", nargs="+", default=[BACKEND_TORCH, BACKEND_ONNX_INT8])
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--batch-size", type=int, default=12)
+    args = parser.parse_args()
+
+    print(f"🚀 Embedding benchmark - {len(CORPUS)} texts, {args.runs} runs, batch size {args.batch_size}\n")
+
+    results = {}
+    embeddings = {}
+    for name in args.backends:
+        backend = create_embedding_backend(name)
+        if backend.name != name:
+            print(f"❌ Backend {name} unavailable (fell back to {backend.name}), skipping")
+            continue
+        results[name] = benchmark_backend(backend, args.runs, args.batch_size)
+        embeddings[name] = backend.encode(CORPUS, batch_size=args.batch_size)
+
+    print(f"{'backend':<12} {'texts/s':>10} {'p50 ms':>10} {'p99 ms':>10} {'cos mean':>10} {'cos min':>10}")
+    reference = embeddings.get(BACKEND_TORCH)
+    for name, stats in results.items():
+        parity = cosine_parity(reference, embeddings[name]) if reference is not None else None
+        cos_mean = f"{parity['mean']:.4f}" if parity else "n/a"
+        cos_min = f"{parity['min']:.4f}" if parity else "n/a"
+        print(
+            f"{name:<12} {stats['throughput']:>10.1f} {stats['p50_ms']:>10.2f} "
+            f"{stats['p99_ms']:>10.2f} {cos_mean:>10} {cos_min:>10}"
+        )
+
+    if BACKEND_TORCH in results and BACKEND_ONNX_INT8 in results:
+        speedup = results[BACKEND_ONNX_INT8]["throughput"] / results[BACKEND_TORCH]["throughput"]
+        print(f"\n✅ onnx_int8 throughput speedup vs torch: {speedup:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
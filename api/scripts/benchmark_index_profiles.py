@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Benchmark Milvus index profiles (flat, hnsw, ivf_sq8, ivf_rabitq)
+
+Loads the same vectors into one scratch collection per profile and reports build time,
+recall@k against exact (NumPy brute-force) search, single-query p50/p99 latency and
+estimated index memory.
+
+Vectors come from an existing collection (--source-collection) or are synthetic
+clustered unit vectors.
+
+Usage:
+    python scripts/benchmark_index_profiles.py [--rows 100000] [--queries 200] [--top-k 10]
+    python scripts/benchmark_index_profiles.py --source-collection <tenant>-<dept>-public --instance milvus_public
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import numpy as np
+from pymilvus import DataType, MilvusClient
+
+from common.types import DBDocumentPermissionLevel
+from config.settings import get_settings
+from services.vector.index_profiles import (
+    build_index_params,
+    build_search_params,
+    estimate_index_memory_bytes,
+    get_index_profile,
+    list_index_profiles,
+)
+from services.vector.milvus_service import milvus_service
+
+settings = get_settings()
+
+SCRATCH_PREFIX = "bench_index_"
+
+
+def synthetic_vectors(rows: int, dim: int, clusters: int = 256, seed: int = 42) -> np.ndarray:
+    """Clustered unit vectors (closer to real embeddings than uniform noise)"""
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(clusters, dim)).astype(np.float32)
+    assignments = rng.integers(0, clusters, size=rows)
+    vectors = centers[assignments] + 0.35 * rng.normal(size=(rows, dim)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def load_source_vectors(client: MilvusClient, collection_name: str, rows: int) -> np.ndarray:
+    iterator = client.query_iterator(collection_name=collection_name, batch_size=1000, filter="", output_fields=["vector"])
+    vectors: List[List[float]] = []
+    try:
+        while len(vectors) < rows:
+            batch = iterator.next()
+            if not batch:
+                break
+            vectors.extend(row["vector"] for row in batch)
+    finally:
+        iterator.close()
+    return np.asarray(vectors[:rows], dtype=np.float32)
+
+
+def exact_top_k(data: np.ndarray, queries: np.ndarray, top_k: int) -> np.ndarray:
+    scores = queries @ data.T
+    top = np.argpartition(-scores, top_k, axis=1)[:, :top_k]
+    return top
+
+
+def create_scratch_collection(client: MilvusClient, name: str, dim: int) -> None:
+    if client.has_collection(name):
+        client.drop_collection(name)
+    schema = MilvusClient.create_schema(auto_id=False, enable_dynamic_field=False)
+    schema.add_field("id", DataType.INT64, is_primary=True)
+    schema.add_field("vector", DataType.FLOAT_VECTOR, dim=dim)
+    client.create_collection(collection_name=name, schema=schema)
+
+
+def benchmark_profile(
+    client: MilvusClient,
+    profile_name: str,
+    data: np.ndarray,
+    queries: np.ndarray,
+    truth: np.ndarray,
+    top_k: int,
+    keep: bool
+) -> Dict[str, float]:
+    profile = get_index_profile(profile_name)
+    name = f"{SCRATCH_PREFIX}{profile_name}"
+    rows, dim = data.shape
+
+    create_scratch_collection(client, name, dim)
+    for start in range(0, rows, 5000):
+        batch = data[start:start + 5000]
+        client.insert(name, [{"id": start + i, "vector": vector} for i, vector in enumerate(batch)])
+    client.flush(name)
+
+    index = build_index_params(profile, rows)
+    index_params = client.prepare_index_params()
+    index_params.add_index(
+        field_name=index["field_name"],
+        index_type=index["index_type"],
+        metric_type=index["metric_type"],
+        params=index["params"]
+    )
+    build_start = time.perf_counter()
+    client.create_index(name, index_params)
+    client.load_collection(name)
+    build_seconds = time.perf_counter() - build_start
+
+    search_params = build_search_params(profile, top_k)
+    latencies = []
+    hits = 0
+    for i, query in enumerate(queries):
+        t0 = time.perf_counter()
+        result = client.search(name, data=[query.tolist()], limit=top_k, search_params=search_params)
+        latencies.append((time.perf_counter() - t0) * 1000)
+        found = {hit["id"] for hit in result[0]}
+        hits += len(found.intersection(truth[i].tolist()))
+
+    if not keep:
+        client.drop_collection(name)
+
+    ordered = sorted(latencies)
+    return {
+        "build_s": build_seconds,
+        "recall": hits / (len(queries) * top_k),
+        "p50_ms": statistics.median(latencies),
+        "p99_ms": ordered[min(len(ordered) - 1, int(round(0.99 * (len(ordered) - 1))))],
+        "memory_mb": estimate_index_memory_bytes(profile, rows, dim) / (1024 * 1024),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Milvus index profiles")
+    parser.add_argument("--profiles", nargs="+", default=list_index_profiles(), choices=list_index_profiles())
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument("--instance", default=DBDocumentPermissionLevel.PUBLIC.value,
+                        choices=[DBDocumentPermissionLevel.PUBLIC.value, DBDocumentPermissionLevel.PRIVATE.value])
+    parser.add_argument("--source-collection", help="Sample vectors from this physical collection instead of synthetic data")
+    parser.add_argument("--keep", action="store_true", help="Keep scratch collections after the run")
+    args = parser.parse_args()
+
+    client = milvus_service._get_client(args.instance)
+
+    if args.source_collection:
+        vectors = load_source_vectors(client, args.source_collection, args.rows + args.queries)
+    else:
+        vectors = synthetic_vectors(args.rows + args.queries, settings.EMBEDDING_DIMENSIONS)
+
+    data, queries = vectors[:-args.queries], vectors[-args.queries:]
+    truth = exact_top_k(data, queries, args.top_k)
+
+    print(f"🚀 Index profile benchmark - {len(data)} vectors x {data.shape[1]} dims, {len(queries)} queries, k={args.top_k}\n")
+    print(f"{'profile':<12} {'build s':>9} {'recall@k':>9} {'p50 ms':>8} {'p99 ms':>8} {'mem MB':>9}")
+
+    for profile_name in args.profiles:
+        try:
+            stats = benchmark_profile(client, profile_name, data, queries, truth, args.top_k, args.keep)
+        except Exception as e:
+            print(f"❌ {profile_name}: {e}")
+            continue
+        print(
+            f"{profile_name:<12} {stats['build_s']:>9.1f} {stats['recall']:>9.4f} "
+            f"{stats['p50_ms']:>8.2f} {stats['p99_ms']:>8.2f} {stats['memory_mb']:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
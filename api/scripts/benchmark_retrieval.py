@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Benchmark retrieval quality vs. latency over a labeled query set
+
+Runs a grid over search mode (hybrid / vector), top_k, HNSW ef, RRF k and score threshold
+against one logical collection (Milvus, or a local vector store directory as a stand-in) and
+reports recall@k, MRR, p50/p99 single-query latency and bytes returned per query. Thresholds
+are applied to the same search results, so they share latency figures.
+
+Labeled set: JSON lines with the query and its relevant document ids (or chunk ids with --match chunk_id)
+    {"query": "How many vacation days do I get?", "relevant": ["<document_id>", ...]}
+
+Usage:
+    python scripts/benchmark_retrieval.py --collection <tenant>-<dept>-public --labels eval.jsonl \
+        [--modes hybrid vector] [--top-k 5 10 20] [--ef 64 128 256] [--rrf-k 20 60] [--thresholds 0 0.5 0.7]
+    python scripts/benchmark_retrieval.py --collection <name> --labels eval.jsonl --local-dir data/vector_store
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import numpy as np
+from pymilvus import AnnSearchRequest, RRFRanker
+
+from common.types import DBDocumentPermissionLevel
+from config.settings import get_settings
+from services.embedding.embedding_service import embedding_service
+from services.vector.collection_layout import resolve_collection
+from services.vector.index_profiles import build_search_params, profile_for_index_type
+from services.vector.local_store import LocalVectorStore
+from services.vector.milvus_service import milvus_service
+
+settings = get_settings()
+
+MODE_HYBRID = "hybrid"
+MODE_VECTOR = "vector"
+
+
+def load_labeled_set(path: str) -> List[Dict[str, Any]]:
+    labeled = []
+    with open(path) as f:
+        for line in f:
+            if line.strip():
+                item = json.loads(line)
+                labeled.append({"query": item["query"], "relevant": set(item.get("relevant") or [])})
+    return labeled
+
+
+def percentile(values: List[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+
+class MilvusBackend:
+    """Single-query searches against one logical collection, as MilvusService issues them"""
+
+    def __init__(self, collection_name: str, milvus_instance: str, output_fields: List[str]):
+        self.client = milvus_service._get_client(milvus_instance)
+        self.target = resolve_collection(collection_name)
+        self.filter = self.target.scope_filter()
+        self.output_fields = output_fields
+        index = self.client.describe_index(self.target.physical_name, "vector") or {}
+        self.profile = profile_for_index_type(index.get("index_type"))
+        self.client.load_collection(self.target.physical_name)
+
+    def search(self, mode: str, query: str, vector: np.ndarray, limit: int, ef: Optional[int], rrf_k: int) -> List[Dict[str, Any]]:
+        if mode == MODE_VECTOR:
+            return self.client.search(
+                collection_name=self.target.physical_name,
+                data=[vector.tolist()],
+                limit=limit,
+                search_params=build_search_params(self.profile, limit, ef),
+                output_fields=self.output_fields,
+                filter=self.filter
+            )[0]
+        return self.client.hybrid_search(
+            collection_name=self.target.physical_name,
+            reqs=[
+                AnnSearchRequest(
+                    data=[vector.tolist()],
+                    anns_field="vector",
+                    search_params=build_search_params(self.profile, limit * 2, ef),
+                    limit=limit * 2,
+                    expr=self.filter
+                ),
+                AnnSearchRequest(
+                    data=[query],
+                    anns_field="sparse_vector",
+                    search_params={"metric_type": "BM25", "params": {}},
+                    limit=limit * 2,
+                    expr=self.filter
+                )
+            ],
+            ranker=RRFRanker(k=rrf_k),
+            limit=limit,
+            output_fields=self.output_fields
+        )[0]
+
+
+class LocalBackend:
+    """Exact search in a local vector store directory (vector mode only; ef and RRF k do not apply)"""
+
+    def __init__(self, collection_name: str, base_dir: str, output_fields: List[str]):
+        self.store = LocalVectorStore(base_dir, settings.EMBEDDING_DIMENSIONS)
+        self.collection_name = collection_name
+        self.output_fields = output_fields
+
+    def search(self, mode: str, query: str, vector: np.ndarray, limit: int, ef: Optional[int], rrf_k: int) -> List[Dict[str, Any]]:
+        return self.store._search_sync(self.collection_name, vector, limit, None, self.output_fields)[0]
+
+
+def _hit_entity(hit: Any) -> Dict[str, Any]:
+    entity = hit.get("entity", hit) if isinstance(hit, dict) else hit.entity
+    return dict(entity)
+
+
+def _hit_score(hit: Any) -> float:
+    return float(hit.get("distance", 0.0)) if isinstance(hit, dict) else float(hit.distance)
+
+
+def run_searches(backend, mode: str, labeled, vectors: np.ndarray, limit: int, ef: Optional[int], rrf_k: int) -> Tuple[List[List[Any]], List[float]]:
+    backend.search(mode, labeled[0]["query"], vectors[0], limit, ef, rrf_k)  # warm-up
+    hits, latencies = [], []
+    for item, vector in zip(labeled, vectors):
+        t0 = time.perf_counter()
+        hits.append(list(backend.search(mode, item["query"], vector, limit, ef, rrf_k)))
+        latencies.append((time.perf_counter() - t0) * 1000)
+    return hits, latencies
+
+
+def evaluate(hits: List[List[Any]], labeled, threshold: float, top_k: int, match_field: str) -> Dict[str, float]:
+    """recall@k and MRR over results kept by the score threshold, plus bytes of those results"""
+    recalls, reciprocal_ranks, sizes = [], [], []
+    for query_hits, item in zip(hits, labeled):
+        kept = [hit for hit in query_hits if _hit_score(hit) >= threshold][:top_k]
+        entities = [_hit_entity(hit) for hit in kept]
+        sizes.append(len(json.dumps(entities, ensure_ascii=False, default=str).encode("utf-8")))
+
+        retrieved = [entity.get(match_field) for entity in entities]
+        relevant = item["relevant"]
+        if relevant:
+            recalls.append(len(relevant.intersection(retrieved)) / len(relevant))
+        rank = next((i + 1 for i, value in enumerate(retrieved) if value in relevant), None)
+        reciprocal_ranks.append(1.0 / rank if rank else 0.0)
+
+    return {
+        "recall": statistics.mean(recalls) if recalls else 0.0,
+        "mrr": statistics.mean(reciprocal_ranks),
+        "bytes": statistics.mean(sizes),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark retrieval quality vs. latency over a labeled query set")
+    parser.add_argument("--collection", required=True, help="Logical collection name (<tenant>-<dept>-public/private)")
+    parser.add_argument("--labels", required=True, help="JSON lines with query and relevant ids")
+    parser.add_argument("--instance", choices=["public", "private"], help="Milvus instance (default: from collection name)")
+    parser.add_argument("--local-dir", help="Search a local vector store directory instead of Milvus")
+    parser.add_argument("--modes", nargs="+", default=[MODE_HYBRID, MODE_VECTOR], choices=[MODE_HYBRID, MODE_VECTOR])
+    parser.add_argument("--top-k", nargs="+", type=int, default=[5, 10, 20])
+    parser.add_argument("--ef", nargs="+", type=int, default=[0], help="HNSW ef values (0 = index profile default)")
+    parser.add_argument("--rrf-k", nargs="+", type=int, default=[settings.MILVUS_HYBRID_RRF_K])
+    parser.add_argument("--thresholds", nargs="+", type=float, default=[0.0, settings.RAG_SCORE_THRESHOLD])
+    parser.add_argument("--match", choices=["document_id", "chunk_id"], default="document_id")
+    parser.add_argument("--include-text", action="store_true", help="Return chunk text from Milvus (counts toward bytes)")
+    parser.add_argument("--output", help="Write all grid results as JSON to this file")
+    args = parser.parse_args()
+
+    labeled = load_labeled_set(args.labels)
+    if not labeled:
+        print(f"❌ No labeled queries in {args.labels}")
+        sys.exit(1)
+
+    output_fields = milvus_service._search_output_fields(False)
+    if args.include_text and "text" not in output_fields:
+        output_fields.append("text")
+    if args.match not in output_fields:
+        output_fields.append(args.match)
+
+    if args.local_dir:
+        backend = LocalBackend(args.collection, args.local_dir, output_fields)
+        modes, efs, rrf_ks = [MODE_VECTOR], [0], [0]
+    else:
+        if args.instance:
+            milvus_instance = (DBDocumentPermissionLevel.PRIVATE.value if args.instance == "private"
+                               else DBDocumentPermissionLevel.PUBLIC.value)
+        else:
+            milvus_instance = milvus_service.resolve_milvus_instance(args.collection)
+        backend = MilvusBackend(args.collection, milvus_instance, output_fields)
+        modes, efs, rrf_ks = args.modes, args.ef, args.rrf_k
+
+    embeddings = asyncio.run(embedding_service.encode_queries([item["query"] for item in labeled]))
+    vectors = np.asarray(embeddings["dense_vectors"], dtype=np.float32)
+
+    print(f"🚀 Retrieval benchmark - {args.collection}, {len(labeled)} labeled queries, match on {args.match}\n")
+    print(f"{'mode':<7} {'top_k':>5} {'ef':>5} {'rrf_k':>5} {'thresh':>6} {'recall@k':>9} {'MRR':>7} {'p50 ms':>8} {'p99 ms':>8} {'bytes':>9}")
+
+    rows = []
+    for mode, top_k, ef in itertools.product(modes, args.top_k, efs):
+        for rrf_k in (rrf_ks if mode == MODE_HYBRID else [0]):
+            try:
+                hits, latencies = run_searches(backend, mode, labeled, vectors, top_k, ef or None, rrf_k)
+            except Exception as e:
+                print(f"❌ {mode} top_k={top_k} ef={ef} rrf_k={rrf_k}: {e}")
+                continue
+
+            p50, p99 = statistics.median(latencies), percentile(latencies, 0.99)
+            for threshold in args.thresholds:
+                stats = evaluate(hits, labeled, threshold, top_k, args.match)
+                rows.append({"mode": mode, "top_k": top_k, "ef": ef, "rrf_k": rrf_k, "threshold": threshold,
+                             "p50_ms": p50, "p99_ms": p99, **stats})
+                print(
+                    f"{mode:<7} {top_k:>5} {ef or '-':>5} {rrf_k or '-':>5} {threshold:>6.2f} {stats['recall']:>9.4f} "
+                    f"{stats['mrr']:>7.4f} {p50:>8.2f} {p99:>8.2f} {stats['bytes']:>9.0f}"
+                )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(rows, f, indent=2)
+        print(f"\n✅ Wrote {len(rows)} results to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Backfill a department collection from a directory of documents through Milvus bulk import
+
+Every file becomes a Document (stored in the tenant bucket, chunked into the chunk store); vectors
+are staged as Parquet in MinIO and imported by Milvus at the end instead of row-by-row inserts.
+Progress is published to Kafka as batch progress (batch id = --batch-id or a new UUID).
+
+Usage:
+    python scripts/bulk_backfill.py --tenant <tenant_id> --department <department_id> --user <user_id> \
+        --dir /data/onboarding [--access public|private] [--recursive] [--batch-id <uuid>]
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from common.types import DBDocumentPermissionLevel
+from config.database import get_db_context
+from services.documents.document_service import DocumentService
+
+
+def collect_files(directory: Path, recursive: bool):
+    pattern = "**/*" if recursive else "*"
+    return sorted(str(path) for path in directory.glob(pattern) if path.is_file() and not path.name.startswith("."))
+
+
+async def run(args) -> int:
+    directory = Path(args.dir)
+    if not directory.is_dir():
+        print(f"❌ Not a directory: {directory}")
+        return 1
+
+    file_paths = collect_files(directory, args.recursive)
+    if not file_paths:
+        print(f"⚠️  No files found in {directory}")
+        return 0
+
+    access = DBDocumentPermissionLevel.PRIVATE if args.access == "private" else DBDocumentPermissionLevel.PUBLIC
+    collection_name = args.collection or f"{args.tenant}-{args.department}-{args.access}"
+    print(f"📦 Backfilling {len(file_paths)} files into {collection_name} ({access.value})")
+
+    async with get_db_context() as session:
+        service = DocumentService(session)
+        results = await service.backfill_documents(
+            tenant_id=args.tenant,
+            department_id=args.department,
+            uploaded_by=args.user,
+            file_paths=file_paths,
+            access_level=access,
+            collection_name=collection_name,
+            batch_id=args.batch_id
+        )
+
+    failed = [res for res in results if res.error]
+    chunks = sum(res.chunks for res in results if not res.error)
+    print(f"✅ Imported {len(results) - len(failed)} documents ({chunks} chunks)")
+    for res in failed:
+        print(f"❌ {res.file_name}: {res.error}")
+    return 1 if failed else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk backfill documents via Milvus bulk import")
+    parser.add_argument("--tenant", required=True, help="Tenant ID")
+    parser.add_argument("--department", required=True, help="Department ID")
+    parser.add_argument("--user", required=True, help="User ID recorded as uploader")
+    parser.add_argument("--dir", required=True, help="Directory with the documents")
+    parser.add_argument("--access", choices=["public", "private"], default="public")
+    parser.add_argument("--collection", help="Collection name (default: <tenant>-<department>-<access>)")
+    parser.add_argument("--recursive", action="store_true", help="Include subdirectories")
+    parser.add_argument("--batch-id", help="Batch ID for Kafka progress events")
+    args = parser.parse_args()
+
+    sys.exit(asyncio.run(run(args)))
+
+
+if __name__ == "__main__":
+    main()
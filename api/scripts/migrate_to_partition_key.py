@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Copy per-department collections ({tenant_id}-{department_id}-public/private) into the shared
+partition-key collection of each Milvus instance.
+
+Run before switching MILVUS_COLLECTION_LAYOUT=partition_key. Source collections are left in place
+unless --drop-source is given (and the copied row count matches).
+
+Usage:
+    python scripts/migrate_to_partition_key.py [--instance public|private|both] [--batch-size 1000] [--dry-run]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from pymilvus import MilvusClient
+
+from common.types import DBDocumentPermissionLevel
+from config.settings import get_settings
+from services.vector.collection_layout import LAYOUT_PARTITION_KEY, PARTITION_KEY_FIELD, resolve_collection
+from services.vector.milvus_service import milvus_service
+
+settings = get_settings()
+
+COPY_FIELDS = ["vector", "text", "document_id", "department", "document_source", "metadata", "created_at"]
+
+
+def count_rows(client: MilvusClient, collection_name: str, filter_expr: str = "") -> int:
+    rows = client.query(collection_name=collection_name, filter=filter_expr, output_fields=["count(*)"])
+    return int(rows[0]["count(*)"]) if rows else 0
+
+
+def ensure_shared_collection(client: MilvusClient, shared_name: str, dry_run: bool) -> None:
+    if client.has_collection(shared_name):
+        return
+    print(f"  creating shared collection {shared_name}")
+    if not dry_run and not milvus_service._create_collection(shared_name, client, partitioned=True):
+        raise RuntimeError(f"Failed to create shared collection {shared_name}")
+
+
+def copy_collection(client: MilvusClient, source: str, batch_size: int, dry_run: bool) -> Dict[str, int]:
+    """Stream one source collection into its partition of the shared collection"""
+    target = resolve_collection(source, layout=LAYOUT_PARTITION_KEY)
+    source_rows = count_rows(client, source)
+    existing = 0 if dry_run else count_rows(client, target.physical_name, target.scope_filter())
+
+    if existing:
+        print(f"  {source}: {existing} rows already in {target.physical_name}, replacing")
+        client.delete(collection_name=target.physical_name, filter=target.scope_filter())
+
+    copied = 0
+    if not dry_run:
+        iterator = client.query_iterator(collection_name=source, batch_size=batch_size, filter="", output_fields=COPY_FIELDS)
+        try:
+            while True:
+                batch = iterator.next()
+                if not batch:
+                    break
+                rows = [{field: row.get(field) for field in COPY_FIELDS} for row in batch]
+                for row in rows:
+                    row[PARTITION_KEY_FIELD] = target.partition_value
+                client.insert(collection_name=target.physical_name, data=rows)
+                copied += len(rows)
+                print(f"  {source}: {copied}/{source_rows}", end="\r")
+        finally:
+            iterator.close()
+        client.flush(target.physical_name)
+
+    return {"source_rows": source_rows, "copied": copied}
+
+
+def migrate_instance(milvus_instance: str, batch_size: int, dry_run: bool, drop_source: bool) -> List[str]:
+    client = milvus_service._get_client(milvus_instance)
+    shared_name = settings.MILVUS_SHARED_COLLECTION_NAME
+    sources = [
+        name for name in client.list_collections()
+        if name != shared_name and name.endswith(("-public", "-private"))
+    ]
+    print(f"🚀 {milvus_instance}: {len(sources)} collections -> {shared_name}")
+
+    ensure_shared_collection(client, shared_name, dry_run)
+    failed = []
+
+    for source in sources:
+        try:
+            result = copy_collection(client, source, batch_size, dry_run)
+            if dry_run:
+                print(f"  {source}: {result['source_rows']} rows would be copied")
+                continue
+
+            target = resolve_collection(source, layout=LAYOUT_PARTITION_KEY)
+            migrated = count_rows(client, shared_name, target.scope_filter())
+            if migrated != result["source_rows"]:
+                print(f"❌ {source}: row count mismatch ({migrated} copied vs {result['source_rows']} source)")
+                failed.append(source)
+                continue
+
+            print(f"✅ {source}: {migrated} rows")
+            if drop_source:
+                client.drop_collection(source)
+                print(f"  dropped {source}")
+
+        except Exception as e:
+            print(f"❌ {source}: {e}")
+            failed.append(source)
+
+    return failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Migrate per-department Milvus collections to the partition-key layout")
+    parser.add_argument("--instance", choices=["public", "private", "both"], default="both")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--dry-run", action="store_true")
+    parser.add_argument("--drop-source", action="store_true", help="Drop each source collection after a verified copy")
+    args = parser.parse_args()
+
+    instances = []
+    if args.instance in ("public", "both"):
+        instances.append(DBDocumentPermissionLevel.PUBLIC.value)
+    if args.instance in ("private", "both"):
+        instances.append(DBDocumentPermissionLevel.PRIVATE.value)
+
+    failed = []
+    for milvus_instance in instances:
+        failed.extend(migrate_instance(milvus_instance, args.batch_size, args.dry_run, args.drop_source))
+
+    if failed:
+        print(f"\n❌ {len(failed)} collections failed: {', '.join(failed)}")
+        sys.exit(1)
+    print("\n✅ Migration complete" + (" (dry run)" if args.dry_run else ""))
+
+
+if __name__ == "__main__":
+    main()
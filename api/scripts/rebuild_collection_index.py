@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Rebuild the vector index of one collection into another profile (or the profile its row count
+calls for). The collection is released until the new index is loaded, so run this in a
+maintenance window; automatic rebuilds after inserts are opt-in (MILVUS_INDEX_AUTO_REBUILD).
+
+Usage:
+    python scripts/rebuild_collection_index.py --collection <tenant>-<dept>-public [--profile hnsw|ivf_sq8|ivf_rabitq|flat]
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from common.types import DBDocumentPermissionLevel
+from services.cache.redis_service import redis_client
+from services.vector.collection_layout import resolve_collection
+from services.vector.index_profiles import list_index_profiles
+from services.vector.milvus_service import milvus_service
+
+
+async def rebuild(collection_name: str, milvus_instance: str, profile: str) -> bool:
+    try:
+        # The rebuild lock lives in Redis; without it the rebuild still runs, unguarded
+        await redis_client.initialize()
+    except Exception as e:
+        print(f"⚠️  Redis unavailable, rebuilding without the cluster lock: {e}")
+
+    physical_name = resolve_collection(collection_name).physical_name
+    row_count = await milvus_service.get_collection_row_count(collection_name, milvus_instance)
+    print(f"🚀 Rebuilding {physical_name} in {milvus_instance} ({row_count} rows) -> {profile or 'auto'}")
+    return await milvus_service.rebuild_collection_index(collection_name, milvus_instance, profile=profile)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild a collection's vector index into an index profile")
+    parser.add_argument("--collection", required=True, help="Logical collection name (<tenant>-<dept>-public/private)")
+    parser.add_argument("--instance", choices=["public", "private"], help="Milvus instance (default: from collection name)")
+    parser.add_argument("--profile", choices=list_index_profiles(), help="Index profile (default: selected from row count)")
+    args = parser.parse_args()
+
+    if args.instance:
+        milvus_instance = (DBDocumentPermissionLevel.PRIVATE.value if args.instance == "private"
+                           else DBDocumentPermissionLevel.PUBLIC.value)
+    else:
+        milvus_instance = milvus_service.resolve_milvus_instance(args.collection)
+
+    if not asyncio.run(rebuild(args.collection, milvus_instance, args.profile)):
+        print("❌ Rebuild failed or already running")
+        sys.exit(1)
+    print("✅ Index rebuilt")
+
+
+if __name__ == "__main__":
+    main()
@@ -22,7 +22,9 @@ class RedisService:
 
     def __init__(self):
         self.redis_pool: Optional[redis.ConnectionPool] = None
+        self.binary_pool: Optional[redis.ConnectionPool] = None
         self.redis_client: Optional[redis.Redis] = None
+        self.binary_client: Optional[redis.Redis] = None
         self._initialized = False
         self._connection_retries = 0
         self._max_retries = 3
@@ -35,20 +37,7 @@ class RedisService:
                 self._loop = asyncio.get_running_loop()
             except RuntimeError:
                 self._loop = asyncio.get_event_loop()
-            self.redis_pool = redis.ConnectionPool.from_url(
-                settings.redis_url,
-                max_connections=50,
-                retry_on_timeout=True,
-                retry_on_error=[redis.ConnectionError, redis.TimeoutError],
-                health_check_interval=30,
-                socket_connect_timeout=5,
-                socket_timeout=5
-            )
-            
-            self.redis_client = redis.Redis(
-                connection_pool=self.redis_pool,
-                decode_responses=True
-            )
+            self._build_clients()
             
             await self.redis_client.ping()
             self._initialized = True
@@ -67,10 +56,33 @@ class RedisService:
                 logger.error("Max Redis connection retries reached")
                 raise
 
+    def _build_clients(self) -> None:
+        """
+        Build the text and binary clients, each on its own pool: decode_responses is a
+        connection option, so a client sharing another client's pool inherits its decoding
+        """
+        pool_options = dict(
+            max_connections=50,
+            retry_on_timeout=True,
+            retry_on_error=[redis.ConnectionError, redis.TimeoutError],
+            health_check_interval=30,
+            socket_connect_timeout=5,
+            socket_timeout=5
+        )
+        self.redis_pool = redis.ConnectionPool.from_url(settings.redis_url, decode_responses=True, **pool_options)
+        self.binary_pool = redis.ConnectionPool.from_url(settings.redis_url, decode_responses=False, **pool_options)
+
+        self.redis_client = redis.Redis(connection_pool=self.redis_pool)
+        self.binary_client = redis.Redis(connection_pool=self.binary_pool)
+
     def get_client(self) -> Optional[redis.Redis]:
         """Get Redis client instance"""
         return self.redis_client if self._initialized else None
 
+    def get_binary_client(self) -> Optional[redis.Redis]:
+        """Get Redis client for raw bytes values (e.g. packed vectors)"""
+        return self.binary_client if self._initialized else None
+
     async def _ensure_connection(self):
         """Ensure Redis connection is available"""
         if not self._initialized:
@@ -89,7 +101,9 @@ class RedisService:
             logger.warning("Redis event loop changed; reinitializing client on current loop")
             try:
                 self.redis_client = None
+                self.binary_client = None
                 self.redis_pool = None
+                self.binary_pool = None
                 self._initialized = False
                 await self.initialize()
             except Exception as e:
@@ -363,13 +377,16 @@ class RedisService:
                         await asyncio.shield(self.redis_client.close())
                     except Exception:
                         pass
-                if self.redis_pool:
-                    try:
-                        await asyncio.shield(self.redis_pool.disconnect())
-                    except Exception:
-                        pass
+                for pool in (self.redis_pool, self.binary_pool):
+                    if pool:
+                        try:
+                            await asyncio.shield(pool.disconnect())
+                        except Exception:
+                            pass
             self.redis_client = None
+            self.binary_client = None
             self.redis_pool = None
+            self.binary_pool = None
             self._initialized = False
             self._loop = None
             logger.info("Redis service connections closed")
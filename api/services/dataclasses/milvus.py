@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 @dataclass
 class ChunkingConfig:
@@ -19,3 +19,49 @@ class SearchResult:
     metadata: Dict[str, Any]
     document_id: str
     chunk_index: int
+
+@dataclass(frozen=True)
+class CollectionTarget:
+    """Physical Milvus location of a logical {tenant_id}-{department_id}-public/private collection"""
+    logical_name: str
+    physical_name: str
+    partition_key_field: Optional[str] = None
+    partition_value: Optional[str] = None
+
+    @property
+    def is_partitioned(self) -> bool:
+        return self.partition_value is not None
+
+    def scope_filter(self, filter_expr: Optional[str] = None) -> Optional[str]:
+        """Restrict a filter expression to this logical collection's partition key"""
+        if not self.is_partitioned:
+            return filter_expr
+        scope = f'{self.partition_key_field} == "{self.partition_value}"'
+        return f"({scope}) and ({filter_expr})" if filter_expr else scope
+
+@dataclass(frozen=True)
+class IndexProfile:
+    """Named vector index configuration, selected by collection size"""
+    name: str
+    index_type: str
+    build_params: Dict[str, Any]
+    search_params: Dict[str, Any]
+    max_rows: Optional[int] = None  # largest collection this profile is selected for (None = unbounded)
+    bytes_per_dimension: float = 4.0  # approximate index memory per vector dimension
+    graph_bytes_per_vector: int = 0  # approximate extra memory per vector (graph links, codes)
+
+@dataclass(frozen=True)
+class FilterIndex:
+    """Scalar or JSON path index on a filtered field"""
+    index_name: str
+    field_name: str
+    index_type: str = "INVERTED"
+    json_path: Optional[str] = None  # e.g. metadata["file_type"]; None for scalar fields
+    json_cast_type: Optional[str] = None
+
+    def to_params(self) -> Dict[str, Any]:
+        """Keyword arguments for IndexParams.add_index"""
+        params: Dict[str, Any] = {"field_name": self.field_name, "index_type": self.index_type, "index_name": self.index_name}
+        if self.json_path:
+            params["params"] = {"json_path": self.json_path, "json_cast_type": self.json_cast_type or "varchar"}
+        return params
@@ -0,0 +1,137 @@
+"""
+Postgres chunk store
+Chunk bodies live in the document_chunks table; Milvus search returns chunk ids and scores only,
+and text/metadata are bulk-fetched here for the results that reach the prompt.
+"""
+import uuid
+from typing import Any, Dict, List
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
+
+from config.database import get_db_context
+from models.database.document import DocumentChunk
+from services.embedding.chunk_embedding_store import chunk_content_hash
+from utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+CHUNK_ID_NAMESPACE = uuid.UUID("6f1c7a52-3b7e-4d0e-9a55-2f0b8e4c1d90")
+
+# asyncpg allows 32767 bind parameters per statement; an upserted row binds 8 (with column defaults),
+# an id in IN (...) binds 1
+WRITE_BATCH_ROWS = 1000
+
+
+def build_chunk_id(document_id: str, text: str, occurrence: int = 0) -> str:
+    """
+    Deterministic chunk id: UUIDv5 of (document id, normalized content hash, occurrence)
+    The same text in the same document always maps to the same id, so a re-indexed
+    version can be diffed against what is stored. occurrence separates repeated chunks.
+    """
+    return str(uuid.uuid5(CHUNK_ID_NAMESPACE, f"{document_id}:{chunk_content_hash(text)}:{occurrence}"))
+
+
+def _parse_chunk_id(chunk_id: Any) -> Any:
+    """UUID of a chunk id, or None for ids not issued by this store (e.g. legacy rows)"""
+    try:
+        return uuid.UUID(str(chunk_id)) if chunk_id else None
+    except ValueError:
+        return None
+
+
+def _upsert_statement(rows: List[Dict[str, Any]]):
+    stmt = insert(DocumentChunk).values(rows)
+    return stmt.on_conflict_do_update(
+        index_elements=[DocumentChunk.id],
+        set_={
+            "content": stmt.excluded.content,
+            "chunk_metadata": stmt.excluded.chunk_metadata,
+            "chunk_index": stmt.excluded.chunk_index,
+        }
+    )
+
+
+class ChunkStore:
+    """Read/write access to document chunk bodies by chunk id"""
+
+    async def put_many(self, chunks: List[Dict[str, Any]]) -> None:
+        """
+        Store chunks (upsert by chunk id), WRITE_BATCH_ROWS per statement in one transaction
+
+        Args:
+            chunks: Dicts with chunk_id, document_id, collection_name, chunk_index, content, metadata
+        """
+        if not chunks:
+            return
+
+        rows = [
+            {
+                "id": uuid.UUID(chunk["chunk_id"]),
+                "document_id": chunk["document_id"],
+                "collection_name": chunk["collection_name"],
+                "chunk_index": chunk.get("chunk_index", 0),
+                "content": chunk["content"],
+                "chunk_metadata": chunk.get("metadata") or {},
+            }
+            for chunk in chunks
+        ]
+        async with get_db_context() as session:
+            for start in range(0, len(rows), WRITE_BATCH_ROWS):
+                await session.execute(_upsert_statement(rows[start:start + WRITE_BATCH_ROWS]))
+
+    async def get_many(self, chunk_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch chunk bodies in one query
+
+        Returns:
+            chunk id -> {"content", "metadata"}; unknown ids are absent
+        """
+        unique_ids = [cid for cid in (_parse_chunk_id(cid) for cid in dict.fromkeys(chunk_ids)) if cid]
+        if not unique_ids:
+            return {}
+
+        try:
+            async with get_db_context() as session:
+                result = await session.execute(
+                    select(DocumentChunk.id, DocumentChunk.content, DocumentChunk.chunk_metadata)
+                    .where(DocumentChunk.id.in_(unique_ids))
+                )
+                return {
+                    str(row.id): {"content": row.content, "metadata": row.chunk_metadata or {}}
+                    for row in result
+                }
+        except Exception as e:
+            logger.error(f"Failed to fetch {len(unique_ids)} chunks: {e}")
+            return {}
+
+    async def get_document_chunk_ids(self, document_id: str) -> Dict[str, int]:
+        """Chunk ids currently stored for a document, mapped to their chunk index"""
+        async with get_db_context() as session:
+            result = await session.execute(
+                select(DocumentChunk.id, DocumentChunk.chunk_index).where(DocumentChunk.document_id == document_id)
+            )
+            return {str(row.id): row.chunk_index for row in result}
+
+    async def delete_many(self, chunk_ids: List[str]) -> int:
+        """Delete chunks by id, WRITE_BATCH_ROWS ids per statement; returns the number of deleted rows"""
+        if not chunk_ids:
+            return 0
+        ids = [uuid.UUID(cid) for cid in chunk_ids]
+        deleted = 0
+        async with get_db_context() as session:
+            for start in range(0, len(ids), WRITE_BATCH_ROWS):
+                result = await session.execute(
+                    delete(DocumentChunk).where(DocumentChunk.id.in_(ids[start:start + WRITE_BATCH_ROWS]))
+                )
+                deleted += result.rowcount or 0
+        return deleted
+
+    async def delete_document(self, document_id: str) -> int:
+        """Delete all chunks of a document; returns the number of deleted rows"""
+        async with get_db_context() as session:
+            result = await session.execute(delete(DocumentChunk).where(DocumentChunk.document_id == document_id))
+            return result.rowcount or 0
+
+
+chunk_store = ChunkStore()
@@ -1,16 +1,22 @@
 from typing import Optional, Dict, Any, List, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import and_, select, delete
+from sqlalchemy import and_, select, delete, update
 from utils.logging import get_logger
 import asyncio
+import mimetypes
 import tempfile
 import os
+from datetime import timedelta
+from pathlib import Path
 from uuid import uuid4
 
 from models.database.tenant import Department
 from models.database.document import DocumentFolder, DocumentCollection, Document
+from services.documents.chunk_store import chunk_store
+from services.vector.bulk_import import BulkImportWriter
 from services.vector.milvus_service import milvus_service
 from services.messaging.kafka_service import kafka_service
+from services.cache.redis_service import redis_client
 from services.storage.minio_service import minio_service
 from common.types import (
     DBDocumentPermissionLevel, 
@@ -28,12 +34,18 @@ from common.dataclasses import (
     DocumentDeleteResult,
     MilvusCollectionInfo
 )
+from config.database import get_db_context
 from config.settings import get_settings
+from utils.datetime_utils import DateTimeManager
 from utils.file_processor import FileProcessor
 
 logger = get_logger(__name__)
 settings = get_settings()
 
+# Refreshed by running ingestion workers; without one, asynchronous uploads are processed inline
+INGESTION_WORKER_HEARTBEAT_KEY = "ingestion:worker:alive"
+INGESTION_WORKER_HEARTBEAT_TTL_S = 60
+
 
 class DocumentService:
     """
@@ -632,7 +644,7 @@ class DocumentService:
                 "Extracted chunks"
             )
 
-            base_meta = {"document_id": str(doc.id), "department_id": department_id}
+            base_meta = {"document_id": str(doc.id), "department_id": department_id, "folder_id": str(doc.folder_id) if doc.folder_id else None}
             indexed = await self._index_to_milvus(collection_name, chunks, base_meta, access_level)
 
             doc.processing_status = DocumentProcessingStatus.COMPLETED.value
@@ -784,7 +796,7 @@ class DocumentService:
                 "Extracted chunks"
             )
 
-            base_meta = {"document_id": str(doc.id), "department_id": department_id}
+            base_meta = {"document_id": str(doc.id), "department_id": department_id, "folder_id": str(doc.folder_id) if doc.folder_id else None}
             indexed = await self._index_to_milvus(collection_name, chunks, base_meta, access_level)
 
             doc.processing_status = DocumentProcessingStatus.COMPLETED.value
@@ -828,6 +840,378 @@ class DocumentService:
             )
             return DocumentUploadResult(error=str(e))
 
+    async def enqueue_document(
+        self,
+        tenant_id: str,
+        department_id: str,
+        uploaded_by: str,
+        file_name: str,
+        file_bytes: bytes,
+        file_mime_type: str,
+        access_level: DBDocumentPermissionLevel,
+        collection_name: str,
+        folder_id: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> Optional[DocumentUploadResult]:
+        """
+        Asynchronous upload: MinIO -> DB (status pending) -> ingestion job on Kafka.
+        Parsing, embedding and indexing run in the ingestion worker (process_queued_document).
+        If storing fails, rollback MinIO + DB. Without a live ingestion worker, or when the job
+        cannot be published, the document is processed inline instead.
+        """
+        bucket = self._build_bucket_name(tenant_id)
+        doc: Optional[Document] = None
+        storage_key: Optional[str] = None
+
+        try:
+            result = await self.db.execute(
+                select(DocumentCollection).where(DocumentCollection.collection_name == collection_name)
+            )
+            collection: Optional[DocumentCollection] = result.scalar_one_or_none()
+            if not collection:
+                raise ValueError(f"Collection {collection_name} not found")
+
+            access_level_string = self._get_access_level_string(access_level)
+            if folder_id:
+                folder_filter = and_(
+                    DocumentFolder.id == folder_id,
+                    DocumentFolder.department_id == department_id
+                )
+            else:
+                folder_filter = and_(
+                    DocumentFolder.department_id == department_id,
+                    DocumentFolder.folder_path == DocumentConstants.ROOT_FOLDER_PATH,
+                    DocumentFolder.access_level == access_level_string
+                )
+            result = await self.db.execute(select(DocumentFolder).where(folder_filter))
+            target_folder: Optional[DocumentFolder] = result.scalar_one_or_none()
+            if folder_id and not target_folder:
+                raise ValueError(f"Folder {folder_id} not found in department {department_id}")
+
+            title = os.path.splitext(os.path.basename(file_name))[0]
+            doc = Document(
+                filename=file_name,
+                title=title,
+                description=metadata.get("description") if metadata else None,
+                department_id=department_id,
+                folder_id=str(target_folder.id) if target_folder else None,
+                collection_id=str(collection.id),
+                uploaded_by=uploaded_by,
+                access_level=access_level_string,
+                file_size=len(file_bytes),
+                file_type=file_mime_type,
+                storage_key="",
+                bucket_name=bucket,
+                processing_status=DocumentProcessingStatus.PENDING.value,
+                vector_status=VectorProcessingStatus.PENDING.value,
+                metadata=metadata or {},
+            )
+            self.db.add(doc)
+            await self.db.flush()
+
+            folder_path = await self._build_folder_path_recursive(str(target_folder.id) if target_folder else None)
+            storage_key = self._build_storage_key(tenant_id, department_id, access_level_string, folder_path, str(doc.id), file_name)
+            doc.storage_key = storage_key
+            await self.db.flush()
+
+            await minio_service.ensure_bucket(bucket)
+            await minio_service.put_bytes(bucket, storage_key, file_bytes, file_mime_type)
+            await self.db.commit()
+
+        except Exception as e:
+            logger.error(f"Enqueue upload failed: {e}")
+            await self.db.rollback()
+
+            if storage_key:
+                try:
+                    await minio_service.delete_object(bucket, storage_key)
+                except Exception:
+                    pass
+
+            await self._publish_progress(
+                tenant_id, department_id, str(doc.id) if doc else None,
+                DocumentConstants.PROGRESS_COMPLETED,
+                KafkaMessageStatus.FAILED,
+                str(e)
+            )
+            return DocumentUploadResult(error=str(e))
+
+        document_id = str(doc.id)
+        await self._publish_progress(
+            tenant_id, department_id, document_id,
+            DocumentConstants.PROGRESS_STORAGE_UPLOADED,
+            KafkaMessageStatus.PROCESSING,
+            "Queued for processing",
+            {"folder_path": folder_path}
+        )
+        if await self._ingestion_worker_alive() and await kafka_service.publish_ingestion_job(tenant_id, department_id, document_id):
+            return DocumentUploadResult(
+                document_id=document_id,
+                file_name=file_name,
+                bucket=bucket,
+                storage_key=storage_key,
+                status=DocumentProcessingStatus.PENDING.value,
+            )
+
+        logger.warning(f"No ingestion worker or Kafka for document {document_id}; processing inline")
+        return await self.process_queued_document(document_id)
+
+    @staticmethod
+    async def _ingestion_worker_alive() -> bool:
+        """True if an ingestion worker has refreshed its heartbeat within INGESTION_WORKER_HEARTBEAT_TTL_S"""
+        try:
+            client = redis_client.get_client()
+            return bool(client and await client.exists(INGESTION_WORKER_HEARTBEAT_KEY))
+        except Exception as e:
+            logger.warning(f"Failed to read ingestion worker heartbeat: {e}")
+            return False
+
+    async def process_queued_document(self, document_id: str) -> Optional[DocumentUploadResult]:
+        """
+        Ingestion worker step: claim a pending document, parse its stored object and index it to Milvus.
+        The claim (pending -> processing) is atomic, so duplicate or redelivered jobs are skipped.
+        While the job runs its updated_at is renewed as a lease, and the final completed/failed update
+        only applies while that lease is still held (the stale sweep may have handed the document on).
+        On failure the document is marked failed; its object and DB row are kept for a retry.
+        """
+        lease = {"at": DateTimeManager._now()}
+        claimed = await self.db.execute(
+            update(Document)
+            .where(and_(
+                Document.id == document_id,
+                Document.processing_status == DocumentProcessingStatus.PENDING.value
+            ))
+            .values(
+                processing_status=DocumentProcessingStatus.PROCESSING.value,
+                vector_status=VectorProcessingStatus.PROCESSING.value,
+                updated_at=lease["at"]
+            )
+        )
+        await self.db.commit()
+        if claimed.rowcount == 0:
+            logger.debug(f"Document {document_id} not pending; skipping ingestion job")
+            return None
+
+        heartbeat = asyncio.create_task(self._renew_ingestion_lease(document_id, lease))
+        try:
+            return await self._ingest_claimed_document(document_id, lease, heartbeat)
+        finally:
+            await self._stop_ingestion_lease(heartbeat)
+
+    async def _ingest_claimed_document(
+        self,
+        document_id: str,
+        lease: Dict[str, Any],
+        heartbeat: asyncio.Task
+    ) -> Optional[DocumentUploadResult]:
+        """Parse and index a document claimed by process_queued_document"""
+
+        result = await self.db.execute(
+            select(Document, DocumentCollection.collection_name, Department.tenant_id)
+            .join(DocumentCollection, Document.collection_id == DocumentCollection.id)
+            .join(Department, Document.department_id == Department.id)
+            .where(Document.id == document_id)
+        )
+        doc, collection_name, tenant_id = result.one()
+        tenant_id = str(tenant_id)
+        department_id = str(doc.department_id)
+        file_name = doc.filename
+        access_level = (DBDocumentPermissionLevel.PRIVATE
+                        if doc.access_level == DocumentAccessLevel.PRIVATE.value
+                        else DBDocumentPermissionLevel.PUBLIC)
+
+        try:
+            await self._publish_progress(
+                tenant_id, department_id, document_id,
+                DocumentConstants.PROGRESS_DB_CREATED,
+                KafkaMessageStatus.PROCESSING,
+                "Processing started"
+            )
+
+            file_bytes = await minio_service.get_bytes(doc.bucket_name, doc.storage_key)
+            with tempfile.TemporaryDirectory() as tmpdir:
+                tmp_path = os.path.join(tmpdir, os.path.basename(doc.filename))
+                with open(tmp_path, "wb") as f:
+                    f.write(file_bytes)
+                chunks = await self.file_processor.process_file(
+                    file_path=tmp_path,
+                    file_name=doc.filename,
+                    doc_id=document_id,
+                    metadata={"department_id": department_id, "collection_name": collection_name}
+                )
+            await self._publish_progress(
+                tenant_id, department_id, document_id,
+                DocumentConstants.PROGRESS_CHUNKS_EXTRACTED,
+                KafkaMessageStatus.PROCESSING,
+                "Extracted chunks"
+            )
+
+            base_meta = {"document_id": document_id, "department_id": department_id, "folder_id": str(doc.folder_id) if doc.folder_id else None}
+            indexed = await self._index_to_milvus(collection_name, chunks, base_meta, access_level)
+
+            await self._stop_ingestion_lease(heartbeat)
+            if not await self._release_ingestion_lease(
+                document_id, lease,
+                processing_status=DocumentProcessingStatus.COMPLETED.value,
+                vector_status=VectorProcessingStatus.COMPLETED.value,
+                chunk_count=int(indexed)
+            ):
+                logger.warning(f"Lost the claim on document {document_id}; leaving it to the job that re-claimed it")
+                return None
+
+            await self._publish_progress(
+                tenant_id, department_id, document_id,
+                DocumentConstants.PROGRESS_COMPLETED,
+                KafkaMessageStatus.COMPLETED,
+                "Ingestion completed",
+                {"chunks": indexed}
+            )
+
+            return DocumentUploadResult(
+                document_id=document_id,
+                file_name=doc.filename,
+                bucket=doc.bucket_name,
+                storage_key=doc.storage_key,
+                chunks=indexed,
+                status=DocumentProcessingStatus.COMPLETED.value,
+            )
+
+        except Exception as e:
+            logger.error(f"Ingestion of document {document_id} failed: {e}")
+            await self.db.rollback()
+
+            await self._stop_ingestion_lease(heartbeat)
+            if not await self._release_ingestion_lease(
+                document_id, lease,
+                processing_status=DocumentProcessingStatus.FAILED.value,
+                vector_status=VectorProcessingStatus.FAILED.value
+            ):
+                logger.warning(f"Lost the claim on document {document_id}; leaving it to the job that re-claimed it")
+                return DocumentUploadResult(document_id=document_id, file_name=file_name, error=str(e))
+
+            try:
+                await milvus_service.delete_document_vectors(collection_name=collection_name, document_id=document_id)
+            except Exception:
+                pass
+
+            await self._publish_progress(
+                tenant_id, department_id, document_id,
+                DocumentConstants.PROGRESS_COMPLETED,
+                KafkaMessageStatus.FAILED,
+                str(e)
+            )
+            return DocumentUploadResult(document_id=document_id, file_name=file_name, error=str(e))
+
+    async def _renew_ingestion_lease(self, document_id: str, lease: Dict[str, Any]) -> None:
+        """
+        Heartbeat of a running ingestion job: move the claimed document's updated_at forward every
+        INGESTION_JOB_STALE_S / 4 so the stale sweep never mistakes a long job for a lost one.
+        Uses its own session (the job's session is busy); stops once the claim is lost.
+        """
+        interval_s = max(1.0, settings.INGESTION_JOB_STALE_S / 4)
+        while True:
+            await asyncio.sleep(interval_s)
+            renewed_at = DateTimeManager._now()
+            try:
+                async with get_db_context() as session:
+                    result = await session.execute(
+                        update(Document)
+                        .where(and_(
+                            Document.id == document_id,
+                            Document.processing_status == DocumentProcessingStatus.PROCESSING.value,
+                            Document.updated_at == lease["at"]
+                        ))
+                        .values(updated_at=renewed_at)
+                    )
+            except Exception as e:
+                logger.warning(f"Failed to renew ingestion lease of document {document_id}: {e}")
+                continue
+            if result.rowcount == 0:
+                logger.warning(f"Ingestion lease of document {document_id} lost")
+                return
+            lease["at"] = renewed_at
+
+    @staticmethod
+    async def _stop_ingestion_lease(heartbeat: asyncio.Task) -> None:
+        """Stop the heartbeat so lease["at"] no longer moves"""
+        heartbeat.cancel()
+        try:
+            await heartbeat
+        except asyncio.CancelledError:
+            pass
+
+    async def _release_ingestion_lease(self, document_id: str, lease: Dict[str, Any], **values: Any) -> bool:
+        """Write the job's final status if the document is still claimed by this job"""
+        result = await self.db.execute(
+            update(Document)
+            .where(and_(
+                Document.id == document_id,
+                Document.processing_status == DocumentProcessingStatus.PROCESSING.value,
+                Document.updated_at == lease["at"]
+            ))
+            .values(updated_at=DateTimeManager._now(), **values)
+        )
+        await self.db.commit()
+        return result.rowcount > 0
+
+    async def requeue_stale_documents(self, stale_s: int) -> int:
+        """
+        Re-enqueue documents stuck in pending/processing for longer than stale_s
+        (job never published, or lost with a crashed worker). Running jobs renew updated_at, so only
+        documents whose job stopped heartbeating qualify; partially indexed vectors are dropped
+        once the document has been reset.
+        """
+        cutoff = DateTimeManager._now() - timedelta(seconds=stale_s)
+        result = await self.db.execute(
+            select(Document, DocumentCollection.collection_name, Department.tenant_id)
+            .join(DocumentCollection, Document.collection_id == DocumentCollection.id)
+            .join(Department, Document.department_id == Department.id)
+            .where(and_(
+                Document.processing_status.in_([
+                    DocumentProcessingStatus.PENDING.value,
+                    DocumentProcessingStatus.PROCESSING.value
+                ]),
+                Document.updated_at < cutoff
+            ))
+        )
+        stale = [
+            (str(doc.id), str(doc.department_id), str(tenant_id), collection_name, doc.processing_status)
+            for doc, collection_name, tenant_id in result.all()
+        ]
+
+        requeued = 0
+        for document_id, department_id, tenant_id, collection_name, processing_status in stale:
+            try:
+                reset = await self.db.execute(
+                    update(Document)
+                    .where(and_(
+                        Document.id == document_id,
+                        Document.processing_status == processing_status,
+                        Document.updated_at < cutoff
+                    ))
+                    .values(
+                        processing_status=DocumentProcessingStatus.PENDING.value,
+                        vector_status=VectorProcessingStatus.PENDING.value,
+                        updated_at=DateTimeManager._now()
+                    )
+                )
+                await self.db.commit()
+                if reset.rowcount == 0:
+                    continue
+
+                if processing_status == DocumentProcessingStatus.PROCESSING.value:
+                    await milvus_service.delete_document_vectors(collection_name=collection_name, document_id=document_id)
+
+                if await kafka_service.publish_ingestion_job(tenant_id, department_id, document_id):
+                    requeued += 1
+            except Exception as e:
+                logger.error(f"Failed to re-enqueue document {document_id}: {e}")
+                await self.db.rollback()
+
+        if stale:
+            logger.info(f"Re-enqueued {requeued}/{len(stale)} stale documents")
+        return requeued
+
     async def batch_upload_documents(
         self,
         tenant_id: str,
@@ -911,6 +1295,214 @@ class DocumentService:
         
         return results
 
+    async def backfill_documents(
+        self,
+        tenant_id: str,
+        department_id: str,
+        uploaded_by: str,
+        file_paths: List[str],
+        access_level: DBDocumentPermissionLevel,
+        collection_name: str,
+        base_metadata: Optional[Dict[str, Any]] = None,
+        batch_id: Optional[str] = None
+    ) -> List[DocumentUploadResult]:
+        """
+        Offline backfill of many documents through Milvus bulk import instead of row inserts.
+        Files are stored and chunked BULK_BACKFILL_CONCURRENCY at a time; their vectors are staged as
+        Parquet and imported in one go at the end. Documents become searchable when the import
+        completes (vector_status COMPLETED). Batch progress is published to Kafka.
+        """
+        bucket = self._build_bucket_name(tenant_id)
+        batch_progress = BatchUploadProgress(
+            batch_id=batch_id or str(uuid4()),
+            tenant_id=tenant_id,
+            department_id=department_id,
+            total_files=len(file_paths)
+        )
+        results: List[DocumentUploadResult] = []
+
+        async def _publish(status: KafkaMessageStatus, message: str) -> None:
+            await kafka_service.publish_batch_progress(
+                tenant_id=tenant_id,
+                department_id=department_id,
+                batch_id=batch_progress.batch_id,
+                total_files=batch_progress.total_files,
+                completed_files=batch_progress.completed_files,
+                failed_files=batch_progress.failed_files,
+                status=status.value,
+                message=message
+            )
+
+        await _publish(KafkaMessageStatus.PROCESSING, f"Starting backfill of {batch_progress.total_files} files")
+
+        result = await self.db.execute(
+            select(DocumentCollection).where(DocumentCollection.collection_name == collection_name)
+        )
+        collection: Optional[DocumentCollection] = result.scalar_one_or_none()
+        if not collection:
+            raise ValueError(f"Collection {collection_name} not found")
+
+        access_level_string = self._get_access_level_string(access_level)
+        result = await self.db.execute(
+            select(DocumentFolder).where(
+                and_(
+                    DocumentFolder.department_id == department_id,
+                    DocumentFolder.folder_path == DocumentConstants.ROOT_FOLDER_PATH,
+                    DocumentFolder.access_level == access_level_string
+                )
+            )
+        )
+        root_folder: Optional[DocumentFolder] = result.scalar_one_or_none()
+        folder_path = await self._build_folder_path_recursive(str(root_folder.id) if root_folder else None)
+
+        writer = BulkImportWriter(
+            milvus_service, collection_name, access_level.value, tenant_id, batch_progress.batch_id
+        )
+        await writer.open()
+        await minio_service.ensure_bucket(bucket)
+
+        async def _store_and_chunk(doc: Document, file_path: str) -> List[Any]:
+            file_bytes = await asyncio.to_thread(Path(file_path).read_bytes)
+            await minio_service.put_bytes(bucket, doc.storage_key, file_bytes, doc.file_type)
+            return await self.file_processor.process_file(
+                file_path=file_path,
+                file_name=doc.filename,
+                doc_id=str(doc.id),
+                metadata={"department_id": department_id, "collection_name": collection_name}
+            )
+
+        staged_docs: List[Document] = []
+        window = max(1, settings.BULK_BACKFILL_CONCURRENCY)
+        for start in range(0, len(file_paths), window):
+            docs = []
+            for file_path in file_paths[start:start + window]:
+                file_name = os.path.basename(file_path)
+                doc = Document(
+                    filename=file_name,
+                    title=os.path.splitext(file_name)[0],
+                    description=None,
+                    department_id=department_id,
+                    folder_id=str(root_folder.id) if root_folder else None,
+                    collection_id=str(collection.id),
+                    uploaded_by=uploaded_by,
+                    access_level=access_level_string,
+                    file_size=os.path.getsize(file_path),
+                    file_type=mimetypes.guess_type(file_name)[0] or "application/octet-stream",
+                    storage_key="",
+                    bucket_name=bucket,
+                    processing_status=DocumentProcessingStatus.PROCESSING.value,
+                    vector_status=VectorProcessingStatus.PENDING.value,
+                    metadata=base_metadata or {},
+                )
+                self.db.add(doc)
+                await self.db.flush()
+                doc.storage_key = self._build_storage_key(
+                    tenant_id, department_id, access_level_string, folder_path, str(doc.id), file_name
+                )
+                docs.append((doc, file_path))
+            await self.db.flush()
+
+            outcomes = await asyncio.gather(
+                *(_store_and_chunk(doc, file_path) for doc, file_path in docs),
+                return_exceptions=True
+            )
+
+            for (doc, _), outcome in zip(docs, outcomes):
+                try:
+                    if isinstance(outcome, Exception):
+                        raise outcome
+                    base_meta = {"document_id": str(doc.id), "department_id": department_id, "folder_id": str(doc.folder_id) if doc.folder_id else None}
+                    documents, stored_chunks = milvus_service._prepare_chunks(collection_name, outcome, base_meta)
+                    if settings.MILVUS_CHUNK_STORE_ENABLED:
+                        await chunk_store.put_many(stored_chunks)
+                    await writer.add_documents(documents)
+
+                    doc.chunk_count = len(documents)
+                    doc.processing_status = DocumentProcessingStatus.COMPLETED.value
+                    doc.vector_status = VectorProcessingStatus.PROCESSING.value
+                    staged_docs.append(doc)
+                    batch_progress.completed_files += 1
+                    results.append(DocumentUploadResult(
+                        document_id=str(doc.id),
+                        file_name=doc.filename,
+                        bucket=bucket,
+                        storage_key=doc.storage_key,
+                        chunks=len(documents),
+                        status=DocumentProcessingStatus.PROCESSING.value,
+                    ))
+                except Exception as e:
+                    logger.error(f"Backfill of {doc.filename} failed: {e}")
+                    await self._discard_backfilled_files([doc], bucket)
+                    doc.processing_status = DocumentProcessingStatus.FAILED.value
+                    doc.vector_status = VectorProcessingStatus.FAILED.value
+                    batch_progress.failed_files += 1
+                    results.append(DocumentUploadResult(document_id=str(doc.id), file_name=doc.filename, error=str(e)))
+
+            await self.db.commit()
+            await _publish(
+                KafkaMessageStatus.PROCESSING,
+                f"Staged {batch_progress.completed_files + batch_progress.failed_files}/{batch_progress.total_files} files"
+            )
+
+        async def _on_import_progress(percent: int, imported_rows: int) -> None:
+            await _publish(KafkaMessageStatus.PROCESSING, f"Importing vectors: {percent}% ({imported_rows}/{writer.staged_rows} chunks)")
+
+        import_error: Optional[str] = None
+        try:
+            await writer.finish(_on_import_progress)
+        except Exception as e:
+            logger.error(f"Bulk import of backfill {batch_progress.batch_id} failed: {e}")
+            import_error = str(e)
+            batch_progress.failed_files += batch_progress.completed_files
+            batch_progress.completed_files = 0
+
+        if import_error:
+            # Jobs that did complete may have imported part of the batch
+            await self._discard_backfilled_vectors(staged_docs, collection_name, access_level.value)
+            await self._discard_backfilled_files(staged_docs, bucket)
+        for doc in staged_docs:
+            if import_error:
+                doc.processing_status = DocumentProcessingStatus.FAILED.value
+                doc.vector_status = VectorProcessingStatus.FAILED.value
+            else:
+                doc.vector_status = VectorProcessingStatus.COMPLETED.value
+        for res in results:
+            if res.error is None:
+                res.status = DocumentProcessingStatus.FAILED.value if import_error else DocumentProcessingStatus.COMPLETED.value
+                res.error = import_error
+        await self.db.commit()
+
+        final_status = (KafkaMessageStatus.COMPLETED if batch_progress.failed_files == 0
+                        else KafkaMessageStatus.COMPLETED_WITH_ERRORS)
+        await _publish(
+            final_status,
+            f"Backfill completed: {batch_progress.completed_files} success, {batch_progress.failed_files} failed"
+        )
+        return results
+
+    async def _discard_backfilled_files(self, docs: List[Document], bucket: str) -> None:
+        """Remove stored objects and chunk bodies of backfill documents that failed (best-effort)"""
+        for doc in docs:
+            try:
+                await minio_service.delete_object(bucket, doc.storage_key)
+            except Exception:
+                pass
+            if settings.MILVUS_CHUNK_STORE_ENABLED:
+                try:
+                    await chunk_store.delete_document(str(doc.id))
+                except Exception as e:
+                    logger.warning(f"Failed to remove chunk bodies of {doc.id}: {e}")
+
+    async def _discard_backfilled_vectors(self, docs: List[Document], collection_name: str, milvus_instance: str) -> None:
+        """Delete vectors a partially completed bulk import left for the given documents"""
+        window = max(1, settings.MILVUS_INSERT_BATCH_SIZE)
+        for start in range(0, len(docs), window):
+            id_list = ", ".join(f'"{doc.id}"' for doc in docs[start:start + window])
+            if not await milvus_service.bulk_delete_by_filter(
+                f"document_id in [{id_list}]", collection_name, milvus_instance, compact=False
+            ):
+                logger.error(f"Failed to remove partially imported vectors from {collection_name}")
+
     async def delete_document(self, tenant_id: str, department_id: str, document_id: str) -> DocumentDeleteResult:
         """
         Best-effort delete: minio -> db -> milvus(reindex). If any step fails, still accept with error details.
@@ -995,6 +1587,116 @@ class DocumentService:
                 error=str(e)
             )
 
+    async def update_document_content(
+        self,
+        tenant_id: str,
+        department_id: str,
+        document_id: str,
+        file_name: str,
+        file_bytes: bytes,
+        file_mime_type: str
+    ) -> Optional[DocumentUploadResult]:
+        """
+        Replace the file of a document and re-index incrementally: only chunks whose content changed
+        are embedded and inserted or deleted, unchanged chunks keep their vectors.
+        The stored file is replaced after indexing succeeds. Progress is published to Kafka.
+        """
+        try:
+            await self._publish_progress(
+                tenant_id, department_id, document_id, 
+                DocumentConstants.PROGRESS_START, 
+                KafkaMessageStatus.PROCESSING, 
+                "Starting update"
+            )
+            
+            result = await self.db.execute(
+                select(Document).where(
+                    and_(
+                        Document.id == document_id,
+                        Document.department_id == department_id
+                    )
+                )
+            )
+            doc: Optional[Document] = result.scalar_one_or_none()
+            if not doc:
+                return DocumentUploadResult(document_id=document_id, error="not_found")
+            
+            result = await self.db.execute(
+                select(DocumentCollection).where(DocumentCollection.id == doc.collection_id)
+            )
+            collection: Optional[DocumentCollection] = result.scalar_one_or_none()
+            if not collection:
+                raise ValueError(f"Collection of document {document_id} not found")
+            
+            collection_name = collection.collection_name
+            access_level = DBDocumentPermissionLevel(doc.get_access_type())
+            doc.processing_status = DocumentProcessingStatus.PROCESSING.value
+            await self.db.flush()
+
+            with tempfile.TemporaryDirectory() as tmpdir:
+                tmp_path = os.path.join(tmpdir, os.path.basename(file_name))
+                with open(tmp_path, "wb") as f:
+                    f.write(file_bytes)
+                chunks = await self.file_processor.process_file(
+                    file_path=tmp_path,
+                    file_name=file_name,
+                    doc_id=document_id,
+                    metadata={"department_id": department_id, "collection_name": collection_name}
+                )
+            await self._publish_progress(
+                tenant_id, department_id, document_id, 
+                DocumentConstants.PROGRESS_CHUNKS_EXTRACTED, 
+                KafkaMessageStatus.PROCESSING, 
+                "Extracted chunks"
+            )
+
+            base_meta = {"document_id": document_id, "department_id": department_id, "folder_id": str(doc.folder_id) if doc.folder_id else None}
+            stats = await milvus_service.reindex_document_chunks(
+                collection_name=collection_name,
+                chunks=chunks,
+                metadata=base_meta,
+                milvus_instance=access_level.value
+            )
+
+            await minio_service.put_bytes(doc.bucket_name, doc.storage_key, file_bytes, file_mime_type)
+
+            doc.filename = file_name
+            doc.file_size = len(file_bytes)
+            doc.file_type = file_mime_type
+            doc.chunk_count = int(stats["total"])
+            doc.processing_status = DocumentProcessingStatus.COMPLETED.value
+            doc.vector_status = VectorProcessingStatus.COMPLETED.value
+            await self.db.flush()
+            await self.db.commit()
+
+            await self._publish_progress(
+                tenant_id, department_id, document_id, 
+                DocumentConstants.PROGRESS_COMPLETED, 
+                KafkaMessageStatus.COMPLETED, 
+                "Update completed",
+                stats
+            )
+
+            return DocumentUploadResult(
+                document_id=document_id,
+                file_name=file_name,
+                bucket=doc.bucket_name,
+                storage_key=doc.storage_key,
+                chunks=int(stats["total"]),
+                status=DocumentProcessingStatus.COMPLETED.value,
+            )
+
+        except Exception as e:
+            logger.error(f"Update document content failed for {document_id}: {e}")
+            await self.db.rollback()
+            await self._publish_progress(
+                tenant_id, department_id, document_id, 
+                DocumentConstants.PROGRESS_COMPLETED, 
+                KafkaMessageStatus.FAILED, 
+                str(e)
+            )
+            return DocumentUploadResult(document_id=document_id, error=str(e))
+
     async def download_document(self, document_id: str) -> Optional[Tuple[bytes, str, str]]:
         """Download object from MinIO and return (data_bytes, mime_type, file_name)."""
         try:
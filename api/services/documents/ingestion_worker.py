@@ -0,0 +1,128 @@
+"""
+Document ingestion worker
+Consumes ingestion jobs published by asynchronous uploads and runs parse -> embed -> Milvus insert
+with bounded concurrency, reporting progress through the usual document progress events.
+Documents whose job was never published or was lost with a crashed worker are re-enqueued
+from their DB status by a periodic stale sweep. While consuming, the worker refreshes a Redis
+heartbeat; uploads that find no heartbeat are processed inline by the API instead.
+
+Run with: python -m services.documents.ingestion_worker
+"""
+import asyncio
+import signal
+from typing import Any, Dict, Set
+
+from config.database import get_db_context
+from config.settings import get_settings
+from services.cache.redis_service import redis_client
+from services.documents.document_service import (
+    INGESTION_WORKER_HEARTBEAT_KEY,
+    INGESTION_WORKER_HEARTBEAT_TTL_S,
+    DocumentService,
+)
+from services.messaging.kafka_service import INGESTION_JOB_TYPE, kafka_service
+from utils.logging import get_logger
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+
+class IngestionWorker:
+    """
+    Runs up to `concurrency` ingestion jobs at a time. The Kafka handler waits for a free slot
+    before taking the next message, so a busy worker stops pulling instead of queueing in memory.
+    """
+
+    def __init__(self, concurrency: int, stale_s: int):
+        self.concurrency = max(1, concurrency)
+        self.stale_s = stale_s
+        self._slots = asyncio.Semaphore(self.concurrency)
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def _process(self, document_id: str) -> None:
+        try:
+            async with get_db_context() as session:
+                await DocumentService(session).process_queued_document(document_id)
+        except Exception as e:
+            logger.error(f"Ingestion job for document {document_id} failed: {e}")
+        finally:
+            self._slots.release()
+
+    async def handle_message(self, message: Dict[str, Any]) -> None:
+        if not isinstance(message, dict) or message.get("type") != INGESTION_JOB_TYPE:
+            return
+        document_id = message.get("document_id")
+        if not document_id:
+            return
+
+        await self._slots.acquire()
+        task = asyncio.create_task(self._process(str(document_id)))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _requeue_stale(self) -> None:
+        try:
+            async with get_db_context() as session:
+                await DocumentService(session).requeue_stale_documents(self.stale_s)
+        except Exception as e:
+            logger.error(f"Stale ingestion sweep failed: {e}")
+
+    async def _sweep_loop(self) -> None:
+        while True:
+            await self._requeue_stale()
+            await asyncio.sleep(max(60, self.stale_s // 4))
+
+    async def _heartbeat_loop(self) -> None:
+        while True:
+            try:
+                client = redis_client.get_client()
+                if client:
+                    await client.set(INGESTION_WORKER_HEARTBEAT_KEY, "1", ex=INGESTION_WORKER_HEARTBEAT_TTL_S)
+            except Exception as e:
+                logger.warning(f"Failed to refresh ingestion worker heartbeat: {e}")
+            await asyncio.sleep(INGESTION_WORKER_HEARTBEAT_TTL_S / 3)
+
+    async def run(self) -> None:
+        await kafka_service.start_consumer(
+            self.handle_message,
+            topics=[settings.KAFKA_INGESTION_TOPIC],
+            group_id=settings.KAFKA_CONSUMER_GROUP,
+            auto_offset_reset='earliest',
+            max_poll_records=self.concurrency,
+            max_poll_interval_ms=max(300000, self.stale_s * 1000)
+        )
+        if not (await kafka_service.health_check())["consumer_running"]:
+            logger.error("Ingestion worker not started - Kafka consumer unavailable; uploads are processed inline")
+            return
+        try:
+            await redis_client.initialize()
+        except Exception as e:
+            logger.error(f"Redis unavailable, no worker heartbeat - the API processes uploads inline: {e}")
+        logger.info(f"Ingestion worker started - concurrency: {self.concurrency}")
+
+        try:
+            await asyncio.gather(self._sweep_loop(), self._heartbeat_loop())
+        finally:
+            await kafka_service.stop_consumer()
+            if self._tasks:
+                await asyncio.gather(*self._tasks, return_exceptions=True)
+            await kafka_service.stop_producer()
+            logger.info("Ingestion worker stopped")
+
+
+async def main() -> None:
+    worker = IngestionWorker(settings.INGESTION_WORKER_CONCURRENCY, settings.INGESTION_JOB_STALE_S)
+    task = asyncio.create_task(worker.run())
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, task.cancel)
+
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,85 @@
+"""
+Content-addressed store for document chunk embeddings
+Identical chunks (re-uploads, corrected revisions, the same file in several folders)
+reuse their stored vector instead of going through the model again.
+"""
+import hashlib
+from typing import List, Optional
+
+import numpy as np
+
+from services.cache.redis_service import redis_client
+from services.embedding.query_embedding_cache import normalize_query_text
+from workflows.monitoring.prometheus import EMBEDDING_CHUNK_STORE_REQUESTS
+from utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+def chunk_content_hash(text: str) -> str:
+    """SHA-256 of the normalized chunk text (Unicode NFKC, collapsed whitespace)"""
+    return hashlib.sha256(normalize_query_text(text).encode("utf-8")).hexdigest()
+
+
+class ChunkEmbeddingStore:
+    """
+    Redis-backed chunk embedding store keyed by model name, model version and content hash.
+    Vectors are stored as float32 bytes so reused document vectors are bit-identical to fresh ones.
+    """
+
+    KEY_PREFIX = "emb:chunk"
+
+    def __init__(self, model_name: str, model_version: str, ttl_seconds: int = 2592000):
+        self.model_name = model_name
+        self.model_version = model_version
+        self.ttl_seconds = ttl_seconds
+
+    def build_key(self, content_hash: str) -> str:
+        return f"{self.KEY_PREFIX}:{self.model_name}:{self.model_version}:{content_hash}"
+
+    async def get_many(self, content_hashes: List[str]) -> List[Optional[np.ndarray]]:
+        """
+        Look up stored chunk embeddings
+
+        Returns:
+            One entry per hash: the stored float32 vector, or None when it must be encoded
+        """
+        results: List[Optional[np.ndarray]] = [None] * len(content_hashes)
+        if not content_hashes:
+            return results
+
+        try:
+            client = redis_client.get_binary_client()
+            if client:
+                values = await client.mget([self.build_key(h) for h in content_hashes])
+                for i, value in enumerate(values):
+                    if value is not None:
+                        results[i] = np.frombuffer(value, dtype=np.float32)
+        except Exception as e:
+            logger.warning(f"Chunk embedding store lookup failed: {e}")
+
+        hits = sum(1 for vector in results if vector is not None)
+        if hits:
+            EMBEDDING_CHUNK_STORE_REQUESTS.labels(result="hit").inc(hits)
+        if len(results) - hits:
+            EMBEDDING_CHUNK_STORE_REQUESTS.labels(result="miss").inc(len(results) - hits)
+        return results
+
+    async def set_many(self, content_hashes: List[str], vectors: np.ndarray) -> None:
+        """Store freshly encoded chunk embeddings (TTL is refreshed on every store)"""
+        if not content_hashes:
+            return
+
+        try:
+            client = redis_client.get_binary_client()
+            if client:
+                pipe = client.pipeline(transaction=False)
+                for content_hash, vector in zip(content_hashes, vectors):
+                    pipe.set(
+                        self.build_key(content_hash),
+                        np.asarray(vector, dtype=np.float32).tobytes(),
+                        ex=self.ttl_seconds
+                    )
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Chunk embedding store write failed: {e}")
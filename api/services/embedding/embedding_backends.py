@@ -0,0 +1,243 @@
+"""
+Embedding backends for BGE-M3
+- torch: sentence-transformers on PyTorch (full precision)
+- onnx_int8: dynamically quantized ONNX Runtime export for CPU-only nodes
+"""
+import os
+from typing import List, Optional
+
+import numpy as np
+
+from config.settings import get_settings
+from utils.logging import get_logger
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+try:
+    import onnxruntime as ort
+    from transformers import AutoTokenizer
+    ONNXRUNTIME_AVAILABLE = True
+except ImportError:
+    ONNXRUNTIME_AVAILABLE = False
+
+BACKEND_TORCH = "torch"
+BACKEND_ONNX_INT8 = "onnx_int8"
+
+
+class EmbeddingBackend:
+    """Base class: encode texts into L2-normalized float32 vectors"""
+
+    name: str = ""
+
+    def __init__(self, model_name: str, revision: Optional[str] = None, max_length: int = 8192):
+        self.model_name = model_name
+        self.revision = revision
+        self.max_length = max_length
+        self.tokenizer = None
+
+    def load(self) -> None:
+        raise NotImplementedError
+
+    def encode(self, texts: List[str], batch_size: int) -> np.ndarray:
+        raise NotImplementedError
+
+    def count_tokens(self, texts: List[str]) -> List[int]:
+        """Token length of each text after truncation (special tokens included)"""
+        encoded = self.tokenizer(texts, add_special_tokens=True, truncation=True, max_length=self.max_length)
+        return [len(ids) for ids in encoded["input_ids"]]
+
+    @staticmethod
+    def plan_token_batches(lengths: List[int], max_batch_tokens: int, max_batch_size: int) -> List[List[int]]:
+        """
+        Group text indices into length-sorted batches whose padded size
+        (batch length x longest text) stays within max_batch_tokens
+        """
+        order = sorted(range(len(lengths)), key=lambda i: lengths[i], reverse=True)
+        batches: List[List[int]] = []
+        current: List[int] = []
+
+        for i in order:
+            # Sorted longest-first, so the first index in a batch fixes its padded length
+            longest = lengths[current[0]] if current else lengths[i]
+            if current and (longest * (len(current) + 1) > max_batch_tokens or len(current) >= max_batch_size):
+                batches.append(current)
+                current = []
+            current.append(i)
+
+        if current:
+            batches.append(current)
+        return batches
+
+    def encode_bucketed(self, texts: List[str], max_batch_tokens: int, max_batch_size: int) -> np.ndarray:
+        """
+        Encode texts in length buckets with a token budget per batch, then restore input order.
+        Cuts padding when chunk lengths vary widely (short headings next to full-size chunks).
+        """
+        lengths = self.count_tokens(texts)
+        output: Optional[np.ndarray] = None
+
+        for batch in self.plan_token_batches(lengths, max_batch_tokens, max_batch_size):
+            vectors = self.encode([texts[i] for i in batch], batch_size=len(batch))
+            if output is None:
+                output = np.empty((len(texts), vectors.shape[1]), dtype=np.float32)
+            output[batch] = vectors
+
+        return output
+
+
+class TorchEmbeddingBackend(EmbeddingBackend):
+    """sentence-transformers model on PyTorch"""
+
+    name = BACKEND_TORCH
+
+    def __init__(self, model_name: str, revision: Optional[str] = None, max_length: int = 8192, device: str = "cpu"):
+        super().__init__(model_name, revision, max_length)
+        self.device = device
+        self.model = None
+
+    def load(self) -> None:
+        from sentence_transformers import SentenceTransformer
+
+        self.model = SentenceTransformer(
+            self.model_name,
+            device=self.device,
+            revision=self.revision,
+            trust_remote_code=True
+        )
+        self.tokenizer = self.model.tokenizer
+        logger.info(f"Loaded torch embedding backend: {self.model_name} on {self.device}")
+
+    def encode(self, texts: List[str], batch_size: int) -> np.ndarray:
+        return self.model.encode(
+            texts,
+            batch_size=batch_size,
+            normalize_embeddings=True,
+            convert_to_numpy=True,
+            show_progress_bar=False
+        )
+
+
+class OnnxInt8EmbeddingBackend(EmbeddingBackend):
+    """
+    Dynamically quantized (int8 weights) ONNX Runtime model.
+    The export is created once under model_dir and reused by every process.
+    Dense embedding = CLS token of the last hidden state, L2-normalized (BGE-M3 pooling).
+    """
+
+    name = BACKEND_ONNX_INT8
+    QUANTIZED_FILE = "model_quantized.onnx"
+
+    def __init__(
+        self,
+        model_name: str,
+        revision: Optional[str] = None,
+        max_length: int = 8192,
+        model_dir: str = "models/onnx/bge-m3",
+        num_threads: int = 0
+    ):
+        super().__init__(model_name, revision, max_length)
+        self.model_dir = model_dir
+        self.num_threads = num_threads
+        self.session = None
+        self._input_names: List[str] = []
+
+    @property
+    def quantized_path(self) -> str:
+        return os.path.join(self.model_dir, self.QUANTIZED_FILE)
+
+    def export(self) -> str:
+        """Export the model to ONNX and apply dynamic int8 quantization"""
+        from optimum.onnxruntime import ORTModelForFeatureExtraction, ORTQuantizer
+        from optimum.onnxruntime.configuration import AutoQuantizationConfig
+
+        logger.info(f"Exporting {self.model_name} to ONNX in {self.model_dir}")
+        os.makedirs(self.model_dir, exist_ok=True)
+
+        model = ORTModelForFeatureExtraction.from_pretrained(
+            self.model_name,
+            revision=self.revision,
+            export=True
+        )
+        model.save_pretrained(self.model_dir)
+        AutoTokenizer.from_pretrained(self.model_name, revision=self.revision).save_pretrained(self.model_dir)
+
+        quantizer = ORTQuantizer.from_pretrained(self.model_dir)
+        quantization_config = AutoQuantizationConfig.avx2(is_static=False, per_channel=False)
+        quantizer.quantize(save_dir=self.model_dir, quantization_config=quantization_config)
+
+        logger.info(f"Quantized ONNX model written to {self.quantized_path}")
+        return self.quantized_path
+
+    def load(self) -> None:
+        if not ONNXRUNTIME_AVAILABLE:
+            raise RuntimeError("onnxruntime is not installed - ONNX embedding backend unavailable")
+
+        if not os.path.exists(self.quantized_path):
+            self.export()
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if self.num_threads > 0:
+            options.intra_op_num_threads = self.num_threads
+
+        self.session = ort.InferenceSession(
+            self.quantized_path,
+            sess_options=options,
+            providers=["CPUExecutionProvider"]
+        )
+        self._input_names = [i.name for i in self.session.get_inputs()]
+        self.tokenizer = AutoTokenizer.from_pretrained(self.model_dir)
+        logger.info(f"Loaded ONNX int8 embedding backend from {self.quantized_path}")
+
+    def encode(self, texts: List[str], batch_size: int) -> np.ndarray:
+        outputs = []
+
+        for start in range(0, len(texts), batch_size):
+            encoded = self.tokenizer(
+                texts[start:start + batch_size],
+                padding=True,
+                truncation=True,
+                max_length=self.max_length,
+                return_tensors="np"
+            )
+            feeds = {name: encoded[name].astype(np.int64) for name in self._input_names if name in encoded}
+            last_hidden_state = self.session.run(None, feeds)[0]
+            outputs.append(last_hidden_state[:, 0])
+
+        embeddings = np.concatenate(outputs, axis=0).astype(np.float32)
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        return embeddings / np.clip(norms, 1e-12, None)
+
+
+def create_embedding_backend(backend_name: Optional[str] = None) -> EmbeddingBackend:
+    """
+    Build and load the embedding backend selected in settings (EMBEDDING_BACKEND).
+    Falls back to torch if the ONNX backend cannot be loaded.
+    """
+    backend_name = backend_name or settings.EMBEDDING_BACKEND
+
+    if backend_name == BACKEND_ONNX_INT8:
+        backend = OnnxInt8EmbeddingBackend(
+            model_name=settings.EMBEDDING_MODEL,
+            revision=settings.EMBEDDING_MODEL_REVISION,
+            max_length=settings.embedding.max_length,
+            model_dir=settings.EMBEDDING_ONNX_DIR,
+            num_threads=settings.EMBEDDING_ONNX_THREADS
+        )
+        try:
+            backend.load()
+            return backend
+        except Exception as e:
+            logger.error(f"Failed to load ONNX embedding backend, falling back to torch: {e}")
+    elif backend_name != BACKEND_TORCH:
+        logger.warning(f"Unknown embedding backend '{backend_name}', using torch")
+
+    backend = TorchEmbeddingBackend(
+        model_name=settings.EMBEDDING_MODEL,
+        revision=settings.EMBEDDING_MODEL_REVISION,
+        max_length=settings.embedding.max_length,
+        device=settings.DEVICE
+    )
+    backend.load()
+    return backend
@@ -0,0 +1,132 @@
+"""
+Micro-batching executor for embedding requests
+Merges concurrent encode calls into one model forward pass on a dedicated thread
+"""
+import asyncio
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from typing import Callable, List, Optional
+
+import numpy as np
+
+from utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class _PendingRequest:
+    """Texts waiting to be encoded and the future that receives their rows"""
+    texts: List[str]
+    future: asyncio.Future
+
+
+class EmbeddingBatcher:
+    """
+    Collects encode requests from concurrent callers and runs them as a single batch.
+
+    A batch is flushed when it reaches max_batch_size texts or when max_wait_ms has
+    elapsed since its first request. The model call runs on the given executor so the
+    event loop keeps serving other requests (SSE streams, auth, ...) while encoding.
+    """
+
+    def __init__(
+        self,
+        encode_fn: Callable[[List[str]], np.ndarray],
+        executor: Executor,
+        max_batch_size: int = 32,
+        max_wait_ms: float = 5.0
+    ):
+        self._encode_fn = encode_fn
+        self._executor = executor
+        self._max_batch_size = max(1, max_batch_size)
+        self._max_wait = max(0.0, max_wait_ms) / 1000
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _ensure_worker(self, loop: asyncio.AbstractEventLoop) -> bool:
+        """Start the batching worker on the current loop; False if bound to another loop"""
+        if self._worker is not None and not self._worker.done():
+            return self._loop is loop
+
+        self._loop = loop
+        self._queue = asyncio.Queue()
+        self._worker = loop.create_task(self._run())
+        return True
+
+    async def submit(self, texts: List[str]) -> np.ndarray:
+        """
+        Encode texts as part of the next batch
+
+        Args:
+            texts: Texts to encode
+
+        Returns:
+            Array with one row per input text, in input order
+        """
+        loop = asyncio.get_running_loop()
+
+        if not self._ensure_worker(loop):
+            # Called from a foreign loop (e.g. asyncio.run in a worker thread): encode directly
+            return await loop.run_in_executor(self._executor, self._encode_fn, texts)
+
+        future = loop.create_future()
+        await self._queue.put(_PendingRequest(texts=texts, future=future))
+        return await future
+
+    async def _collect_batch(self) -> List[_PendingRequest]:
+        """Wait for the first request, then gather more until the batch is full or the window closes"""
+        first = await self._queue.get()
+        batch = [first]
+        size = len(first.texts)
+        deadline = self._loop.time() + self._max_wait
+
+        while size < self._max_batch_size:
+            timeout = deadline - self._loop.time()
+            if timeout <= 0:
+                break
+            try:
+                request = await asyncio.wait_for(self._queue.get(), timeout)
+            except asyncio.TimeoutError:
+                break
+            batch.append(request)
+            size += len(request.texts)
+
+        return batch
+
+    async def _run(self) -> None:
+        """Batching loop: one executor call per collected batch"""
+        while True:
+            batch = await self._collect_batch()
+            texts = [text for request in batch for text in request.texts]
+
+            try:
+                vectors = await self._loop.run_in_executor(self._executor, self._encode_fn, texts)
+            except Exception as e:
+                logger.error(f"Batched encoding of {len(texts)} texts failed: {e}")
+                for request in batch:
+                    if not request.future.done():
+                        request.future.set_exception(e)
+                continue
+
+            offset = 0
+            for request in batch:
+                count = len(request.texts)
+                if not request.future.done():
+                    request.future.set_result(vectors[offset:offset + count])
+                offset += count
+
+            logger.debug(f"Encoded batch of {len(texts)} texts for {len(batch)} requests")
+
+    async def shutdown(self) -> None:
+        """Stop the batching worker"""
+        if self._worker is not None and not self._worker.done():
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+        self._worker = None
+        self._queue = None
+        self._loop = None
@@ -0,0 +1,132 @@
+"""
+Thin client for the shared embedding server
+Keeps a small pool of persistent Unix socket connections per API worker
+"""
+import asyncio
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from services.embedding.embedding_protocol import EmbeddingServerError, read_response, write_request
+from utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+_Connection = Tuple[asyncio.StreamReader, asyncio.StreamWriter]
+
+
+class EmbeddingClient:
+    """
+    Sends encode requests to the embedding server over a Unix socket
+    """
+
+    def __init__(
+        self,
+        socket_path: str,
+        pool_size: int = 4,
+        timeout: float = 60.0,
+        connect_retries: int = 10
+    ):
+        self.socket_path = socket_path
+        self.pool_size = max(1, pool_size)
+        self.timeout = timeout
+        self.connect_retries = connect_retries
+        self._pool: Optional[asyncio.Queue] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._opened = 0
+
+    async def _open_connection(self) -> _Connection:
+        """Connect to the server, retrying while it is still starting up"""
+        for attempt in range(self.connect_retries + 1):
+            try:
+                return await asyncio.open_unix_connection(self.socket_path)
+            except (FileNotFoundError, ConnectionRefusedError) as e:
+                if attempt >= self.connect_retries:
+                    logger.error(f"Embedding server unavailable at {self.socket_path}: {e}")
+                    raise
+                await asyncio.sleep(min(0.2 * (2 ** attempt), 5.0))
+
+    async def _acquire(self) -> _Connection:
+        """Take a pooled connection, opening a new one while under the pool size"""
+        if self._pool.empty() and self._opened < self.pool_size:
+            self._opened += 1
+            try:
+                return await self._open_connection()
+            except Exception:
+                self._opened -= 1
+                raise
+
+        return await self._pool.get()
+
+    def _release(self, connection: _Connection, healthy: bool) -> None:
+        """Return a connection to the pool, or drop it if the exchange failed"""
+        if healthy:
+            self._pool.put_nowait(connection)
+            return
+
+        self._opened -= 1
+        try:
+            connection[1].close()
+        except Exception:
+            pass
+
+    async def encode(self, op: str, texts: List[str]) -> np.ndarray:
+        """
+        Encode texts on the embedding server
+
+        Args:
+            op: Protocol operation (queries or documents)
+            texts: Texts to encode
+
+        Returns:
+            float32 array with one row per text
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is None:
+            self._loop = loop
+            self._pool = asyncio.Queue()
+
+        if loop is not self._loop:
+            # Pooled streams belong to the worker's main loop; use a one-off connection here
+            reader, writer = await self._open_connection()
+            try:
+                return await self._exchange(reader, writer, op, texts)
+            finally:
+                writer.close()
+
+        connection = await self._acquire()
+        healthy = False
+
+        try:
+            vectors = await self._exchange(*connection, op, texts)
+            healthy = True
+            return vectors
+        except EmbeddingServerError:
+            healthy = True
+            raise
+        finally:
+            self._release(connection, healthy)
+
+    async def _exchange(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        op: str,
+        texts: List[str]
+    ) -> np.ndarray:
+        """Send one request and wait for its response"""
+        await write_request(writer, op, texts)
+        return await asyncio.wait_for(read_response(reader), timeout=self.timeout)
+
+    async def close(self) -> None:
+        """Close all pooled connections"""
+        if self._pool is None:
+            return
+        while not self._pool.empty():
+            _, writer = self._pool.get_nowait()
+            try:
+                writer.close()
+                await writer.wait_closed()
+            except Exception:
+                pass
+        self._opened = 0
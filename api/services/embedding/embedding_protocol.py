@@ -0,0 +1,81 @@
+"""
+Wire protocol between API workers and the shared embedding server
+
+Request:  uint32 payload length + UTF-8 JSON {"op": "queries" | "documents", "texts": [...]}
+Response: uint8 status, then
+          status OK:    uint32 rows + uint32 dim + rows * dim float32 (little endian)
+          status ERROR: uint32 length + UTF-8 error message
+"""
+import asyncio
+import json
+import struct
+from typing import List, Tuple
+
+import numpy as np
+
+STATUS_OK = 0
+STATUS_ERROR = 1
+
+OP_QUERIES = "queries"
+OP_DOCUMENTS = "documents"
+
+_UINT32 = struct.Struct("<I")
+_MATRIX_HEADER = struct.Struct("<II")
+
+
+class EmbeddingServerError(RuntimeError):
+    """Raised on the client when the embedding server reports a failure"""
+
+
+async def write_request(writer: asyncio.StreamWriter, op: str, texts: List[str]) -> None:
+    """Send one encode request"""
+    payload = json.dumps({"op": op, "texts": texts}, ensure_ascii=False).encode("utf-8")
+    writer.write(_UINT32.pack(len(payload)))
+    writer.write(payload)
+    await writer.drain()
+
+
+async def read_request(reader: asyncio.StreamReader) -> Tuple[str, List[str]]:
+    """Receive one encode request"""
+    (length,) = _UINT32.unpack(await reader.readexactly(_UINT32.size))
+    payload = json.loads(await reader.readexactly(length))
+    return payload["op"], payload["texts"]
+
+
+async def write_vectors(writer: asyncio.StreamWriter, vectors: np.ndarray) -> None:
+    """Send an embedding matrix; the contiguous float32 buffer is written without an extra copy"""
+    matrix = np.ascontiguousarray(vectors, dtype=np.float32)
+    if matrix.ndim == 1:
+        matrix = matrix.reshape(1, -1)
+    rows, dim = matrix.shape
+    writer.write(bytes([STATUS_OK]))
+    writer.write(_MATRIX_HEADER.pack(rows, dim))
+    writer.write(memoryview(matrix).cast("B"))
+    await writer.drain()
+
+
+async def write_error(writer: asyncio.StreamWriter, message: str) -> None:
+    """Send an error response"""
+    data = message.encode("utf-8")
+    writer.write(bytes([STATUS_ERROR]))
+    writer.write(_UINT32.pack(len(data)))
+    writer.write(data)
+    await writer.drain()
+
+
+async def read_response(reader: asyncio.StreamReader) -> np.ndarray:
+    """
+    Receive an embedding matrix
+
+    The returned array is a read-only view over the received buffer (no per-element copy).
+    """
+    status = (await reader.readexactly(1))[0]
+
+    if status != STATUS_OK:
+        (length,) = _UINT32.unpack(await reader.readexactly(_UINT32.size))
+        message = (await reader.readexactly(length)).decode("utf-8", errors="replace")
+        raise EmbeddingServerError(message)
+
+    rows, dim = _MATRIX_HEADER.unpack(await reader.readexactly(_MATRIX_HEADER.size))
+    buffer = await reader.readexactly(rows * dim * 4)
+    return np.frombuffer(buffer, dtype=np.float32).reshape(rows, dim)
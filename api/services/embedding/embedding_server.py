@@ -0,0 +1,110 @@
+"""
+Shared embedding server
+One local process owns the embedding model; API workers connect over a Unix socket.
+
+Run with: python -m services.embedding.embedding_server
+"""
+import asyncio
+import os
+import signal
+
+from config.settings import get_settings
+from services.embedding.embedding_protocol import (
+    OP_DOCUMENTS,
+    OP_QUERIES,
+    read_request,
+    write_error,
+    write_vectors,
+)
+from services.embedding.embedding_service import EmbeddingService
+from utils.logging import get_logger
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+
+class EmbeddingServer:
+    """
+    Serves encode requests from all API workers on the node.
+    Query requests from every connection go through the same micro-batcher,
+    so batching stays efficient across workers.
+    """
+
+    def __init__(self, socket_path: str):
+        self.socket_path = socket_path
+        self.service = EmbeddingService(use_server=False, use_query_cache=False, use_chunk_store=False)
+        self._server = None
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve requests on one worker connection until it closes"""
+        try:
+            while True:
+                try:
+                    op, texts = await read_request(reader)
+                except asyncio.IncompleteReadError:
+                    break
+
+                try:
+                    if op == OP_QUERIES:
+                        result = await self.service.encode_queries(texts)
+                    elif op == OP_DOCUMENTS:
+                        result = await self.service.encode_documents(texts)
+                    else:
+                        await write_error(writer, f"Unknown operation: {op}")
+                        continue
+                except Exception as e:
+                    logger.error(f"Embedding server failed to encode {len(texts)} texts: {e}")
+                    await write_error(writer, str(e))
+                    continue
+
+                await write_vectors(writer, result["dense_vectors"])
+
+        except (ConnectionResetError, BrokenPipeError):
+            pass
+        except Exception as e:
+            logger.error(f"Embedding server connection error: {e}")
+        finally:
+            writer.close()
+
+    async def serve(self) -> None:
+        """Listen on the Unix socket until cancelled"""
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+        await self.service.warmup()
+        configured = f"{settings.EMBEDDING_MODEL_REVISION}:{settings.EMBEDDING_BACKEND}"
+        if self.service.model_version != configured:
+            # Workers key their caches by the configured backend and cannot see the fallback
+            raise RuntimeError(
+                f"Embedding server loaded {self.service.model_version} instead of {configured}"
+            )
+        self._server = await asyncio.start_unix_server(self._handle_connection, path=self.socket_path)
+        os.chmod(self.socket_path, 0o660)
+        logger.info(f"Embedding server listening on {self.socket_path}")
+
+        try:
+            async with self._server:
+                await self._server.serve_forever()
+        finally:
+            await self.service.shutdown()
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+            logger.info("Embedding server stopped")
+
+
+async def main() -> None:
+    server = EmbeddingServer(settings.EMBEDDING_SERVER_SOCKET)
+    task = asyncio.create_task(server.serve())
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, task.cancel)
+
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
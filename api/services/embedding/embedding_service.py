@@ -1,10 +1,18 @@
 """
 Embedding service implementation using Hugging Face BAAI/bge-m3
 """
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
 import numpy as np
-from sentence_transformers import SentenceTransformer
 from config.settings import get_settings
+from services.embedding.embedding_backends import EmbeddingBackend, create_embedding_backend
+from services.embedding.embedding_batcher import EmbeddingBatcher
+from services.embedding.chunk_embedding_store import ChunkEmbeddingStore, chunk_content_hash
+from services.embedding.embedding_client import EmbeddingClient
+from services.embedding.embedding_protocol import OP_DOCUMENTS, OP_QUERIES
+from services.embedding.query_embedding_cache import QueryEmbeddingCache
+from utils.lazy_model import LazyModel, model_registry
 from utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -13,27 +21,120 @@ settings = get_settings()
 
 class EmbeddingService:
     """
-    BGE-M3 embedding service using sentence-transformers
+    BGE-M3 embedding service with a selectable backend (sentence-transformers or ONNX int8)
+    Model calls run on a dedicated thread; concurrent query encodes are micro-batched.
+    In embedding-server mode the service is a thin client and no model is loaded in-process.
+    The backend is loaded lazily (first encode or lifespan warm-up), not at import time.
+    model_version names the backend that actually loaded (ONNX falls back to torch), so cached
+    vectors of one backend are never served for the other.
     """
     
-    def __init__(self):
-        self.model = None
-        self._initialize_model()
+    def __init__(
+        self,
+        use_server: Optional[bool] = None,
+        use_query_cache: Optional[bool] = None,
+        use_chunk_store: Optional[bool] = None
+    ):
+        self._model_handle: Optional[LazyModel[EmbeddingBackend]] = None
+        self.model_name = settings.EMBEDDING_MODEL
+        self.model_version = f"{settings.EMBEDDING_MODEL_REVISION}:{settings.EMBEDDING_BACKEND}"
+        self.use_server = settings.EMBEDDING_SERVER_ENABLED if use_server is None else use_server
+        self._client: Optional[EmbeddingClient] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._query_batcher: Optional[EmbeddingBatcher] = None
+        self._query_cache: Optional[QueryEmbeddingCache] = None
+        self._chunk_store: Optional[ChunkEmbeddingStore] = None
+
+        if settings.EMBEDDING_QUERY_CACHE_ENABLED if use_query_cache is None else use_query_cache:
+            self._query_cache = QueryEmbeddingCache(
+                model_name=self.model_name,
+                model_version=self.model_version,
+                normalize_embeddings=True,
+                max_entries=settings.EMBEDDING_QUERY_CACHE_L1_SIZE,
+                ttl_seconds=settings.EMBEDDING_QUERY_CACHE_TTL_S
+            )
+
+        if settings.EMBEDDING_CHUNK_STORE_ENABLED if use_chunk_store is None else use_chunk_store:
+            self._chunk_store = ChunkEmbeddingStore(
+                model_name=self.model_name,
+                model_version=self.model_version,
+                ttl_seconds=settings.EMBEDDING_CHUNK_STORE_TTL_S
+            )
+
+        if self.use_server:
+            self._client = EmbeddingClient(
+                socket_path=settings.EMBEDDING_SERVER_SOCKET,
+                pool_size=settings.EMBEDDING_SERVER_POOL_SIZE,
+                timeout=settings.EMBEDDING_SERVER_TIMEOUT_S
+            )
+            logger.info(f"Embedding service using shared embedding server at {settings.EMBEDDING_SERVER_SOCKET}")
+            return
+
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="embedding")
+        self._model_handle = model_registry.register("embedding", self._initialize_model)
+        self._query_batcher = EmbeddingBatcher(
+            encode_fn=self._encode,
+            executor=self._executor,
+            max_batch_size=settings.EMBEDDING_QUERY_BATCH_SIZE,
+            max_wait_ms=settings.EMBEDDING_BATCH_MAX_WAIT_MS
+        )
     
-    def _initialize_model(self):
-        """Initialize BGE-M3 model using sentence-transformers"""
+    def _initialize_model(self) -> EmbeddingBackend:
+        """Initialize the BGE-M3 backend selected by EMBEDDING_BACKEND (torch or onnx_int8)"""
         try:
-            self.model = SentenceTransformer(
-                'BAAI/bge-m3',
-                device=settings.DEVICE,
-                trust_remote_code=True
-            )
-            
-            logger.info("BGE-M3 embedding model initialized successfully using sentence-transformers")
+            backend = create_embedding_backend(settings.EMBEDDING_BACKEND)
+            logger.info(f"BGE-M3 embedding model initialized successfully using {backend.name} backend")
+            return backend
             
         except Exception as e:
             logger.error(f"Failed to initialize BGE-M3 model: {e}")
             raise
+
+    @property
+    def backend(self) -> Optional[EmbeddingBackend]:
+        """Loaded backend, loading it on first access (blocking; None in server mode)"""
+        return self._model_handle.get() if self._model_handle else None
+
+    @property
+    def model(self) -> Optional[EmbeddingBackend]:
+        return self.backend
+
+    @property
+    def is_ready(self) -> bool:
+        """Whether encodes can run without waiting for a model load"""
+        return self._model_handle is None or self._model_handle.is_ready
+
+    async def warmup(self) -> None:
+        """Load the backend without blocking the event loop"""
+        if self._model_handle:
+            backend = await self._model_handle.aget()
+            self._use_backend_version(backend.name)
+
+    def _use_backend_version(self, backend_name: str) -> None:
+        """Key caches by the backend that loaded rather than the configured one"""
+        model_version = f"{settings.EMBEDDING_MODEL_REVISION}:{backend_name}"
+        if model_version == self.model_version:
+            return
+        logger.warning(f"Embedding model version is {model_version} (configured {self.model_version})")
+        self.model_version = model_version
+        if self._query_cache:
+            self._query_cache.model_version = model_version
+        if self._chunk_store:
+            self._chunk_store.model_version = model_version
+
+    def _encode(self, texts: List[str]) -> np.ndarray:
+        """Blocking model call, executed on the embedding thread (first call loads the backend)"""
+        return self.backend.encode(texts, batch_size=settings.EMBEDDING_BATCH_SIZE)
+
+    def _encode_documents_sync(self, texts: List[str]) -> np.ndarray:
+        """Blocking document encode with length bucketing, executed on the embedding thread"""
+        if not settings.EMBEDDING_LENGTH_BUCKETING_ENABLED or self.backend.tokenizer is None:
+            return self._encode(texts)
+        return self.backend.encode_bucketed(
+            texts,
+            max_batch_tokens=settings.EMBEDDING_MAX_BATCH_TOKENS,
+            max_batch_size=settings.EMBEDDING_MAX_DOCUMENT_BATCH_SIZE
+        )
     
     async def encode_documents(self, documents: List[str]) -> Dict[str, Any]:
         """
@@ -49,13 +150,10 @@ class EmbeddingService:
             if not documents:
                 return {"dense_vectors": []}
             
-            embeddings = self.model.encode(
-                documents,
-                batch_size=settings.EMBEDDING_BATCH_SIZE,
-                normalize_embeddings=True,
-                convert_to_numpy=True,
-                show_progress_bar=False
-            )
+            if self._chunk_store:
+                embeddings = await self._encode_documents_deduplicated(documents)
+            else:
+                embeddings = await self._encode_documents_uncached(documents)
             
             return {
                 "dense_vectors": embeddings
@@ -65,6 +163,43 @@ class EmbeddingService:
             logger.error(f"Document encoding failed: {e}")
             raise
     
+    async def _encode_documents_uncached(self, documents: List[str]) -> np.ndarray:
+        """Encode documents through the embedding server or the local embedding thread"""
+        if self._client:
+            return await self._client.encode(OP_DOCUMENTS, documents)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._encode_documents_sync, documents)
+
+    async def _encode_documents_deduplicated(self, documents: List[str]) -> np.ndarray:
+        """
+        Encode only chunks whose content hash is neither repeated in this call
+        nor already in the chunk embedding store
+        """
+        await self.warmup()
+        hashes = [chunk_content_hash(text) for text in documents]
+        first_index: Dict[str, int] = {}
+        for i, content_hash in enumerate(hashes):
+            first_index.setdefault(content_hash, i)
+
+        unique_hashes = list(first_index)
+        stored = await self._chunk_store.get_many(unique_hashes)
+        vectors: Dict[str, np.ndarray] = {
+            content_hash: vector for content_hash, vector in zip(unique_hashes, stored) if vector is not None
+        }
+
+        missing = [content_hash for content_hash in unique_hashes if content_hash not in vectors]
+        if missing:
+            fresh = await self._encode_documents_uncached([documents[first_index[h]] for h in missing])
+            await self._chunk_store.set_many(missing, fresh)
+            for row, content_hash in enumerate(missing):
+                vectors[content_hash] = fresh[row]
+
+        logger.info(
+            f"Encoded {len(missing)}/{len(documents)} document chunks "
+            f"({len(documents) - len(missing)} reused from duplicates or the chunk store)"
+        )
+        return np.vstack([vectors[content_hash] for content_hash in hashes]).astype(np.float32, copy=False)
+    
     async def encode_queries(self, queries: List[str]) -> Dict[str, Any]:
         """
         Encode queries for search
@@ -79,13 +214,10 @@ class EmbeddingService:
             if not queries:
                 return {"dense_vectors": []}
             
-            embeddings = self.model.encode(
-                queries,
-                batch_size=settings.EMBEDDING_BATCH_SIZE,
-                normalize_embeddings=True,
-                convert_to_numpy=True,
-                show_progress_bar=False
-            )
+            if self._query_cache:
+                embeddings = await self._encode_queries_cached(queries)
+            else:
+                embeddings = await self._encode_queries_uncached(queries)
             
             return {
                 "dense_vectors": embeddings
@@ -94,6 +226,33 @@ class EmbeddingService:
         except Exception as e:
             logger.error(f"Query encoding failed: {e}")
             raise
+
+    async def _encode_queries_uncached(self, queries: List[str]) -> np.ndarray:
+        """Encode queries through the embedding server or the local micro-batcher"""
+        if self._client:
+            return await self._client.encode(OP_QUERIES, queries)
+        return await self._query_batcher.submit(queries)
+
+    async def _encode_queries_cached(self, queries: List[str]) -> np.ndarray:
+        """Serve queries from the query embedding cache, encoding only the misses"""
+        await self.warmup()
+        vectors = await self._query_cache.get_many(queries)
+        missing = [i for i, vector in enumerate(vectors) if vector is None]
+
+        if missing:
+            missing_queries = [queries[i] for i in missing]
+            fresh = await self._encode_queries_uncached(missing_queries)
+            await self._query_cache.set_many(missing_queries, fresh)
+            for row, i in enumerate(missing):
+                vectors[i] = fresh[row]
+
+        return np.vstack(vectors).astype(np.float32, copy=False)
+
+    def get_query_cache_stats(self) -> Dict[str, Any]:
+        """Get query embedding cache statistics for this process"""
+        if not self._query_cache:
+            return {"enabled": False}
+        return {"enabled": True, **self._query_cache.get_stats()}
     
     def compute_similarity(
         self, 
@@ -111,11 +270,11 @@ class EmbeddingService:
             List of similarity scores
         """
         try:
-            scores = []
-            for doc_emb in doc_embeddings:
-                score = np.dot(query_embedding, doc_emb)
-                scores.append(float(score))
-            return scores
+            if len(doc_embeddings) == 0:
+                return []
+            matrix = np.asarray(doc_embeddings, dtype=np.float32)
+            scores = matrix @ np.asarray(query_embedding, dtype=np.float32)
+            return scores.tolist()
                 
         except Exception as e:
             logger.error(f"Similarity computation failed: {e}")
@@ -125,4 +284,13 @@ class EmbeddingService:
         """Get embedding dimension"""
         return 1024 
 
+    async def shutdown(self) -> None:
+        """Stop the query batcher and release the embedding thread or server connections"""
+        if self._client:
+            await self._client.close()
+            return
+        await self._query_batcher.shutdown()
+        self._executor.shutdown(wait=False)
+
+
 embedding_service = EmbeddingService()
\ No newline at end of file
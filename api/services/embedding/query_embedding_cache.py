@@ -0,0 +1,158 @@
+"""
+Two-tier cache for query embeddings
+L1: bounded in-process LRU; L2: Redis with float16-packed vectors shared by all workers
+"""
+import hashlib
+import re
+import threading
+import unicodedata
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from services.cache.redis_service import redis_client
+from workflows.monitoring.prometheus import EMBEDDING_QUERY_CACHE_REQUESTS
+from utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_query_text(text: str) -> str:
+    """Normalize query text for cache keys (Unicode NFKC, collapsed whitespace)"""
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFKC", text)).strip()
+
+
+class QueryEmbeddingCache:
+    """
+    Query embedding cache keyed by model name, model version, normalization flag
+    and a hash of the normalized query text. Changing the model or its version
+    changes every key, so stale vectors are never served after a model swap.
+    """
+
+    KEY_PREFIX = "emb:query"
+
+    def __init__(
+        self,
+        model_name: str,
+        model_version: str,
+        normalize_embeddings: bool = True,
+        max_entries: int = 2048,
+        ttl_seconds: int = 86400
+    ):
+        self.model_name = model_name
+        self.model_version = model_version
+        self.normalize_embeddings = normalize_embeddings
+        self.max_entries = max(1, max_entries)
+        self.ttl_seconds = ttl_seconds
+        self._l1: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {
+            "l1_hits": 0,
+            "l2_hits": 0,
+            "misses": 0,
+            "l2_errors": 0
+        }
+
+    def build_key(self, text: str) -> str:
+        """Build the cache key for a query text"""
+        digest = hashlib.sha256(normalize_query_text(text).encode("utf-8")).hexdigest()
+        return (
+            f"{self.KEY_PREFIX}:{self.model_name}:{self.model_version}:"
+            f"{int(self.normalize_embeddings)}:{digest}"
+        )
+
+    def _l1_get(self, key: str) -> Optional[np.ndarray]:
+        with self._lock:
+            vector = self._l1.get(key)
+            if vector is not None:
+                self._l1.move_to_end(key)
+            return vector
+
+    def _l1_put(self, key: str, vector: np.ndarray) -> None:
+        with self._lock:
+            self._l1[key] = vector
+            self._l1.move_to_end(key)
+            while len(self._l1) > self.max_entries:
+                self._l1.popitem(last=False)
+
+    async def get_many(self, texts: List[str]) -> List[Optional[np.ndarray]]:
+        """
+        Look up query embeddings
+
+        Returns:
+            One entry per text: the cached float32 vector, or None on a miss
+        """
+        keys = [self.build_key(text) for text in texts]
+        results: List[Optional[np.ndarray]] = [self._l1_get(key) for key in keys]
+
+        l1_hits = sum(1 for vector in results if vector is not None)
+        if l1_hits:
+            self._stats["l1_hits"] += l1_hits
+            EMBEDDING_QUERY_CACHE_REQUESTS.labels(tier="l1", result="hit").inc(l1_hits)
+
+        missing = [i for i, vector in enumerate(results) if vector is None]
+        if not missing:
+            return results
+        EMBEDDING_QUERY_CACHE_REQUESTS.labels(tier="l1", result="miss").inc(len(missing))
+
+        l2_hits = 0
+        try:
+            client = redis_client.get_binary_client()
+            if client:
+                values = await client.mget([keys[i] for i in missing])
+                for i, value in zip(missing, values):
+                    if value is None:
+                        continue
+                    vector = np.frombuffer(value, dtype=np.float16).astype(np.float32)
+                    results[i] = vector
+                    self._l1_put(keys[i], vector)
+                    l2_hits += 1
+        except Exception as e:
+            self._stats["l2_errors"] += 1
+            logger.warning(f"Query embedding cache L2 lookup failed: {e}")
+
+        l2_misses = len(missing) - l2_hits
+        self._stats["l2_hits"] += l2_hits
+        self._stats["misses"] += l2_misses
+        if l2_hits:
+            EMBEDDING_QUERY_CACHE_REQUESTS.labels(tier="l2", result="hit").inc(l2_hits)
+        if l2_misses:
+            EMBEDDING_QUERY_CACHE_REQUESTS.labels(tier="l2", result="miss").inc(l2_misses)
+
+        return results
+
+    async def set_many(self, texts: List[str], vectors: np.ndarray) -> None:
+        """Store freshly computed query embeddings in both tiers"""
+        keys = [self.build_key(text) for text in texts]
+
+        for key, vector in zip(keys, vectors):
+            self._l1_put(key, np.asarray(vector, dtype=np.float32))
+
+        try:
+            client = redis_client.get_binary_client()
+            if client:
+                pipe = client.pipeline(transaction=False)
+                for key, vector in zip(keys, vectors):
+                    pipe.set(key, np.asarray(vector, dtype=np.float16).tobytes(), ex=self.ttl_seconds)
+                await pipe.execute()
+        except Exception as e:
+            self._stats["l2_errors"] += 1
+            logger.warning(f"Query embedding cache L2 store failed: {e}")
+
+    def clear_local(self) -> None:
+        """Clear the in-process tier"""
+        with self._lock:
+            self._l1.clear()
+
+    def get_stats(self) -> Dict[str, float]:
+        """Get cache hit/miss statistics for this process"""
+        lookups = self._stats["l1_hits"] + self._stats["l2_hits"] + self._stats["misses"]
+        hits = self._stats["l1_hits"] + self._stats["l2_hits"]
+        return {
+            **self._stats,
+            "l1_size": len(self._l1),
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0
+        }
@@ -12,6 +12,9 @@ from config.settings import get_settings
 logger = get_logger(__name__)
 settings = get_settings()
 
+# Message type of ingestion jobs; progress events on a shared topic carry no type
+INGESTION_JOB_TYPE = "ingestion_job"
+
 try:
     from aiokafka import AIOKafkaProducer, AIOKafkaConsumer
     AIOKAFKA_AVAILABLE = True
@@ -34,6 +37,7 @@ class KafkaService:
         # Get settings from config
         self._bootstrap_servers = settings.KAFKA_BOOTSTRAP_SERVERS
         self._document_topic = settings.KAFKA_DOCUMENT_TOPIC
+        self._ingestion_topic = settings.KAFKA_INGESTION_TOPIC
         self._consumer_group = settings.KAFKA_CONSUMER_GROUP
         
         if not AIOKAFKA_AVAILABLE:
@@ -146,10 +150,58 @@ class KafkaService:
             logger.error(f"Failed to publish document progress: {e}")
             return False
     
+    async def publish_ingestion_job(self, tenant_id: str, department_id: str, document_id: str) -> bool:
+        """
+        Enqueue a stored document for the ingestion worker
+        
+        Args:
+            tenant_id: Tenant ID
+            department_id: Department ID
+            document_id: Document ID (object and DB row already exist)
+            
+        Returns:
+            True if published successfully, False otherwise
+        """
+        if not AIOKAFKA_AVAILABLE:
+            logger.info(f"Kafka ingestion job (skipped): {tenant_id}/{department_id}/{document_id}")
+            return False
+            
+        if not self._is_producer_running:
+            await self.start_producer()
+            
+        if not self._producer:
+            logger.warning("Kafka producer not available")
+            return False
+            
+        try:
+            payload = {
+                "type": INGESTION_JOB_TYPE,
+                "timestamp": datetime.utcnow().isoformat(),
+                "tenant_id": tenant_id,
+                "department_id": department_id,
+                "document_id": document_id,
+                "service": "document_service"
+            }
+            
+            await self._producer.send_and_wait(
+                topic=self._ingestion_topic,
+                value=payload,
+                key=document_id
+            )
+            
+            logger.debug(f"Published ingestion job: {tenant_id}/{document_id}")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Failed to publish ingestion job: {e}")
+            return False
+    
     async def start_consumer(
         self, 
         message_handler: Callable[[Dict[str, Any]], None],
-        topics: Optional[List[str]] = None
+        topics: Optional[List[str]] = None,
+        group_id: Optional[str] = None,
+        **consumer_config: Any
     ) -> None:
         """
         Start Kafka consumer with message handler
@@ -157,6 +209,8 @@ class KafkaService:
         Args:
             message_handler: Async function to handle received messages
             topics: List of topics to subscribe (defaults to document topic)
+            group_id: Consumer group (defaults to KAFKA_CONSUMER_GROUP)
+            consumer_config: Overrides of the AIOKafkaConsumer options below
         """
         if not AIOKAFKA_AVAILABLE:
             logger.info("Kafka consumer start skipped - aiokafka not available")
@@ -166,23 +220,28 @@ class KafkaService:
             return
             
         consumer_topics = topics or [self._document_topic]
+        consumer_group = group_id or self._consumer_group
+        options = {
+            "auto_offset_reset": 'latest',
+            "enable_auto_commit": True,
+            "auto_commit_interval_ms": 1000,
+            "max_poll_records": 100,
+        }
+        options.update(consumer_config)
         
         try:
             self._consumer = AIOKafkaConsumer(
                 *consumer_topics,
                 bootstrap_servers=self._bootstrap_servers,
-                group_id=self._consumer_group,
+                group_id=consumer_group,
                 value_deserializer=lambda m: json.loads(m.decode('utf-8')),
                 key_deserializer=lambda k: k.decode('utf-8') if k else None,
-                auto_offset_reset='latest',
-                enable_auto_commit=True,
-                auto_commit_interval_ms=1000,
-                max_poll_records=100
+                **options
             )
             
             await self._consumer.start()
             self._is_consumer_running = True
-            logger.info(f"Kafka consumer started - topics: {consumer_topics}, group: {self._consumer_group}")
+            logger.info(f"Kafka consumer started - topics: {consumer_topics}, group: {consumer_group}")
             
             asyncio.create_task(self._consume_messages(message_handler))
             
@@ -258,6 +317,7 @@ class KafkaService:
             "consumer_running": self._is_consumer_running,
             "bootstrap_servers": self._bootstrap_servers,
             "document_topic": self._document_topic,
+            "ingestion_topic": self._ingestion_topic,
             "consumer_group": self._consumer_group
         }
     
@@ -0,0 +1,235 @@
+"""
+Milvus bulk import for large backfills
+Chunks are embedded and written as Parquet files (one per MILVUS_BULK_IMPORT_ROWS_PER_FILE rows) into
+MinIO, then Milvus imports the files server-side instead of receiving row-based inserts. Milvus reads
+import files from its own storage bucket, so files are staged there under
+{MILVUS_BULK_IMPORT_PREFIX}/{tenant_id}/{job_id}/ and removed once the import has finished.
+"""
+import asyncio
+import json
+import time
+from io import BytesIO
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, Optional
+
+import numpy as np
+
+from services.embedding.embedding_service import embedding_service
+from services.storage.minio_service import minio_service
+from services.vector.collection_layout import resolve_collection
+from services.vector.vector_store import BACKEND_LOCAL
+from common.types import DBDocumentPermissionLevel
+from config.settings import get_settings
+from utils.logging import get_logger
+
+if TYPE_CHECKING:
+    from services.vector.milvus_service import MilvusService
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+    logger.warning("pyarrow package not available - Milvus bulk import disabled")
+
+try:
+    from pymilvus.bulk_writer import bulk_import, get_import_progress
+    BULK_IMPORT_AVAILABLE = True
+except ImportError:
+    BULK_IMPORT_AVAILABLE = False
+    logger.warning("pymilvus.bulk_writer not available - Milvus bulk import disabled")
+
+# Milvus accepts at most this many files per import job
+MAX_FILES_PER_JOB = 1024
+
+IMPORT_STATE_COMPLETED = "Completed"
+IMPORT_STATE_FAILED = "Failed"
+
+ProgressCallback = Callable[[int, int], Awaitable[None]]
+
+
+def rows_to_parquet(rows: List[Dict[str, Any]], dimension: int) -> bytes:
+    """
+    Serialize insert rows (see MilvusService._build_insert_rows) as a Parquet file in Milvus import layout:
+    vector as list<float32>, the JSON field as a string, other scalars as-is
+    """
+    vectors = np.asarray([row["vector"] for row in rows], dtype=np.float32).reshape(-1)
+    offsets = np.arange(0, len(rows) * dimension + 1, dimension, dtype=np.int32)
+    columns = {
+        "vector": pa.ListArray.from_arrays(pa.array(offsets), pa.array(vectors)),
+        "text": pa.array([row["text"] for row in rows], type=pa.string()),
+        "document_id": pa.array([row["document_id"] for row in rows], type=pa.string()),
+        "chunk_id": pa.array([row.get("chunk_id", "") for row in rows], type=pa.string()),
+        "department": pa.array([row["department"] for row in rows], type=pa.string()),
+        "document_source": pa.array([row["document_source"] for row in rows], type=pa.string()),
+        "metadata": pa.array(
+            [json.dumps(row.get("metadata") or {}, ensure_ascii=False, default=str) for row in rows],
+            type=pa.string()
+        ),
+        "created_at": pa.array([row["created_at"] for row in rows], type=pa.int64()),
+    }
+    extra_fields = sorted(set(rows[0]) - set(columns) - {"vector"}) if rows else []
+    for field in extra_fields:
+        columns[field] = pa.array([row.get(field) for row in rows], type=pa.string())
+
+    buffer = BytesIO()
+    pq.write_table(pa.table(columns), buffer, compression="zstd")
+    return buffer.getvalue()
+
+
+class BulkImportWriter:
+    """
+    Stages embedded chunks of one logical collection as Parquet and imports them into Milvus
+
+    Usage:
+        writer = BulkImportWriter(milvus_service, collection_name, milvus_instance, tenant_id, job_id)
+        await writer.open()
+        await writer.add_documents(documents)   # repeatedly, documents as for insert_documents
+        imported = await writer.finish(on_progress)
+    """
+
+    def __init__(
+        self,
+        service: "MilvusService",
+        collection_name: str,
+        milvus_instance: str,
+        tenant_id: str,
+        job_id: str,
+        rows_per_file: Optional[int] = None
+    ):
+        self.service = service
+        self.collection_name = collection_name
+        self.milvus_instance = milvus_instance
+        self.target = resolve_collection(collection_name)
+        self.bucket = settings.MILVUS_BULK_IMPORT_BUCKET
+        self.prefix = f"{settings.MILVUS_BULK_IMPORT_PREFIX}/{tenant_id}/{job_id}"
+        self.rows_per_file = max(1, rows_per_file or settings.MILVUS_BULK_IMPORT_ROWS_PER_FILE)
+        self.created_at = int(time.time() * 1000)
+        self.staged_files: List[str] = []
+        self.staged_rows = 0
+        self._buffer: List[Dict[str, Any]] = []
+
+    @property
+    def url(self) -> str:
+        """REST endpoint of the target instance (served on the gRPC port in Milvus 2.6)"""
+        if self.milvus_instance == DBDocumentPermissionLevel.PRIVATE.value:
+            return settings.MILVUS_PRIVATE_URI
+        return settings.MILVUS_PUBLIC_URI
+
+    async def open(self) -> None:
+        """Make sure the Milvus collection and the staging bucket exist"""
+        if not (PYARROW_AVAILABLE and BULK_IMPORT_AVAILABLE):
+            raise RuntimeError("Milvus bulk import requires pyarrow and pymilvus.bulk_writer")
+        if settings.VECTOR_STORE_BACKEND == BACKEND_LOCAL:
+            raise RuntimeError("Milvus bulk import is not available with the local vector store backend")
+
+        # A backfill is large by definition: collections still served locally move to Milvus first
+        if self.service.local_store and await self.service.local_store.has_collection(self.collection_name):
+            await self.service._promote_local_collection(self.collection_name, self.milvus_instance)
+        await self.service._ensure_milvus_collection(self.target, self.milvus_instance)
+        await minio_service.ensure_bucket(self.bucket)
+
+    async def add_documents(self, documents: List[Dict[str, Any]]) -> None:
+        """Embed documents in MILVUS_INSERT_BATCH_SIZE windows and buffer their rows, staging full files"""
+        window = max(1, settings.MILVUS_INSERT_BATCH_SIZE)
+        for start in range(0, len(documents), window):
+            batch = documents[start:start + window]
+            embeddings = await embedding_service.encode_documents([doc["text"] for doc in batch])
+            self._buffer.extend(
+                self.service._build_insert_rows(batch, embeddings["dense_vectors"], self.target, self.created_at)
+            )
+            while len(self._buffer) >= self.rows_per_file:
+                await self._flush(self._buffer[:self.rows_per_file])
+                self._buffer = self._buffer[self.rows_per_file:]
+
+    async def _flush(self, rows: List[Dict[str, Any]]) -> None:
+        if not rows:
+            return
+        data = await asyncio.to_thread(rows_to_parquet, rows, settings.EMBEDDING_DIMENSIONS)
+        key = f"{self.prefix}/part-{len(self.staged_files):05d}.parquet"
+        await minio_service.put_bytes(self.bucket, key, data, "application/vnd.apache.parquet")
+        self.staged_files.append(key)
+        self.staged_rows += len(rows)
+        logger.debug(f"Staged {len(rows)} rows for {self.target.physical_name} at {self.bucket}/{key}")
+
+    async def submit(self) -> List[str]:
+        """Stage buffered rows and start import jobs; returns Milvus job ids"""
+        await self._flush(self._buffer)
+        self._buffer = []
+
+        job_ids = []
+        for start in range(0, len(self.staged_files), MAX_FILES_PER_JOB):
+            files = [[key] for key in self.staged_files[start:start + MAX_FILES_PER_JOB]]
+            response = await asyncio.to_thread(
+                bulk_import,
+                url=self.url,
+                collection_name=self.target.physical_name,
+                files=files
+            )
+            body = response.json()
+            if body.get("code", 0) != 0:
+                raise RuntimeError(f"Bulk import of {self.target.physical_name} rejected: {body.get('message')}")
+            job_ids.append(str(body["data"]["jobId"]))
+
+        logger.info(
+            f"Submitted {len(job_ids)} import jobs ({len(self.staged_files)} files, {self.staged_rows} rows) "
+            f"into {self.target.physical_name} on {self.milvus_instance}"
+        )
+        return job_ids
+
+    async def wait(self, job_ids: List[str], on_progress: Optional[ProgressCallback] = None) -> int:
+        """
+        Poll import jobs until all finished
+
+        Args:
+            on_progress: Awaited with (percent, imported rows) after every poll
+
+        Returns:
+            Number of imported rows
+
+        Raises:
+            RuntimeError: If a job failed
+        """
+        states: Dict[str, Dict[str, Any]] = {job_id: {} for job_id in job_ids}
+        while True:
+            for job_id, state in states.items():
+                if state.get("state") == IMPORT_STATE_COMPLETED:
+                    continue
+                response = await asyncio.to_thread(get_import_progress, url=self.url, job_id=job_id)
+                data = response.json().get("data") or {}
+                if data.get("state") == IMPORT_STATE_FAILED:
+                    raise RuntimeError(f"Import job {job_id} into {self.target.physical_name} failed: {data.get('reason')}")
+                states[job_id] = data
+
+            percent = int(sum(int(state.get("progress", 0)) for state in states.values()) / max(1, len(states)))
+            imported = sum(int(state.get("importedRows", 0)) for state in states.values())
+            if on_progress:
+                await on_progress(percent, imported)
+            if all(state.get("state") == IMPORT_STATE_COMPLETED for state in states.values()):
+                return imported
+            await asyncio.sleep(settings.MILVUS_BULK_IMPORT_POLL_INTERVAL_S)
+
+    async def cleanup(self) -> None:
+        """Remove staged files (best-effort)"""
+        for key in self.staged_files:
+            try:
+                await minio_service.delete_object(self.bucket, key)
+            except Exception as e:
+                logger.warning(f"Failed to remove staged import file {self.bucket}/{key}: {e}")
+
+    async def finish(self, on_progress: Optional[ProgressCallback] = None) -> int:
+        """Submit, wait for and clean up the import; returns the number of imported rows"""
+        try:
+            job_ids = await self.submit()
+            imported = await self.wait(job_ids, on_progress) if job_ids else 0
+        finally:
+            await self.cleanup()
+            await self.service._invalidate_retrieval_cache(self.collection_name)
+
+        await self.service._ensure_loaded(self.milvus_instance, self.target.physical_name, force_check=True)
+        self.service._schedule_index_profile_check(self.collection_name, self.milvus_instance)
+        logger.info(f"Bulk imported {imported} rows into {self.target.physical_name}")
+        return imported
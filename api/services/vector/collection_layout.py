@@ -0,0 +1,39 @@
+"""
+Milvus storage layout for logical department collections
+- per_collection: one physical collection per {tenant_id}-{department_id}-public/private (legacy)
+- partition_key: one shared collection per instance, logical collections separated by a
+  partition key field, so collection count and loaded indexes no longer grow with tenants
+"""
+from typing import Optional
+
+from config.settings import get_settings
+from services.dataclasses.milvus import CollectionTarget
+
+settings = get_settings()
+
+LAYOUT_PER_COLLECTION = "per_collection"
+LAYOUT_PARTITION_KEY = "partition_key"
+
+PARTITION_KEY_FIELD = "collection_key"
+
+
+def is_partition_key_layout(layout: Optional[str] = None) -> bool:
+    return (layout or settings.MILVUS_COLLECTION_LAYOUT) == LAYOUT_PARTITION_KEY
+
+
+def resolve_collection(logical_name: str, layout: Optional[str] = None) -> CollectionTarget:
+    """
+    Map a logical collection name (as stored in DocumentCollection and returned by the
+    permission layer) to its physical collection and partition key value.
+    The full logical name is the partition value, so public and private data never share
+    a partition even if both instances point at the same Milvus.
+    """
+    if not is_partition_key_layout(layout):
+        return CollectionTarget(logical_name=logical_name, physical_name=logical_name)
+
+    return CollectionTarget(
+        logical_name=logical_name,
+        physical_name=settings.MILVUS_SHARED_COLLECTION_NAME,
+        partition_key_field=PARTITION_KEY_FIELD,
+        partition_value=logical_name
+    )
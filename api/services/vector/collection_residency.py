@@ -0,0 +1,328 @@
+"""
+Collection residency (load/release) management for Milvus
+Loaded collections hold their index in query-node memory, so only recently used collections
+stay loaded. Last access is tracked in a Redis sorted set per instance so that every API worker
+shares one LRU order; cold collections are released when the count or memory budget is exceeded
+or after MILVUS_COLLECTION_IDLE_RELEASE_S without access, and re-loaded (and warmed up) on first use.
+"""
+import asyncio
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+import numpy as np
+
+from services.cache.redis_service import redis_client
+from services.vector.index_profiles import build_search_params, estimate_index_memory_bytes
+from workflows.monitoring.prometheus import (
+    MILVUS_COLLECTION_LOAD_SECONDS,
+    MILVUS_COLLECTION_RELEASES,
+    MILVUS_LOADED_COLLECTIONS,
+)
+from common.types import DBDocumentPermissionLevel
+from config.settings import get_settings
+from utils.logging import get_logger
+
+if TYPE_CHECKING:
+    from services.vector.milvus_service import MilvusService
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+# A collection touched this recently is never released, even over budget; this keeps searches
+# already running in other workers from losing their collection mid-flight
+MIN_IDLE_BEFORE_RELEASE_S = 60
+# Redis last-access updates are throttled per collection and worker
+TOUCH_INTERVAL_S = 10
+
+
+def _is_loaded(load_state: Any) -> bool:
+    state = load_state.get("state") if isinstance(load_state, dict) else load_state
+    name = getattr(state, "name", None) or str(state)
+    return name == "Loaded" or name.endswith(".Loaded")
+
+
+class CollectionResidencyManager:
+    """
+    LRU load/release manager for physical Milvus collections
+
+    Budgets (per instance): MILVUS_MAX_LOADED_COLLECTIONS collections and, when set,
+    MILVUS_LOADED_MEMORY_BUDGET_MB of estimated index memory.
+    """
+
+    KEY_PREFIX = "milvus:residency"
+
+    def __init__(
+        self,
+        service: "MilvusService",
+        max_loaded: int = 64,
+        memory_budget_mb: int = 0,
+        idle_release_s: int = 21600,
+        verify_interval_s: int = 30
+    ):
+        self.service = service
+        self.max_loaded = max_loaded
+        self.memory_budget_bytes = memory_budget_mb * 1024 * 1024
+        self.idle_release_s = idle_release_s
+        self.verify_interval_s = verify_interval_s
+        self._verified: Dict[str, float] = {}
+        self._touched: Dict[str, float] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._sweep_task: Optional[asyncio.Task] = None
+
+    def _access_key(self, milvus_instance: str) -> str:
+        return f"{self.KEY_PREFIX}:access:{milvus_instance}"
+
+    def _memory_key(self, milvus_instance: str) -> str:
+        return f"{self.KEY_PREFIX}:memory:{milvus_instance}"
+
+    async def ensure_loaded(self, milvus_instance: str, physical_name: str, force_check: bool = False) -> None:
+        """
+        Make sure a collection is loaded before it is searched
+
+        The load state is re-checked at most every verify_interval_s (or when force_check is set,
+        e.g. after a "collection not loaded" error), so the hot path is usually a dict lookup.
+        """
+        key = f"{milvus_instance}:{physical_name}"
+        now = time.monotonic()
+
+        if not force_check and now - self._verified.get(key, 0.0) < self.verify_interval_s:
+            await self._touch(milvus_instance, physical_name)
+            return
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            if not force_check and time.monotonic() - self._verified.get(key, 0.0) < self.verify_interval_s:
+                return
+
+            client = self.service._get_client(milvus_instance)
+            state = await self.service._call(milvus_instance, client.get_load_state, physical_name)
+            if not _is_loaded(state):
+                await self._load(milvus_instance, physical_name)
+
+            self._verified[key] = time.monotonic()
+
+        await self._touch(milvus_instance, physical_name, force=True)
+
+    async def _load(self, milvus_instance: str, physical_name: str) -> None:
+        """Load a released collection, warm it up and make room for it within the budget"""
+        client = self.service._get_client(milvus_instance)
+        start = time.perf_counter()
+
+        await self.service._call(
+            milvus_instance,
+            client.load_collection,
+            physical_name,
+            timeout=settings.MILVUS_LOAD_TIMEOUT_MS / 1000
+        )
+        await self._warm_up(milvus_instance, physical_name)
+
+        elapsed = time.perf_counter() - start
+        MILVUS_COLLECTION_LOAD_SECONDS.labels(instance=milvus_instance).observe(elapsed)
+        logger.info(f"Loaded collection {physical_name} in {milvus_instance} ({elapsed:.2f}s)")
+
+        await self._record_memory(milvus_instance, physical_name)
+        await self._touch(milvus_instance, physical_name, force=True)
+        await self.enforce_budget(milvus_instance, keep=physical_name)
+
+    async def _warm_up(self, milvus_instance: str, physical_name: str) -> None:
+        """Run one throwaway search so the first user query does not pay for cold index pages"""
+        try:
+            client = self.service._get_client(milvus_instance)
+            profile = await self.service._get_index_profile(milvus_instance, physical_name)
+            probe = np.full(settings.EMBEDDING_DIMENSIONS, 1.0 / np.sqrt(settings.EMBEDDING_DIMENSIONS), dtype=np.float32)
+            await self.service._call(
+                milvus_instance,
+                client.search,
+                collection_name=physical_name,
+                data=[probe],
+                anns_field="vector",
+                limit=1,
+                search_params=build_search_params(profile, 1)
+            )
+        except Exception as e:
+            logger.debug(f"Warm-up search failed for {physical_name}: {e}")
+
+    async def _record_memory(self, milvus_instance: str, physical_name: str) -> None:
+        """Store the estimated index memory of a loaded collection for the memory budget"""
+        if not self.memory_budget_bytes:
+            return
+        try:
+            row_count = await self.service.get_collection_row_count(physical_name, milvus_instance)
+            profile = await self.service._get_index_profile(milvus_instance, physical_name)
+            estimate = estimate_index_memory_bytes(profile, row_count, settings.EMBEDDING_DIMENSIONS)
+            client = redis_client.get_client()
+            if client:
+                await client.hset(self._memory_key(milvus_instance), physical_name, estimate)
+        except Exception as e:
+            logger.warning(f"Failed to record memory estimate for {physical_name}: {e}")
+
+    async def _touch(self, milvus_instance: str, physical_name: str, force: bool = False) -> None:
+        """Record an access in the shared LRU order"""
+        key = f"{milvus_instance}:{physical_name}"
+        now = time.time()
+        if not force and now - self._touched.get(key, 0.0) < TOUCH_INTERVAL_S:
+            return
+
+        self._touched[key] = now
+        try:
+            client = redis_client.get_client()
+            if client:
+                await client.zadd(self._access_key(milvus_instance), {physical_name: now})
+        except Exception as e:
+            logger.debug(f"Failed to record access for {physical_name}: {e}")
+
+    async def _resident(self, milvus_instance: str) -> List[tuple]:
+        """(collection, last access) pairs, least recently used first"""
+        client = redis_client.get_client()
+        if not client:
+            return []
+        return await client.zrange(self._access_key(milvus_instance), 0, -1, withscores=True)
+
+    async def enforce_budget(self, milvus_instance: str, keep: Optional[str] = None) -> List[str]:
+        """
+        Release least recently used collections until the instance is within its budgets
+
+        Returns:
+            Names of released collections
+        """
+        released = []
+        try:
+            resident = await self._resident(milvus_instance)
+            memory: Dict[str, float] = {}
+            if self.memory_budget_bytes:
+                client = redis_client.get_client()
+                raw = await client.hgetall(self._memory_key(milvus_instance)) if client else {}
+                memory = {name: float(value) for name, value in raw.items()}
+
+            count = len(resident)
+            total_bytes = sum(memory.get(name, 0.0) for name, _ in resident)
+            now = time.time()
+
+            for name, last_access in resident:
+                over_count = count > self.max_loaded
+                over_memory = bool(self.memory_budget_bytes) and total_bytes > self.memory_budget_bytes
+                if not (over_count or over_memory):
+                    break
+                if name == keep or now - last_access < MIN_IDLE_BEFORE_RELEASE_S:
+                    continue
+
+                if await self.release(milvus_instance, name, reason="memory" if over_memory else "count"):
+                    released.append(name)
+                    count -= 1
+                    total_bytes -= memory.get(name, 0.0)
+
+        except Exception as e:
+            logger.error(f"Failed to enforce residency budget on {milvus_instance}: {e}")
+
+        MILVUS_LOADED_COLLECTIONS.labels(instance=milvus_instance).set(len(await self._safe_resident(milvus_instance)))
+        return released
+
+    async def release_idle(self) -> List[str]:
+        """Release collections not accessed for idle_release_s on every instance"""
+        released = []
+        for milvus_instance in (DBDocumentPermissionLevel.PUBLIC.value, DBDocumentPermissionLevel.PRIVATE.value):
+            cutoff = time.time() - self.idle_release_s
+            for name, last_access in await self._safe_resident(milvus_instance):
+                if last_access < cutoff and await self.release(milvus_instance, name, reason="idle"):
+                    released.append(name)
+            released.extend(await self.enforce_budget(milvus_instance))
+        return released
+
+    async def release(self, milvus_instance: str, physical_name: str, reason: str = "manual") -> bool:
+        """Release one collection from query-node memory"""
+        key = f"{milvus_instance}:{physical_name}"
+        try:
+            if physical_name == settings.MILVUS_SHARED_COLLECTION_NAME:
+                return False
+
+            client = self.service._get_client(milvus_instance)
+            await self.service._call(milvus_instance, client.release_collection, physical_name)
+
+            redis = redis_client.get_client()
+            if redis:
+                await redis.zrem(self._access_key(milvus_instance), physical_name)
+                await redis.hdel(self._memory_key(milvus_instance), physical_name)
+
+            self._verified.pop(key, None)
+            self._touched.pop(key, None)
+            MILVUS_COLLECTION_RELEASES.labels(instance=milvus_instance, reason=reason).inc()
+            logger.info(f"Released collection {physical_name} in {milvus_instance} ({reason})")
+            return True
+
+        except Exception as e:
+            logger.warning(f"Failed to release collection {physical_name} in {milvus_instance}: {e}")
+            return False
+
+    def forget(self, milvus_instance: str, physical_name: str) -> None:
+        """Drop the local load-state cache of a collection (after a release outside this manager)"""
+        self._verified.pop(f"{milvus_instance}:{physical_name}", None)
+
+    async def _safe_resident(self, milvus_instance: str) -> List[tuple]:
+        try:
+            return await self._resident(milvus_instance)
+        except Exception as e:
+            logger.debug(f"Failed to read residency of {milvus_instance}: {e}")
+            return []
+
+    async def sync(self) -> None:
+        """
+        Register collections that are already loaded (e.g. loaded at creation, before this manager
+        existed) so they age out like any other collection
+        """
+        for milvus_instance in (DBDocumentPermissionLevel.PUBLIC.value, DBDocumentPermissionLevel.PRIVATE.value):
+            try:
+                client = self.service._get_client(milvus_instance)
+                names = await self.service._call(milvus_instance, client.list_collections)
+                states = await asyncio.gather(
+                    *[self.service._call(milvus_instance, client.get_load_state, name) for name in names],
+                    return_exceptions=True
+                )
+                loaded = {
+                    name: time.time() for name, state in zip(names, states)
+                    if not isinstance(state, BaseException) and _is_loaded(state)
+                }
+                redis = redis_client.get_client()
+                if redis and loaded:
+                    await redis.zadd(self._access_key(milvus_instance), loaded, nx=True)
+                MILVUS_LOADED_COLLECTIONS.labels(instance=milvus_instance).set(len(loaded))
+            except Exception as e:
+                logger.warning(f"Failed to sync residency of {milvus_instance}: {e}")
+
+    async def _sweep_loop(self, interval_s: int) -> None:
+        await self.sync()
+        while True:
+            await asyncio.sleep(interval_s)
+            try:
+                released = await self.release_idle()
+                if released:
+                    logger.info(f"Residency sweep released {len(released)} collections")
+            except Exception as e:
+                logger.error(f"Residency sweep failed: {e}")
+
+    def start(self, interval_s: int = 300) -> None:
+        """Start the periodic idle/budget sweep"""
+        if self._sweep_task is None or self._sweep_task.done():
+            self._sweep_task = asyncio.create_task(self._sweep_loop(interval_s))
+
+    async def stop(self) -> None:
+        if self._sweep_task:
+            self._sweep_task.cancel()
+            try:
+                await self._sweep_task
+            except asyncio.CancelledError:
+                pass
+            self._sweep_task = None
+
+    async def get_stats(self) -> Dict[str, Any]:
+        stats: Dict[str, Any] = {
+            "max_loaded": self.max_loaded,
+            "memory_budget_mb": self.memory_budget_bytes // (1024 * 1024),
+            "idle_release_s": self.idle_release_s
+        }
+        now = time.time()
+        for milvus_instance in (DBDocumentPermissionLevel.PUBLIC.value, DBDocumentPermissionLevel.PRIVATE.value):
+            stats[milvus_instance] = [
+                {"collection": name, "idle_s": round(now - last_access)}
+                for name, last_access in await self._safe_resident(milvus_instance)
+            ]
+        return stats
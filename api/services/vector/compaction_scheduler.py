@@ -0,0 +1,208 @@
+"""
+Deferred, coalesced Milvus compaction
+Deletes only mark a collection dirty (deleted row counts in Redis, shared by all API workers).
+A background loop compacts each dirty collection at most once per MILVUS_COMPACTION_WINDOW_S,
+or sooner once its deleted-row ratio passes MILVUS_COMPACTION_DELETED_RATIO, and never during
+MILVUS_COMPACTION_PEAK_HOURS.
+"""
+import asyncio
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from services.cache.redis_service import redis_client
+from workflows.monitoring.prometheus import MILVUS_COMPACTIONS
+from common.types import DBDocumentPermissionLevel
+from utils.datetime_utils import DateTimeManager
+from utils.logging import get_logger
+
+if TYPE_CHECKING:
+    from services.vector.milvus_service import MilvusService
+
+logger = get_logger(__name__)
+
+LOCK_TTL_S = 600
+
+
+def parse_peak_hours(spec: str) -> List[Tuple[int, int]]:
+    """
+    Parse "8-12,13-18" into [(8, 12), (13, 18)] (start inclusive, end exclusive, may wrap midnight)
+    """
+    ranges = []
+    for part in (spec or "").split(","):
+        part = part.strip()
+        if not part:
+            continue
+        start, _, end = part.partition("-")
+        ranges.append((int(start) % 24, int(end or start) % 24))
+    return ranges
+
+
+def in_peak_hours(hour: int, ranges: List[Tuple[int, int]]) -> bool:
+    for start, end in ranges:
+        if start <= end and start <= hour < end:
+            return True
+        if start > end and (hour >= start or hour < end):
+            return True
+    return False
+
+
+class CompactionScheduler:
+    """Coalesces compactions of physical Milvus collections across deletes and workers"""
+
+    KEY_PREFIX = "milvus:compaction"
+
+    def __init__(
+        self,
+        service: "MilvusService",
+        window_s: int = 3600,
+        deleted_ratio: float = 0.2,
+        peak_hours: str = ""
+    ):
+        self.service = service
+        self.window_s = window_s
+        self.deleted_ratio = deleted_ratio
+        self.peak_hours = parse_peak_hours(peak_hours)
+        self._task: Optional[asyncio.Task] = None
+
+    def _deleted_key(self, milvus_instance: str) -> str:
+        return f"{self.KEY_PREFIX}:deleted:{milvus_instance}"
+
+    def _last_key(self, milvus_instance: str) -> str:
+        return f"{self.KEY_PREFIX}:last:{milvus_instance}"
+
+    def _lock_key(self, milvus_instance: str, physical_name: str) -> str:
+        return f"{self.KEY_PREFIX}:lock:{milvus_instance}:{physical_name}"
+
+    async def mark_dirty(self, milvus_instance: str, physical_name: str, deleted_rows: int) -> bool:
+        """
+        Record deleted rows of a collection for a later compaction
+
+        Returns:
+            False when Redis is unavailable (the caller should compact directly)
+        """
+        try:
+            client = redis_client.get_client()
+            if not client:
+                return False
+            await client.hincrby(self._deleted_key(milvus_instance), physical_name, max(1, int(deleted_rows)))
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to mark {physical_name} for compaction: {e}")
+            return False
+
+    def is_peak(self) -> bool:
+        return in_peak_hours(DateTimeManager._now().hour, self.peak_hours)
+
+    async def run_once(self, force: bool = False) -> List[str]:
+        """
+        Compact dirty collections that are due
+
+        Args:
+            force: Ignore the window and peak hours (every dirty collection is compacted)
+
+        Returns:
+            Names of compacted collections
+        """
+        if not force and self.is_peak():
+            return []
+
+        compacted = []
+        client = redis_client.get_client()
+        if not client:
+            return compacted
+
+        for milvus_instance in (DBDocumentPermissionLevel.PUBLIC.value, DBDocumentPermissionLevel.PRIVATE.value):
+            try:
+                dirty = await client.hgetall(self._deleted_key(milvus_instance))
+                last = await client.hgetall(self._last_key(milvus_instance))
+            except Exception as e:
+                logger.warning(f"Failed to read compaction state of {milvus_instance}: {e}")
+                continue
+
+            for physical_name, deleted in dirty.items():
+                trigger = await self._due(milvus_instance, physical_name, int(deleted), float(last.get(physical_name, 0)), force)
+                if trigger and await self._compact(milvus_instance, physical_name, int(deleted), trigger):
+                    compacted.append(physical_name)
+
+        return compacted
+
+    async def _due(
+        self,
+        milvus_instance: str,
+        physical_name: str,
+        deleted: int,
+        last_compaction: float,
+        force: bool
+    ) -> Optional[str]:
+        """Trigger name ("forced", "window" or "ratio") if the collection should be compacted now"""
+        if force:
+            return "forced"
+        if time.time() - last_compaction >= self.window_s:
+            return "window"
+        try:
+            row_count = await self.service.get_collection_row_count(physical_name, milvus_instance)
+        except Exception as e:
+            logger.debug(f"Failed to get row count of {physical_name}: {e}")
+            return None
+        if row_count and deleted / row_count >= self.deleted_ratio:
+            return "ratio"
+        return None
+
+    async def _compact(self, milvus_instance: str, physical_name: str, deleted: int, trigger: str) -> bool:
+        client = redis_client.get_client()
+        lock_key = self._lock_key(milvus_instance, physical_name)
+        if not await client.set(lock_key, "1", nx=True, ex=LOCK_TTL_S):
+            return False
+
+        try:
+            if not await self.service.compact_collection(physical_name, milvus_instance):
+                return False
+            # Only the rows counted so far are covered; deletes racing with this compaction stay dirty
+            remaining = await client.hincrby(self._deleted_key(milvus_instance), physical_name, -deleted)
+            if remaining <= 0:
+                await client.hdel(self._deleted_key(milvus_instance), physical_name)
+            await client.hset(self._last_key(milvus_instance), physical_name, time.time())
+            MILVUS_COMPACTIONS.labels(instance=milvus_instance, trigger=trigger).inc()
+            logger.info(f"Compacted {physical_name} in {milvus_instance} ({trigger}, {deleted} deleted rows)")
+            return True
+        except Exception as e:
+            logger.error(f"Scheduled compaction of {physical_name} failed: {e}")
+            return False
+        finally:
+            await client.delete(lock_key)
+
+    async def _loop(self, interval_s: int) -> None:
+        while True:
+            await asyncio.sleep(interval_s)
+            try:
+                await self.run_once()
+            except Exception as e:
+                logger.error(f"Compaction scheduler run failed: {e}")
+
+    def start(self, interval_s: int = 60) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._loop(interval_s))
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def get_stats(self) -> Dict[str, Any]:
+        stats: Dict[str, Any] = {
+            "window_s": self.window_s,
+            "deleted_ratio": self.deleted_ratio,
+            "peak_hours": self.peak_hours,
+            "in_peak": self.is_peak()
+        }
+        client = redis_client.get_client()
+        for milvus_instance in (DBDocumentPermissionLevel.PUBLIC.value, DBDocumentPermissionLevel.PRIVATE.value):
+            try:
+                stats[milvus_instance] = await client.hgetall(self._deleted_key(milvus_instance)) if client else {}
+            except Exception as e:
+                stats[milvus_instance] = {"error": str(e)}
+        return stats
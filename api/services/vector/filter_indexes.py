@@ -0,0 +1,71 @@
+"""
+Declarative filter indexes
+Scalar indexes (MILVUS_SCALAR_INDEXES: field -> index type) and JSON path indexes on chunk metadata
+(MILVUS_JSON_PATH_INDEXES: key -> cast type) let filtered searches and document_id deletes use an
+index instead of scanning every segment. New collections get them at creation; existing ones are
+backfilled on first use (and by scripts/backfill_filter_indexes.py).
+"""
+import re
+from typing import Iterable, List
+
+from pymilvus import MilvusClient
+
+from config.settings import get_settings
+from services.dataclasses.milvus import FilterIndex
+from utils.logging import get_logger
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+
+def _index_name(*parts: str) -> str:
+    return re.sub(r"\W", "_", "_".join(parts))
+
+
+def configured_filter_indexes() -> List[FilterIndex]:
+    """Filter indexes declared in settings (JSON path indexes only with MILVUS_JSON_INDEXING_ENABLED)"""
+    indexes = [
+        FilterIndex(index_name=_index_name(field, "idx"), field_name=field, index_type=index_type)
+        for field, index_type in settings.MILVUS_SCALAR_INDEXES.items()
+    ]
+    if settings.MILVUS_JSON_INDEXING_ENABLED:
+        indexes.extend(
+            FilterIndex(
+                index_name=_index_name("metadata", key, "idx"),
+                field_name="metadata",
+                json_path=f'metadata["{key}"]',
+                json_cast_type=cast_type
+            )
+            for key, cast_type in settings.MILVUS_JSON_PATH_INDEXES.items()
+        )
+    return indexes
+
+
+def create_filter_indexes(
+    client: MilvusClient,
+    collection_name: str,
+    indexes: Iterable[FilterIndex],
+    existing: Iterable[str] = ()
+) -> List[str]:
+    """
+    Create missing filter indexes on a physical collection (blocking; run through MilvusService._call)
+    Scalar indexes are built on loaded collections without a release.
+
+    Returns:
+        Names of the created indexes
+    """
+    existing = set(existing)
+    created = []
+    for index in indexes:
+        if index.index_name in existing:
+            continue
+        try:
+            index_params = client.prepare_index_params()
+            index_params.add_index(**index.to_params())
+            client.create_index(collection_name, index_params)
+            created.append(index.index_name)
+        except Exception as e:
+            logger.warning(f"Failed to create filter index {index.index_name} on {collection_name}: {e}")
+    if created:
+        logger.info(f"Created filter indexes on {collection_name}: {', '.join(created)}")
+    return created
@@ -0,0 +1,41 @@
+"""
+Fusion of ranked result lists from several collections
+Scores from different collections (and from hybrid RRF vs. plain vector search) are not on
+the same scale, so the default fusion is rank-based.
+"""
+from typing import Any, Dict, List
+
+FUSION_RRF = "rrf"
+FUSION_SCORE = "score"
+
+
+def fuse_results(
+    ranked_lists: List[List[Dict[str, Any]]],
+    method: str = FUSION_RRF,
+    rrf_k: int = 60,
+    limit: int = 15
+) -> List[Dict[str, Any]]:
+    """
+    Merge per-collection result lists into one ranking
+
+    Args:
+        ranked_lists: One list per collection, each sorted best-first
+        method: "rrf" (1 / (rrf_k + rank), ties broken by raw score) or "score" (raw score)
+        rrf_k: RRF smoothing constant
+        limit: Number of fused results to return
+
+    Returns:
+        Fused results, each with a "fused_score" key
+    """
+    fused: List[Dict[str, Any]] = []
+
+    for results in ranked_lists:
+        for rank, result in enumerate(results, start=1):
+            if method == FUSION_RRF:
+                result["fused_score"] = 1.0 / (rrf_k + rank)
+            else:
+                result["fused_score"] = float(result.get("score", 0.0))
+            fused.append(result)
+
+    fused.sort(key=lambda r: (r["fused_score"], r.get("score", 0.0)), reverse=True)
+    return fused[:limit]
@@ -0,0 +1,107 @@
+"""
+Named vector index profiles
+- flat: exact search for tiny collections (no build cost, perfect recall)
+- hnsw: graph index for small/medium collections
+- ivf_sq8: IVF with 8-bit scalar quantization for large collections (~4x less memory)
+- ivf_rabitq: IVF with RaBitQ 1-bit codes plus SQ8 refinement for very large collections (Milvus 2.6);
+  never selected automatically, only as an explicit profile
+"""
+import math
+from typing import Any, Dict, List, Optional
+
+from config.settings import get_settings
+from services.dataclasses.milvus import IndexProfile
+
+settings = get_settings()
+
+PROFILE_FLAT = "flat"
+PROFILE_HNSW = "hnsw"
+PROFILE_IVF_SQ8 = "ivf_sq8"
+PROFILE_IVF_RABITQ = "ivf_rabitq"
+
+INDEX_PROFILES: Dict[str, IndexProfile] = {
+    PROFILE_FLAT: IndexProfile(
+        name=PROFILE_FLAT,
+        index_type="FLAT",
+        build_params={},
+        search_params={},
+        max_rows=settings.MILVUS_INDEX_FLAT_MAX_ROWS
+    ),
+    PROFILE_HNSW: IndexProfile(
+        name=PROFILE_HNSW,
+        index_type="HNSW",
+        build_params={"M": 16, "efConstruction": 200},
+        search_params={"ef": 128},
+        max_rows=settings.MILVUS_INDEX_HNSW_MAX_ROWS,
+        graph_bytes_per_vector=16 * 2 * 8
+    ),
+    PROFILE_IVF_SQ8: IndexProfile(
+        name=PROFILE_IVF_SQ8,
+        index_type="IVF_SQ8",
+        build_params={},
+        search_params={"nprobe": 32},
+        bytes_per_dimension=1.0
+    ),
+    PROFILE_IVF_RABITQ: IndexProfile(
+        name=PROFILE_IVF_RABITQ,
+        index_type="IVF_RABITQ",
+        build_params={"refine": True, "refine_type": "SQ8"},
+        search_params={"nprobe": 32, "refine_k": 2},
+        bytes_per_dimension=1.0 + 1.0 / 8
+    ),
+}
+
+_PROFILES_BY_INDEX_TYPE = {profile.index_type: profile for profile in INDEX_PROFILES.values()}
+
+
+def get_index_profile(name: str) -> IndexProfile:
+    if name not in INDEX_PROFILES:
+        raise ValueError(f"Unknown index profile: {name} (available: {', '.join(INDEX_PROFILES)})")
+    return INDEX_PROFILES[name]
+
+
+def profile_for_index_type(index_type: Optional[str]) -> IndexProfile:
+    """Profile matching an existing index type (HNSW for unknown or legacy indexes)"""
+    return _PROFILES_BY_INDEX_TYPE.get((index_type or "").upper(), INDEX_PROFILES[PROFILE_HNSW])
+
+
+def select_index_profile(row_count: int) -> IndexProfile:
+    """Pick the profile for a collection of row_count vectors"""
+    if row_count <= settings.MILVUS_INDEX_FLAT_MAX_ROWS:
+        return INDEX_PROFILES[PROFILE_FLAT]
+    if row_count <= settings.MILVUS_INDEX_HNSW_MAX_ROWS:
+        return INDEX_PROFILES[PROFILE_HNSW]
+    return INDEX_PROFILES[PROFILE_IVF_SQ8]
+
+
+def build_index_params(profile: IndexProfile, row_count: int = 0) -> Dict[str, Any]:
+    """Index params for create_index / create_collection; IVF nlist scales with collection size"""
+    params = dict(profile.build_params)
+    if profile.index_type.startswith("IVF"):
+        params["nlist"] = min(65536, max(128, int(4 * math.sqrt(max(row_count, 1)))))
+    return {
+        "field_name": "vector",
+        "index_type": profile.index_type,
+        "metric_type": settings.MILVUS_METRIC_TYPE,
+        "params": params
+    }
+
+
+def build_search_params(profile: IndexProfile, limit: int, ef: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Search params for a profile; HNSW ef must be at least the requested limit
+    ef overrides the profile's ef (default MILVUS_SEARCH_EF, 0 keeps the profile value)
+    """
+    params = dict(profile.search_params)
+    if "ef" in params:
+        params["ef"] = max(ef or settings.MILVUS_SEARCH_EF or params["ef"], limit)
+    return {"metric_type": settings.MILVUS_METRIC_TYPE, "params": params}
+
+
+def estimate_index_memory_bytes(profile: IndexProfile, row_count: int, dimension: int) -> int:
+    """Approximate in-memory index size"""
+    return int(row_count * (dimension * profile.bytes_per_dimension + profile.graph_bytes_per_vector))
+
+
+def list_index_profiles() -> List[str]:
+    return list(INDEX_PROFILES)
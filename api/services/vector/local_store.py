@@ -0,0 +1,387 @@
+"""
+In-process vector store for small collections and offline runs
+Each collection is a directory holding a float16 vector matrix (memory-mapped for search), a JSON-lines
+file with the scalar fields and a meta.json with the row count. Search is exact top-k by matrix
+multiply over unit vectors (cosine). Writers take a per-collection file lock, so several API workers
+on one host can share a store directory; readers reload when meta.json changes.
+
+Filter expressions support the Milvus subset used by this service: `and`-joined comparisons
+(==, !=, >, >=, <, <=, in, not in) on scalar fields and metadata['key'].
+"""
+import ast
+import asyncio
+import fcntl
+import json
+import operator
+import os
+import re
+import shutil
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from uuid import uuid4
+
+import numpy as np
+
+from services.vector.vector_store import BaseVectorStore
+from utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+_CLAUSE = re.compile(
+    r"""^(?:metadata\[['"](?P<key>[^'"]+)['"]\]|(?P<field>\w+))\s*(?P<op>==|!=|>=|<=|>|<|not\s+in|in)\s*(?P<value>.+)$""",
+    re.IGNORECASE
+)
+_OPERATORS: Dict[str, Callable[[Any, Any], bool]] = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    ">=": operator.ge,
+    "<=": operator.le,
+    ">": operator.gt,
+    "<": operator.lt,
+    "in": lambda field, values: field in values,
+    "not in": lambda field, values: field not in values,
+}
+
+
+_AND = re.compile(r"\s+and\s+", re.IGNORECASE)
+
+
+def _split_and(expr: str) -> List[str]:
+    """Split on top-level `and`, leaving quoted strings and bracketed lists intact"""
+    clauses, depth, quote, start, i = [], 0, None, 0, 0
+    while i < len(expr):
+        char = expr[i]
+        if quote:
+            if char == "\\":
+                i += 2
+                continue
+            if char == quote:
+                quote = None
+        elif char in "'\"":
+            quote = char
+        elif char in "([":
+            depth += 1
+        elif char in ")]":
+            depth -= 1
+        elif depth == 0:
+            match = _AND.match(expr, i)
+            if match:
+                clauses.append(expr[start:i])
+                start = i = match.end()
+                continue
+        i += 1
+    if quote or depth:
+        raise ValueError(f"Unbalanced quotes or brackets in filter: {expr}")
+    clauses.append(expr[start:])
+    return clauses
+
+
+def _strip_parens(expr: str) -> str:
+    """Remove parentheses wrapping the whole expression"""
+    while expr.startswith("(") and expr.endswith(")"):
+        depth = 0
+        for i, char in enumerate(expr):
+            depth += char == "("
+            depth -= char == ")"
+            if depth == 0 and i < len(expr) - 1:
+                return expr
+        expr = expr[1:-1].strip()
+    return expr
+
+
+def _parse_value(raw: str) -> Any:
+    lowered = raw.strip().lower()
+    if lowered in ("true", "false"):
+        return lowered == "true"
+    return ast.literal_eval(raw.strip())
+
+
+def compile_filter(filter_expr: Optional[str]) -> Optional[Callable[[Dict[str, Any]], bool]]:
+    """
+    Compile a filter expression into a row predicate (None for "no filter")
+
+    Raises:
+        ValueError: If the expression uses syntax outside the supported subset
+    """
+    if not filter_expr or not filter_expr.strip():
+        return None
+
+    predicates = []
+    for clause in _split_and(_strip_parens(filter_expr.strip())):
+        match = _CLAUSE.match(_strip_parens(clause.strip()))
+        if not match:
+            raise ValueError(f"Unsupported filter for local vector store: {clause}")
+        try:
+            value = _parse_value(match.group("value"))
+        except (ValueError, SyntaxError):
+            raise ValueError(f"Unsupported filter value for local vector store: {clause}")
+
+        op = _OPERATORS[re.sub(r"\s+", " ", match.group("op").lower())]
+        key, field = match.group("key"), match.group("field")
+        predicates.append((key, field, op, value))
+
+    def predicate(row: Dict[str, Any]) -> bool:
+        for key, field, op, value in predicates:
+            current = (row.get("metadata") or {}).get(key) if key else row.get(field)
+            try:
+                if not op(current, value):
+                    return False
+            except TypeError:
+                return False
+        return True
+
+    return predicate
+
+
+class _LoadedCollection:
+    """Read view of one collection at one meta.json state"""
+
+    def __init__(self, stamp: Tuple[int, int], meta: Dict[str, Any], vectors: np.ndarray, rows: List[Dict[str, Any]]):
+        self.stamp = stamp
+        self.meta = meta
+        self.vectors = vectors
+        self.rows = rows
+
+
+class LocalVectorStore(BaseVectorStore):
+    """Memory-mapped float16 vector store with exact search"""
+
+    def __init__(self, base_dir: str, dimension: int):
+        self.base_dir = Path(base_dir)
+        self.dimension = dimension
+        self._loaded: Dict[str, _LoadedCollection] = {}
+
+    # ------------------- files -------------------
+
+    def _dir(self, collection_name: str) -> Path:
+        return self.base_dir / collection_name.replace("/", "_")
+
+    def _meta_path(self, collection_name: str) -> Path:
+        return self._dir(collection_name) / "meta.json"
+
+    def _vectors_path(self, collection_name: str, generation: int) -> Path:
+        return self._dir(collection_name) / f"vectors.{generation}.f16"
+
+    def _rows_path(self, collection_name: str, generation: int) -> Path:
+        return self._dir(collection_name) / f"rows.{generation}.jsonl"
+
+    @contextmanager
+    def _lock(self, collection_name: str):
+        directory = self._dir(collection_name)
+        directory.mkdir(parents=True, exist_ok=True)
+        with open(directory / ".lock", "w") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _read_meta(self, collection_name: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._meta_path(collection_name)) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def _write_meta(self, collection_name: str, meta: Dict[str, Any]) -> None:
+        path = self._meta_path(collection_name)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(meta, f)
+        os.replace(tmp_path, path)
+
+    def _load(self, collection_name: str) -> Optional[_LoadedCollection]:
+        """Current read view (re-read only when meta.json was replaced)"""
+        try:
+            stat = os.stat(self._meta_path(collection_name))
+        except FileNotFoundError:
+            self._loaded.pop(collection_name, None)
+            return None
+
+        stamp = (stat.st_ino, stat.st_mtime_ns)
+        cached = self._loaded.get(collection_name)
+        if cached and cached.stamp == stamp:
+            return cached
+
+        meta = self._read_meta(collection_name)
+        count, dim, generation = meta["count"], meta["dim"], meta["generation"]
+        if count:
+            vectors = np.memmap(self._vectors_path(collection_name, generation), dtype=np.float16, mode="r", shape=(count, dim))
+            with open(self._rows_path(collection_name, generation)) as f:
+                rows = [json.loads(line) for _, line in zip(range(count), f)]
+        else:
+            vectors = np.empty((0, dim), dtype=np.float16)
+            rows = []
+
+        loaded = _LoadedCollection(stamp, meta, vectors, rows)
+        self._loaded[collection_name] = loaded
+        return loaded
+
+    # ------------------- sync operations -------------------
+
+    def _ensure_collection_sync(self, collection_name: str) -> bool:
+        with self._lock(collection_name):
+            if self._read_meta(collection_name) is None:
+                self._write_meta(collection_name, {"dim": self.dimension, "count": 0, "generation": 0, "rows_bytes": 0})
+                logger.info(f"Created local vector collection {collection_name}")
+        return True
+
+    def _insert_sync(self, collection_name: str, rows: List[Dict[str, Any]]) -> int:
+        if not rows:
+            return 0
+
+        vectors = np.asarray([row["vector"] for row in rows], dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        vectors = (vectors / np.where(norms == 0, 1.0, norms)).astype(np.float16)
+
+        lines = []
+        for row in rows:
+            scalar = {k: v for k, v in row.items() if k != "vector"}
+            scalar.setdefault("id", row.get("chunk_id") or uuid4().hex)
+            lines.append(json.dumps(scalar, ensure_ascii=False, default=str) + "\n")
+        payload = "".join(lines).encode("utf-8")
+
+        with self._lock(collection_name):
+            meta = self._read_meta(collection_name) or {"dim": self.dimension, "count": 0, "generation": 0, "rows_bytes": 0}
+            if vectors.shape[1] != meta["dim"]:
+                raise ValueError(f"Vector dimension {vectors.shape[1]} does not match collection dimension {meta['dim']}")
+
+            generation = meta["generation"]
+            vector_bytes = meta["count"] * meta["dim"] * np.dtype(np.float16).itemsize
+            # Truncate to the committed size first so an interrupted write never shifts rows
+            with open(self._vectors_path(collection_name, generation), "ab") as f:
+                f.truncate(vector_bytes)
+                f.write(vectors.tobytes())
+            with open(self._rows_path(collection_name, generation), "ab") as f:
+                f.truncate(meta["rows_bytes"])
+                f.write(payload)
+
+            meta["count"] += len(rows)
+            meta["rows_bytes"] += len(payload)
+            self._write_meta(collection_name, meta)
+
+        return len(rows)
+
+    def _search_sync(
+        self,
+        collection_name: str,
+        query_vector: np.ndarray,
+        limit: int,
+        filter_expr: Optional[str],
+        output_fields: Optional[List[str]]
+    ) -> List[List[Dict[str, Any]]]:
+        collection = self._load(collection_name)
+        if collection is None or not collection.rows:
+            return [[]]
+
+        predicate = compile_filter(filter_expr)
+        if predicate:
+            candidates = np.fromiter((i for i, row in enumerate(collection.rows) if predicate(row)), dtype=np.int64)
+            if not len(candidates):
+                return [[]]
+            matrix = collection.vectors[candidates]
+        else:
+            candidates = None
+            matrix = collection.vectors
+
+        query = np.asarray(query_vector, dtype=np.float32).reshape(-1)
+        norm = np.linalg.norm(query)
+        if norm:
+            query = query / norm
+
+        scores = matrix @ query
+        k = min(limit, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+
+        hits = []
+        for position in top:
+            index = int(candidates[position]) if candidates is not None else int(position)
+            row = collection.rows[index]
+            entity = {field: row.get(field) for field in (output_fields or []) if field != "vector"}
+            if output_fields and "vector" in output_fields:
+                entity["vector"] = collection.vectors[index].astype(np.float32).tolist()
+            hits.append({"id": row.get("id"), "distance": float(scores[position]), "entity": entity})
+        return [hits]
+
+    def _delete_sync(self, collection_name: str, filter_expr: str) -> int:
+        predicate = compile_filter(filter_expr)
+        if predicate is None:
+            raise ValueError("Refusing to delete without a filter")
+
+        with self._lock(collection_name):
+            self._loaded.pop(collection_name, None)
+            collection = self._load(collection_name)
+            if collection is None:
+                return 0
+
+            keep = [i for i, row in enumerate(collection.rows) if not predicate(row)]
+            deleted = len(collection.rows) - len(keep)
+            if not deleted:
+                return 0
+
+            meta = dict(collection.meta)
+            old_generation = meta["generation"]
+            generation = old_generation + 1
+            payload = "".join(json.dumps(collection.rows[i], ensure_ascii=False, default=str) + "\n" for i in keep).encode("utf-8")
+
+            with open(self._vectors_path(collection_name, generation), "wb") as f:
+                f.write(np.ascontiguousarray(collection.vectors[keep]).tobytes())
+            with open(self._rows_path(collection_name, generation), "wb") as f:
+                f.write(payload)
+
+            meta.update({"generation": generation, "count": len(keep), "rows_bytes": len(payload)})
+            self._write_meta(collection_name, meta)
+
+            for path in (self._vectors_path(collection_name, old_generation), self._rows_path(collection_name, old_generation)):
+                path.unlink(missing_ok=True)
+
+        return deleted
+
+    def _fetch_all_sync(self, collection_name: str) -> List[Dict[str, Any]]:
+        collection = self._load(collection_name)
+        if collection is None:
+            return []
+        return [
+            {**row, "vector": collection.vectors[i].astype(np.float32)}
+            for i, row in enumerate(collection.rows)
+        ]
+
+    def _drop_sync(self, collection_name: str) -> None:
+        self._loaded.pop(collection_name, None)
+        shutil.rmtree(self._dir(collection_name), ignore_errors=True)
+
+    # ------------------- BaseVectorStore -------------------
+
+    async def has_collection(self, collection_name: str) -> bool:
+        return self._meta_path(collection_name).exists()
+
+    async def ensure_collection(self, collection_name: str) -> bool:
+        return await asyncio.to_thread(self._ensure_collection_sync, collection_name)
+
+    async def insert(self, collection_name: str, rows: List[Dict[str, Any]]) -> int:
+        return await asyncio.to_thread(self._insert_sync, collection_name, rows)
+
+    async def search(
+        self,
+        collection_name: str,
+        query_vector: np.ndarray,
+        limit: int,
+        filter_expr: Optional[str] = None,
+        output_fields: Optional[List[str]] = None
+    ) -> List[List[Dict[str, Any]]]:
+        return await asyncio.to_thread(self._search_sync, collection_name, query_vector, limit, filter_expr, output_fields)
+
+    async def delete(self, collection_name: str, filter_expr: str) -> int:
+        return await asyncio.to_thread(self._delete_sync, collection_name, filter_expr)
+
+    async def count(self, collection_name: str) -> int:
+        meta = self._read_meta(collection_name)
+        return int(meta["count"]) if meta else 0
+
+    async def fetch_all(self, collection_name: str) -> List[Dict[str, Any]]:
+        return await asyncio.to_thread(self._fetch_all_sync, collection_name)
+
+    async def drop_collection(self, collection_name: str) -> None:
+        await asyncio.to_thread(self._drop_sync, collection_name)
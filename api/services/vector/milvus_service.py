@@ -1,6 +1,11 @@
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Optional, Union, Callable, Tuple
+import asyncio
+import functools
 import json
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+import numpy as np
 from pymilvus import (
     MilvusClient,
     DataType,
@@ -8,7 +13,34 @@ from pymilvus import (
     AnnSearchRequest,
     RRFRanker
 )
+from services.cache.redis_service import redis_client
+from services.documents.chunk_store import build_chunk_id, chunk_store
 from services.embedding.embedding_service import embedding_service
+from services.dataclasses.milvus import CollectionTarget, IndexProfile
+from services.vector.collection_residency import CollectionResidencyManager
+from services.vector.compaction_scheduler import CompactionScheduler
+from services.vector.filter_indexes import configured_filter_indexes, create_filter_indexes
+from services.vector.collection_layout import (
+    LAYOUT_PER_COLLECTION,
+    PARTITION_KEY_FIELD,
+    is_partition_key_layout,
+    resolve_collection,
+)
+from services.vector.fusion import fuse_results
+from services.vector.index_profiles import (
+    PROFILE_HNSW,
+    build_index_params,
+    build_search_params,
+    get_index_profile,
+    list_index_profiles,
+    profile_for_index_type,
+    select_index_profile,
+)
+from services.vector.local_store import LocalVectorStore
+from services.vector.mmr import apply_mmr
+from services.vector.retrieval_cache import RetrievalCache
+from services.vector.stats_collector import CollectionStatsCollector
+from services.vector.vector_store import BACKEND_AUTO, BACKEND_LOCAL
 from common.types import DBDocumentPermissionLevel
 from config.settings import get_settings
 from utils.logging import get_logger
@@ -16,6 +48,12 @@ from utils.logging import get_logger
 logger = get_logger(__name__)
 settings = get_settings()
 
+# One index rebuild per physical collection across all workers; the lock expires if a worker dies
+INDEX_REBUILD_LOCK_TTL_S = 3600
+# One local-to-Milvus promotion per collection across all workers; others wait for it to finish
+PROMOTE_LOCK_TTL_S = 600
+PROMOTE_LOCK_POLL_S = 0.5
+
 
 class MilvusService:
     """
@@ -24,6 +62,14 @@ class MilvusService:
     - Dynamic schema for flexible data models
     - Hybrid vector + keyword search
     - Connection pooling for scalability
+
+    MilvusClient is blocking, so every call runs on a bounded thread pool per instance
+    (public/private) with a concurrency limit and timeout; the event loop is never blocked.
+    Collections are loaded on demand and cold ones released by the residency manager.
+
+    VECTOR_STORE_BACKEND=local serves every collection from the in-process LocalVectorStore
+    (no Milvus needed); auto starts new collections locally and moves them to Milvus once they
+    exceed VECTOR_LOCAL_MAX_ROWS.
     """
 
     def __init__(self):
@@ -31,8 +77,46 @@ class MilvusService:
         self.private_client = None
         self.collection_cache = {}
         self.function_cache = {}
-        self._initialize_clients()
-        self._setup_connection_pool()
+        self.index_profile_cache: Dict[str, str] = {}
+        self.filter_index_cache: set = set()
+        self._index_profile_checks: set = set()
+        self._background_tasks: set = set()
+        self._executors: Dict[str, ThreadPoolExecutor] = {}
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self.retrieval_cache: Optional[RetrievalCache] = (
+            RetrievalCache(
+                ttl_seconds=settings.RETRIEVAL_CACHE_TTL_S,
+                visibility_delay_s=settings.RETRIEVAL_CACHE_VISIBILITY_DELAY_S
+            ) if settings.RETRIEVAL_CACHE_ENABLED else None
+        )
+        self.residency: Optional[CollectionResidencyManager] = (
+            CollectionResidencyManager(
+                self,
+                max_loaded=settings.MILVUS_MAX_LOADED_COLLECTIONS,
+                memory_budget_mb=settings.MILVUS_LOADED_MEMORY_BUDGET_MB,
+                idle_release_s=settings.MILVUS_COLLECTION_IDLE_RELEASE_S
+            ) if settings.MILVUS_RESIDENCY_ENABLED and settings.VECTOR_STORE_BACKEND != BACKEND_LOCAL else None
+        )
+        self.compaction_scheduler: Optional[CompactionScheduler] = (
+            CompactionScheduler(
+                self,
+                window_s=settings.MILVUS_COMPACTION_WINDOW_S,
+                deleted_ratio=settings.MILVUS_COMPACTION_DELETED_RATIO,
+                peak_hours=settings.MILVUS_COMPACTION_PEAK_HOURS
+            ) if settings.MILVUS_COMPACTION_SCHEDULER_ENABLED and settings.VECTOR_STORE_BACKEND != BACKEND_LOCAL else None
+        )
+        self.stats_collector: Optional[CollectionStatsCollector] = (
+            CollectionStatsCollector(self, interval_s=settings.MILVUS_STATS_REFRESH_INTERVAL_S)
+            if settings.MILVUS_STATS_COLLECTOR_ENABLED and settings.VECTOR_STORE_BACKEND != BACKEND_LOCAL else None
+        )
+        self.local_store: Optional[LocalVectorStore] = (
+            LocalVectorStore(settings.VECTOR_LOCAL_STORE_DIR, settings.EMBEDDING_DIMENSIONS)
+            if settings.VECTOR_STORE_BACKEND in (BACKEND_LOCAL, BACKEND_AUTO) else None
+        )
+        self._initialize_executors()
+        if settings.VECTOR_STORE_BACKEND != BACKEND_LOCAL:
+            self._initialize_clients()
+            self._setup_connection_pool()
 
     def _initialize_clients(self):
         """Initialize Milvus 2.6 clients with advanced configuration"""
@@ -60,6 +144,73 @@ class MilvusService:
             logger.error(f"Failed to initialize Milvus 2.6 clients: {e}")
             raise
 
+    def _initialize_executors(self):
+        """Create one bounded thread pool and concurrency limit per Milvus instance"""
+        for instance in (DBDocumentPermissionLevel.PUBLIC.value, DBDocumentPermissionLevel.PRIVATE.value):
+            self._executors[instance] = ThreadPoolExecutor(
+                max_workers=settings.MILVUS_MAX_CONCURRENT_CALLS,
+                thread_name_prefix=f"milvus-{instance}"
+            )
+            self._semaphores[instance] = asyncio.Semaphore(settings.MILVUS_MAX_CONCURRENT_CALLS)
+
+    async def _call(
+        self,
+        milvus_instance: str,
+        func: Callable[..., Any],
+        *args,
+        timeout: Optional[float] = None,
+        **kwargs
+    ) -> Any:
+        """
+        Run a blocking Milvus call on the instance's thread pool
+
+        Args:
+            milvus_instance: Milvus instance type (public/private)
+            func: Blocking callable (MilvusClient method or sync helper)
+            timeout: Seconds, including time spent waiting for a free slot
+                (default MILVUS_QUERY_TIMEOUT_MS)
+
+        Raises:
+            asyncio.TimeoutError: If the call does not complete in time
+        """
+        if timeout is None:
+            timeout = settings.MILVUS_QUERY_TIMEOUT_MS / 1000
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores[milvus_instance]
+        executor = self._executors[milvus_instance]
+
+        async def run():
+            async with semaphore:
+                return await loop.run_in_executor(executor, functools.partial(func, *args, **kwargs))
+
+        try:
+            return await asyncio.wait_for(run(), timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"Milvus call {getattr(func, '__name__', func)} on {milvus_instance} timed out after {timeout}s")
+            raise
+
+    async def _call_loaded(
+        self,
+        milvus_instance: str,
+        physical_name: str,
+        func: Callable[..., Any],
+        *args,
+        **kwargs
+    ) -> Any:
+        """
+        _call for operations that need a loaded collection (get, delete by expression, query, upsert)
+        The collection is loaded first if the residency manager released it, and the call is retried
+        once if another worker released it since our last load-state check.
+        """
+        await self._ensure_loaded(milvus_instance, physical_name)
+        try:
+            return await self._call(milvus_instance, func, *args, **kwargs)
+        except Exception as e:
+            if not self.residency or "not loaded" not in str(e).lower():
+                raise
+            await self._ensure_loaded(milvus_instance, physical_name, force_check=True)
+            return await self._call(milvus_instance, func, *args, **kwargs)
+
     def _setup_connection_pool(self):
         """Setup connection pooling for better performance"""
         try:
@@ -85,27 +236,44 @@ class MilvusService:
     ) -> bool:
         """
         Ensure collection exists, create if not found
+        In the partition_key layout this ensures the shared physical collection.
         """
         try:
+            if settings.VECTOR_STORE_BACKEND == BACKEND_LOCAL:
+                return await self.local_store.ensure_collection(collection_name)
+            if self.local_store and await self.local_store.has_collection(collection_name):
+                return True
+            
             client = self._get_client(milvus_instance)
-            cache_key = f"{milvus_instance}:{collection_name}"
+            target = resolve_collection(collection_name)
+            physical_name = target.physical_name
+            cache_key = f"{milvus_instance}:{physical_name}"
             
             if cache_key in self.collection_cache:
                 return True
             
-            if client.has_collection(collection_name):
+            if await self._call(milvus_instance, client.has_collection, physical_name):
                 self.collection_cache[cache_key] = True
-                logger.info(f"Collection {collection_name} exists in {milvus_instance}")
+                self._schedule_filter_index_check(collection_name, milvus_instance)
+                logger.info(f"Collection {physical_name} exists in {milvus_instance}")
                 return True
             
-            success = self._create_collection(
-                collection_name=collection_name,
-                client=client
+            if self.local_store and not target.is_partitioned:
+                return await self.local_store.ensure_collection(collection_name)
+            
+            success = await self._call(
+                milvus_instance,
+                self._create_collection,
+                collection_name=physical_name,
+                client=client,
+                partitioned=target.is_partitioned,
+                timeout=settings.MILVUS_LOAD_TIMEOUT_MS / 1000
             )
             
             if success:
                 self.collection_cache[cache_key] = True
-                logger.info(f"Created collection {collection_name} in {milvus_instance}")
+                await self._ensure_loaded(milvus_instance, physical_name, force_check=True)
+                logger.info(f"Created collection {physical_name} in {milvus_instance}")
             
             return success
             
@@ -116,11 +284,13 @@ class MilvusService:
     def _create_collection(
         self,
         collection_name: str,
-        client: MilvusClient
+        client: MilvusClient,
+        partitioned: bool = False
     ) -> bool:
         """
         Create new collection with Milvus 2.6 advanced schema
         Supports JSON indexing, dynamic fields, and RaBitQ compression
+        Partitioned (shared) collections add a partition key field holding the logical collection name
         """
         try:
             schema = {
@@ -144,6 +314,11 @@ class MilvusService:
                         "type": DataType.VARCHAR,
                         "max_length": 255
                     },
+                    {
+                        "name": "chunk_id",
+                        "type": DataType.VARCHAR,
+                        "max_length": 64
+                    },
                     {
                         "name": "department",
                         "type": DataType.VARCHAR,
@@ -169,20 +344,43 @@ class MilvusService:
                 "description": f"RAG collection for {collection_name} with Milvus 2.6 features"
             }
 
-            client.create_collection(
-                collection_name=collection_name,
-                schema=schema,
-                index_params={
+            if partitioned:
+                schema["fields"].append({
+                    "name": PARTITION_KEY_FIELD,
+                    "type": DataType.VARCHAR,
+                    "max_length": 255,
+                    "is_partition_key": True
+                })
+                schema["num_partitions"] = settings.MILVUS_PARTITION_KEY_NUM_PARTITIONS
+
+            if settings.MILVUS_INDEX_AUTO_PROFILE:
+                # Collections only start on FLAT when something will rebuild them as they grow; the shared
+                # partition-key collection holds every tenant and is never rebuilt automatically
+                if settings.MILVUS_INDEX_AUTO_REBUILD and not partitioned:
+                    initial = select_index_profile(0)
+                else:
+                    initial = get_index_profile(PROFILE_HNSW)
+                index_params = build_index_params(initial)
+            else:
+                index_params = {
                     "field_name": "vector",
                     "index_type": settings.MILVUS_INDEX_TYPE,
                     "metric_type": settings.MILVUS_METRIC_TYPE,
                     "params": settings.MILVUS_INDEX_PARAMS
                 }
+
+            client.create_collection(
+                collection_name=collection_name,
+                schema=schema,
+                index_params=index_params
             )
 
             if settings.MILVUS_HYBRID_SEARCH_ENABLED:
                 self._create_text_search_function(client, collection_name)
 
+            if settings.MILVUS_FILTER_INDEXES_ENABLED:
+                create_filter_indexes(client, collection_name, configured_filter_indexes())
+
             client.load_collection(collection_name)
 
             logger.info(f"Successfully created Milvus 2.6 collection: {collection_name}")
@@ -217,6 +415,24 @@ class MilvusService:
         except Exception as e:
             logger.warning(f"Failed to create text search function: {e}")
     
+    @staticmethod
+    def resolve_milvus_instance(collection_name: str) -> str:
+        """Milvus instance holding a collection named {tenant_id}-{department_id}-public/private"""
+        if collection_name.endswith(("-public", "_public")):
+            return DBDocumentPermissionLevel.PUBLIC.value
+        return DBDocumentPermissionLevel.PRIVATE.value
+
+    @staticmethod
+    def _resolve_mmr_lambda(use_mmr: Optional[bool], mmr_lambda: Optional[float]) -> Optional[float]:
+        """MMR lambda to apply, or None when MMR is disabled"""
+        if not (settings.MMR_ENABLED if use_mmr is None else use_mmr):
+            return None
+        return settings.MMR_LAMBDA_DEFAULT if mmr_lambda is None else mmr_lambda
+
+    async def _encode_query(self, query: str) -> np.ndarray:
+        query_embeddings = await embedding_service.encode_queries([query])
+        return query_embeddings["dense_vectors"][0]
+
     async def search_documents(
         self,
         query: str,
@@ -225,51 +441,411 @@ class MilvusService:
         top_k: int = 10,
         score_threshold: float = 0.7,
         filter_expr: Optional[str] = None,
-        enable_hybrid_search: bool = True
+        enable_hybrid_search: bool = True,
+        use_mmr: Optional[bool] = None,
+        mmr_lambda: Optional[float] = None,
+        query_vector: Optional[np.ndarray] = None
     ) -> List[Dict[str, Any]]:
         """
         Search documents using Milvus 2.6 hybrid search (vector + keyword)
+        With MMR, top_k * MMR_FETCH_MULTIPLIER candidates are fetched with their vectors
+        and diversified locally down to top_k.
         """
         try:
-            await self.ensure_collection_exists(collection_name, milvus_instance)
+            if query_vector is None:
+                query_vector = await self._encode_query(query)
 
-            client = self._get_client(milvus_instance)
+            results = await self._search_collection(
+                query=query,
+                query_vector=query_vector,
+                collection_name=collection_name,
+                milvus_instance=milvus_instance,
+                top_k=top_k,
+                score_threshold=score_threshold,
+                filter_expr=filter_expr,
+                enable_hybrid_search=enable_hybrid_search,
+                mmr_lambda=self._resolve_mmr_lambda(use_mmr, mmr_lambda)
+            )
+            return await self.hydrate_results(results, collection_name, milvus_instance)
 
+        except Exception as e:
+            logger.error(f"Search failed in collection {collection_name}: {e}")
+            return []
+
+    async def search_collections(
+        self,
+        query: str,
+        collection_names: List[str],
+        top_k: int = 10,
+        final_top_k: int = 15,
+        score_threshold: float = 0.7,
+        filter_expr: Optional[str] = None,
+        enable_hybrid_search: bool = True,
+        use_mmr: Optional[bool] = None,
+        mmr_lambda: Optional[float] = None,
+        fusion: Optional[str] = None,
+        query_vector: Optional[np.ndarray] = None
+    ) -> Dict[str, Any]:
+        """
+        Search several collections (across public and private instances) for one query.
+        The query is embedded once, every collection is searched concurrently and
+        per-collection rankings are fused (RRF by default). Chunk text is fetched only for the
+        fused top final_top_k.
+
+        Returns:
+            Dictionary with fused results (each tagged with collection, collection_type and
+            milvus_instance), searched and failed collections, and result counts per collection
+        """
+        if query_vector is None:
+            query_vector = await self._encode_query(query)
+        resolved_mmr_lambda = self._resolve_mmr_lambda(use_mmr, mmr_lambda)
+
+        async def search_one(collection_name: str) -> List[Dict[str, Any]]:
+            milvus_instance = self.resolve_milvus_instance(collection_name)
+            results = await self._search_collection(
+                query=query,
+                query_vector=query_vector,
+                collection_name=collection_name,
+                milvus_instance=milvus_instance,
+                top_k=top_k,
+                score_threshold=score_threshold,
+                filter_expr=filter_expr,
+                enable_hybrid_search=enable_hybrid_search,
+                mmr_lambda=resolved_mmr_lambda
+            )
+            collection_type = "public" if milvus_instance == DBDocumentPermissionLevel.PUBLIC.value else "private"
+            for result in results:
+                result["collection"] = collection_name
+                result["collection_type"] = collection_type
+                result["milvus_instance"] = milvus_instance
+            return results
+
+        outcomes = await asyncio.gather(*[search_one(name) for name in collection_names], return_exceptions=True)
+
+        ranked_lists = []
+        summary = {
+            "collections_searched": [],
+            "collections_failed": [],
+            "total_results_by_collection": {}
+        }
+        for collection_name, outcome in zip(collection_names, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.warning(f"Failed to search collection {collection_name}: {outcome}")
+                summary["collections_failed"].append({"collection": collection_name, "error": str(outcome)})
+                continue
+            ranked_lists.append(outcome)
+            summary["collections_searched"].append(collection_name)
+            summary["total_results_by_collection"][collection_name] = len(outcome)
+
+        fused = fuse_results(
+            ranked_lists,
+            method=fusion or settings.MILVUS_FUSION_METHOD,
+            rrf_k=settings.MILVUS_FUSION_RRF_K,
+            limit=final_top_k
+        )
+        return {
+            "results": await self.hydrate_results(fused),
+            "total_results": sum(len(results) for results in ranked_lists),
+            **summary
+        }
+
+    async def batch_search_collections(
+        self,
+        queries: List[str],
+        collection_names: List[str],
+        top_k: int = 10,
+        final_top_k: int = 15,
+        score_threshold: float = 0.7,
+        filter_expr: Optional[str] = None,
+        enable_hybrid_search: bool = True,
+        use_mmr: Optional[bool] = None,
+        mmr_lambda: Optional[float] = None,
+        fusion: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Search several collections for many queries at once (evaluation and multi-query workloads).
+        All queries are embedded in one batched call and sent to each collection as a single
+        multi-vector search request; per-query rankings are fused across collections as in
+        search_collections, and chunk text for all final results is fetched in one pass.
+        The retrieval cache is bypassed.
+
+        Returns:
+            Dictionary with results (one fused list per query, in query order), searched and
+            failed collections
+        """
+        if not queries:
+            return {"results": [], "collections_searched": [], "collections_failed": []}
+
+        embeddings = await embedding_service.encode_queries(queries)
+        query_vectors = np.asarray(embeddings["dense_vectors"], dtype=np.float32)
+        resolved_mmr_lambda = self._resolve_mmr_lambda(use_mmr, mmr_lambda)
+
+        async def search_one(collection_name: str) -> List[List[Dict[str, Any]]]:
+            milvus_instance = self.resolve_milvus_instance(collection_name)
+            per_query = await self._batch_search_collection(
+                queries, query_vectors, collection_name, milvus_instance,
+                top_k, score_threshold, filter_expr, enable_hybrid_search, resolved_mmr_lambda
+            )
+            collection_type = "public" if milvus_instance == DBDocumentPermissionLevel.PUBLIC.value else "private"
+            for results in per_query:
+                for result in results:
+                    result["collection"] = collection_name
+                    result["collection_type"] = collection_type
+                    result["milvus_instance"] = milvus_instance
+            return per_query
+
+        outcomes = await asyncio.gather(*[search_one(name) for name in collection_names], return_exceptions=True)
+
+        per_collection = []
+        summary = {"collections_searched": [], "collections_failed": []}
+        for collection_name, outcome in zip(collection_names, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.warning(f"Failed to batch search collection {collection_name}: {outcome}")
+                summary["collections_failed"].append({"collection": collection_name, "error": str(outcome)})
+                continue
+            per_collection.append(outcome)
+            summary["collections_searched"].append(collection_name)
+
+        fused = [
+            fuse_results(
+                [results[i] for results in per_collection],
+                method=fusion or settings.MILVUS_FUSION_METHOD,
+                rrf_k=settings.MILVUS_FUSION_RRF_K,
+                limit=final_top_k
+            )
+            for i in range(len(queries))
+        ]
+        await self.hydrate_results([result for results in fused for result in results])
+        return {"results": fused, **summary}
+
+    async def _batch_search_collection(
+        self,
+        queries: List[str],
+        query_vectors: np.ndarray,
+        collection_name: str,
+        milvus_instance: str,
+        top_k: int,
+        score_threshold: float,
+        filter_expr: Optional[str],
+        enable_hybrid_search: bool,
+        mmr_lambda: Optional[float]
+    ) -> List[List[Dict[str, Any]]]:
+        """Search one logical collection for every query in one request; one result list per query"""
+        await self.ensure_collection_exists(collection_name, milvus_instance)
+        if await self._is_local(collection_name):
+            return [
+                await self._local_search(collection_name, vector, top_k, score_threshold, filter_expr, mmr_lambda)
+                for vector in query_vectors
+            ]
+
+        target = resolve_collection(collection_name)
+        scoped_filter = target.scope_filter(filter_expr)
+        limit = top_k * settings.MMR_FETCH_MULTIPLIER if mmr_lambda is not None else top_k
+        output_fields = self._search_output_fields(mmr_lambda is not None)
+        profile = await self._get_index_profile(milvus_instance, target.physical_name)
+        client = self._get_client(milvus_instance)
+        data = query_vectors.tolist()
+        await self._ensure_loaded(milvus_instance, target.physical_name)
+
+        async def vector_search() -> List:
+            return await self._call(
+                milvus_instance,
+                client.search,
+                collection_name=target.physical_name,
+                data=data,
+                limit=limit,
+                search_params=build_search_params(profile, limit),
+                output_fields=output_fields,
+                filter=scoped_filter
+            )
+
+        async def search() -> Tuple[List, str]:
+            if not (enable_hybrid_search and settings.MILVUS_HYBRID_SEARCH_ENABLED):
+                return await vector_search(), "vector"
+            try:
+                search_results = await self._call(
+                    milvus_instance,
+                    client.hybrid_search,
+                    collection_name=target.physical_name,
+                    reqs=[
+                        AnnSearchRequest(
+                            data=data,
+                            anns_field="vector",
+                            search_params=build_search_params(profile, limit * 2),
+                            limit=limit * 2,
+                            expr=scoped_filter
+                        ),
+                        AnnSearchRequest(
+                            data=list(queries),
+                            anns_field="sparse_vector",
+                            search_params={"metric_type": "BM25", "params": {}},
+                            limit=limit * 2,
+                            expr=scoped_filter
+                        )
+                    ],
+                    ranker=RRFRanker(k=settings.MILVUS_HYBRID_RRF_K),
+                    limit=limit,
+                    output_fields=output_fields
+                )
+                return search_results, "hybrid"
+            except Exception as e:
+                if "not loaded" in str(e).lower():
+                    raise
+                logger.warning(f"Hybrid batch search failed, falling back to vector search: {e}")
+                return await vector_search(), "vector"
+
+        try:
+            search_results, search_type = await search()
+        except Exception as e:
+            if not self.residency or "not loaded" not in str(e).lower():
+                raise
+            await self._ensure_loaded(milvus_instance, target.physical_name, force_check=True)
+            search_results, search_type = await search()
+
+        return [
+            self._diversify(
+                self._process_search_results([hits], score_threshold, search_type),
+                query_vectors[i],
+                top_k,
+                mmr_lambda
+            )
+            for i, hits in enumerate(search_results)
+        ]
+
+    async def _search_collection(
+        self,
+        query: str,
+        query_vector: np.ndarray,
+        collection_name: str,
+        milvus_instance: str,
+        top_k: int,
+        score_threshold: float,
+        filter_expr: Optional[str],
+        enable_hybrid_search: bool,
+        mmr_lambda: Optional[float]
+    ) -> List[Dict[str, Any]]:
+        """
+        Search one logical collection with a precomputed query vector (raises on failure)
+        Served from the retrieval cache when the collection has not changed since the same search.
+        """
+        cache_key = None
+        if self.retrieval_cache:
+            params = {
+                "top_k": top_k,
+                "score_threshold": score_threshold,
+                "filter": filter_expr,
+                "hybrid": enable_hybrid_search and settings.MILVUS_HYBRID_SEARCH_ENABLED,
+                "mmr_lambda": mmr_lambda
+            }
+            cache_key, cached = await self.retrieval_cache.get(
+                collection_name, query, query_vector, params, embedding_service.model_version
+            )
+            if cached is not None:
+                return cached
+
+        start = time.perf_counter()
+        results = await self._search_collection_uncached(
+            query, query_vector, collection_name, milvus_instance,
+            top_k, score_threshold, filter_expr, enable_hybrid_search, mmr_lambda
+        )
+        if cache_key:
+            await self.retrieval_cache.set(cache_key, results, time.perf_counter() - start)
+        return results
+
+    async def _search_collection_uncached(
+        self,
+        query: str,
+        query_vector: np.ndarray,
+        collection_name: str,
+        milvus_instance: str,
+        top_k: int,
+        score_threshold: float,
+        filter_expr: Optional[str],
+        enable_hybrid_search: bool,
+        mmr_lambda: Optional[float]
+    ) -> List[Dict[str, Any]]:
+        await self.ensure_collection_exists(collection_name, milvus_instance)
+        if await self._is_local(collection_name):
+            return await self._local_search(collection_name, query_vector, top_k, score_threshold, filter_expr, mmr_lambda)
+
+        target = resolve_collection(collection_name)
+        scoped_filter = target.scope_filter(filter_expr)
+        await self._ensure_loaded(milvus_instance, target.physical_name)
+
+        async def search() -> List[Dict[str, Any]]:
             if enable_hybrid_search and settings.MILVUS_HYBRID_SEARCH_ENABLED:
                 return await self._hybrid_search(
-                    client, query, collection_name, top_k, score_threshold, filter_expr
-                )
-            else:
-                return await self._vector_search_only(
-                    client, query, collection_name, top_k, score_threshold, filter_expr
+                    milvus_instance, query, query_vector, target.physical_name, top_k, score_threshold, scoped_filter, mmr_lambda
                 )
+            return await self._vector_search_only(
+                milvus_instance, query_vector, target.physical_name, top_k, score_threshold, scoped_filter, mmr_lambda
+            )
 
+        try:
+            return await search()
         except Exception as e:
-            logger.error(f"Search failed in collection {collection_name}: {e}")
-            return []
+            # Another worker may have released the collection since our last load-state check
+            if not self.residency or "not loaded" not in str(e).lower():
+                raise
+            await self._ensure_loaded(milvus_instance, target.physical_name, force_check=True)
+            return await search()
+
+    async def _is_local(self, collection_name: str) -> bool:
+        """Whether a logical collection is served by the local vector store"""
+        if settings.VECTOR_STORE_BACKEND == BACKEND_LOCAL:
+            return True
+        return bool(self.local_store) and await self.local_store.has_collection(collection_name)
+
+    async def _local_search(
+        self,
+        collection_name: str,
+        query_vector: np.ndarray,
+        top_k: int,
+        score_threshold: float,
+        filter_expr: Optional[str],
+        mmr_lambda: Optional[float]
+    ) -> List[Dict[str, Any]]:
+        """Exact vector search in the local store (hybrid search is not available locally)"""
+        limit = top_k * settings.MMR_FETCH_MULTIPLIER if mmr_lambda is not None else top_k
+        output_fields = self._row_output_fields(mmr_lambda is not None)
+        search_results = await self.local_store.search(collection_name, query_vector, limit, filter_expr, output_fields)
+        results = self._process_search_results(search_results, score_threshold, "local")
+        return self._diversify(results, query_vector, top_k, mmr_lambda)
+
+    @staticmethod
+    def _row_output_fields(include_vector: bool = False) -> List[str]:
+        """All stored scalar fields (local rows keep their text, so these results need no hydration)"""
+        fields = ["text", "chunk_id", "document_id", "department", "document_source", "metadata", "created_at"]
+        if include_vector:
+            fields.append("vector")
+        return fields
+
+    async def _ensure_loaded(self, milvus_instance: str, physical_name: str, force_check: bool = False) -> None:
+        """Load the collection on first access if the residency manager released it"""
+        if self.residency:
+            await self.residency.ensure_loaded(milvus_instance, physical_name, force_check=force_check)
 
     async def _hybrid_search(
         self,
-        client: MilvusClient,
+        milvus_instance: str,
         query: str,
+        query_vector: np.ndarray,
         collection_name: str,
         top_k: int,
         score_threshold: float,
-        filter_expr: Optional[str]
+        filter_expr: Optional[str],
+        mmr_lambda: Optional[float] = None
     ) -> List[Dict[str, Any]]:
         """Perform hybrid vector + keyword search using Milvus 2.6"""
         try:
-            query_embeddings = await embedding_service.encode_queries([query])
-            query_vector = query_embeddings["dense_vectors"][0].tolist()
+            limit = top_k * settings.MMR_FETCH_MULTIPLIER if mmr_lambda is not None else top_k
+            profile = await self._get_index_profile(milvus_instance, collection_name)
 
             vector_search = AnnSearchRequest(
-                data=[query_vector],
+                data=[query_vector.tolist()],
                 anns_field="vector",
-                search_params={
-                    "metric_type": settings.MILVUS_METRIC_TYPE,
-                    "params": {"ef": 200}
-                },
-                limit=top_k * 2,
+                search_params=build_search_params(profile, limit * 2),
+                limit=limit * 2,
                 expr=filter_expr
             )
 
@@ -280,57 +856,84 @@ class MilvusService:
                     "metric_type": "BM25",
                     "params": {}
                 },
-                limit=top_k * 2,
+                limit=limit * 2,
                 expr=filter_expr
             )
 
-            search_results = client.hybrid_search(
+            client = self._get_client(milvus_instance)
+            search_results = await self._call(
+                milvus_instance,
+                client.hybrid_search,
                 collection_name=collection_name,
                 reqs=[vector_search, text_search],
-                ranker=RRFRanker(k=60),
-                limit=top_k,
-                output_fields=["text", "document_id", "department", "document_source", "metadata", "created_at"]
+                ranker=RRFRanker(k=settings.MILVUS_HYBRID_RRF_K),
+                limit=limit,
+                output_fields=self._search_output_fields(mmr_lambda is not None)
             )
 
-            return self._process_search_results(search_results, score_threshold, "hybrid")
+            results = self._process_search_results(search_results, score_threshold, "hybrid")
+            return self._diversify(results, query_vector, top_k, mmr_lambda)
 
         except Exception as e:
             logger.warning(f"Hybrid search failed, falling back to vector search: {e}")
             return await self._vector_search_only(
-                client, query, collection_name, top_k, score_threshold, filter_expr
+                milvus_instance, query_vector, collection_name, top_k, score_threshold, filter_expr, mmr_lambda
             )
 
     async def _vector_search_only(
         self,
-        client: MilvusClient,
-        query: str,
+        milvus_instance: str,
+        query_vector: np.ndarray,
         collection_name: str,
         top_k: int,
         score_threshold: float,
-        filter_expr: Optional[str]
+        filter_expr: Optional[str],
+        mmr_lambda: Optional[float] = None
     ) -> List[Dict[str, Any]]:
         """Fallback to vector-only search"""
-        try:
-            query_embeddings = await embedding_service.encode_queries([query])
-            query_vector = query_embeddings["dense_vectors"][0].tolist()
-
-            search_results = client.search(
-                collection_name=collection_name,
-                data=[query_vector],
-                limit=top_k,
-                search_params={
-                    "metric_type": settings.MILVUS_METRIC_TYPE,
-                    "params": {"ef": 200}
-                },
-                output_fields=["text", "document_id", "department", "document_source", "metadata", "created_at"],
-                filter=filter_expr
-            )
+        limit = top_k * settings.MMR_FETCH_MULTIPLIER if mmr_lambda is not None else top_k
+        profile = await self._get_index_profile(milvus_instance, collection_name)
+
+        client = self._get_client(milvus_instance)
+        search_results = await self._call(
+            milvus_instance,
+            client.search,
+            collection_name=collection_name,
+            data=[query_vector.tolist()],
+            limit=limit,
+            search_params=build_search_params(profile, limit),
+            output_fields=self._search_output_fields(mmr_lambda is not None),
+            filter=filter_expr
+        )
 
-            return self._process_search_results(search_results, score_threshold, "vector")
+        results = self._process_search_results(search_results, score_threshold, "vector")
+        return self._diversify(results, query_vector, top_k, mmr_lambda)
 
-        except Exception as e:
-            logger.error(f"Vector search failed: {e}")
-            return []
+    @staticmethod
+    def _search_output_fields(include_vector: bool) -> List[str]:
+        """
+        Scalar output fields, plus the dense vector when candidates are re-ranked locally
+        With the chunk store, text and metadata are not returned by Milvus (see hydrate_results).
+        """
+        if settings.MILVUS_CHUNK_STORE_ENABLED:
+            fields = ["chunk_id", "document_id", "department", "document_source", "created_at"]
+        else:
+            fields = ["text", "document_id", "department", "document_source", "metadata", "created_at"]
+        if include_vector:
+            fields.append("vector")
+        return fields
+
+    @staticmethod
+    def _diversify(
+        results: List[Dict[str, Any]],
+        query_vector: np.ndarray,
+        top_k: int,
+        mmr_lambda: Optional[float]
+    ) -> List[Dict[str, Any]]:
+        """Apply MMR to over-fetched candidates (no-op when MMR is disabled)"""
+        if mmr_lambda is None:
+            return results
+        return apply_mmr(results, query_vector, top_k, mmr_lambda)
 
     def _process_search_results(
         self,
@@ -343,10 +946,18 @@ class MilvusService:
 
         for hits in search_results:
             for hit in hits:
-                score = float(hit.distance) if hasattr(hit, 'distance') else float(hit.score)
+                if hasattr(hit, 'distance'):
+                    score = float(hit.distance)
+                elif isinstance(hit, dict):
+                    score = float(hit.get("distance", hit.get("score", 0.0)))
+                else:
+                    score = float(hit.score)
 
                 if score >= score_threshold:
-                    entity = hit.entity if hasattr(hit, 'entity') else hit
+                    if hasattr(hit, 'entity'):
+                        entity = hit.entity
+                    else:
+                        entity = hit.get("entity", hit) if isinstance(hit, dict) else hit
 
                     metadata = entity.get("metadata", {})
                     if isinstance(metadata, str):
@@ -355,8 +966,10 @@ class MilvusService:
                         except:
                             metadata = {}
 
-                    processed_results.append({
+                    result = {
                         "id": entity.get("document_id", "unknown"),
+                        "pk": hit.get("id") if isinstance(hit, dict) else getattr(hit, "id", None),
+                        "chunk_id": entity.get("chunk_id"),
                         "content": entity.get("text", ""),
                         "score": score,
                         "search_type": search_type,
@@ -367,10 +980,82 @@ class MilvusService:
                             "created_at": entity.get("created_at"),
                             **metadata
                         }
-                    })
+                    }
+                    vector = entity.get("vector")
+                    if vector is not None:
+                        result["vector"] = vector
+                    processed_results.append(result)
 
         logger.info(f"Found {len(processed_results)} results using {search_type} search")
         return processed_results
+
+    async def hydrate_results(
+        self,
+        results: List[Dict[str, Any]],
+        collection_name: Optional[str] = None,
+        milvus_instance: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Fill content and metadata of final results from the chunk store
+        Rows indexed before the chunk store (no chunk_id) are fetched from Milvus by primary key.
+
+        Args:
+            collection_name, milvus_instance: Defaults for results not tagged by search_collections
+        """
+        if not settings.MILVUS_CHUNK_STORE_ENABLED or not results:
+            return results
+
+        pending = [result for result in results if not result.get("content")]
+        if not pending:
+            return results
+
+        stored = await chunk_store.get_many([result.get("chunk_id") for result in pending])
+        missing: Dict[tuple, List[Dict[str, Any]]] = {}
+
+        for result in pending:
+            chunk = stored.get(result.get("chunk_id") or "")
+            if chunk:
+                result["content"] = chunk["content"]
+                result["metadata"] = {**chunk["metadata"], **result["metadata"]}
+            elif result.get("pk") is not None:
+                key = (
+                    result.get("milvus_instance", milvus_instance),
+                    result.get("collection", collection_name)
+                )
+                missing.setdefault(key, []).append(result)
+
+        if missing:
+            await asyncio.gather(*[
+                self._hydrate_from_milvus(instance, name, group)
+                for (instance, name), group in missing.items() if instance and name
+            ])
+        return results
+
+    async def _hydrate_from_milvus(
+        self,
+        milvus_instance: str,
+        collection_name: str,
+        results: List[Dict[str, Any]]
+    ) -> None:
+        try:
+            client = self._get_client(milvus_instance)
+            physical_name = resolve_collection(collection_name).physical_name
+            rows = await self._call_loaded(
+                milvus_instance,
+                physical_name,
+                client.get,
+                collection_name=physical_name,
+                ids=[result["pk"] for result in results],
+                output_fields=["text", "metadata"]
+            )
+            by_pk = {row.get("id"): row for row in rows}
+            for result in results:
+                row = by_pk.get(result["pk"])
+                if row:
+                    result["content"] = row.get("text", "")
+                    result["metadata"] = {**(row.get("metadata") or {}), **result["metadata"]}
+        except Exception as e:
+            logger.warning(f"Failed to hydrate {len(results)} results from {collection_name}: {e}")
     
     async def insert_documents(
         self,
@@ -380,42 +1065,227 @@ class MilvusService:
     ) -> bool:
         """
         Insert documents into collection with real embeddings
+        Streams in windows of MILVUS_INSERT_BATCH_SIZE: each window is embedded and inserted
+        while at most MILVUS_INSERT_MAX_IN_FLIGHT earlier inserts are pending, so memory and
+        request size stay bounded regardless of document size.
+        If a window fails, pending inserts are awaited and the rows of already inserted windows are
+        deleted again by chunk id, so a failed call leaves none of the documents behind.
         """
+        in_flight: set = set()
+        inserted = 0
+        writing = False
         try:
             await self.ensure_collection_exists(collection_name, milvus_instance)
             
-            client = self._get_client(milvus_instance)
-            
-            texts = [doc["text"] for doc in documents]
+            if await self._is_local(collection_name):
+                if await self._fits_local_store(collection_name, len(documents)):
+                    writing = True
+                    inserted = await self._insert_local(documents, collection_name)
+                    logger.info(f"Inserted {inserted} documents into local collection {collection_name}")
+                    return True
+                await self._promote_local_collection(collection_name, milvus_instance)
             
-            embeddings = await embedding_service.encode_documents(texts)
-            dense_vectors = embeddings["dense_vectors"]
-            
-            insert_data = []
+            client = self._get_client(milvus_instance)
+            target = resolve_collection(collection_name)
             current_time = int(datetime.now().timestamp() * 1000)  # Milvus timestamp format
-
-            for i, doc in enumerate(documents):
-                insert_data.append({
-                    "vector": dense_vectors[i].tolist(),
-                    "text": doc["text"],
-                    "document_id": doc["document_id"],
-                    "department": doc["department"],
-                    "document_source": doc["document_source"],
-                    "metadata": doc.get("metadata", {}),
-                    "created_at": current_time
-                })
+            window = max(1, settings.MILVUS_INSERT_BATCH_SIZE)
             
-            result = client.insert(
-                collection_name=collection_name,
-                data=insert_data
-            )
+            for start in range(0, len(documents), window):
+                batch = documents[start:start + window]
+                embeddings = await embedding_service.encode_documents([doc["text"] for doc in batch])
+                rows = self._build_insert_rows(batch, embeddings["dense_vectors"], target, current_time)
+                
+                if len(in_flight) >= settings.MILVUS_INSERT_MAX_IN_FLIGHT:
+                    done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                    inserted += sum(task.result() for task in done)
+                
+                writing = True
+                in_flight.add(asyncio.create_task(
+                    self._insert_rows(milvus_instance, client, target.physical_name, rows)
+                ))
+            
+            if in_flight:
+                inserted += sum(await asyncio.gather(*in_flight))
+                in_flight = set()
             
-            logger.info(f"Inserted {len(insert_data)} documents into {collection_name}")
+            logger.info(f"Inserted {inserted} documents into {collection_name}")
+            self._schedule_index_profile_check(collection_name, milvus_instance)
             return True
             
         except Exception as e:
-            logger.error(f"Failed to insert documents into {collection_name}: {e}")
+            # Executor calls cannot be cancelled; let them land before deleting what was written
+            if in_flight:
+                await asyncio.gather(*in_flight, return_exceptions=True)
+            logger.error(f"Failed to insert documents into {collection_name} ({inserted}/{len(documents)} inserted): {e}")
+            if writing:
+                await self._delete_chunk_rows(documents, collection_name, milvus_instance)
             return False
+
+        finally:
+            await self._invalidate_retrieval_cache(collection_name)
+
+    async def _delete_chunk_rows(
+        self,
+        documents: List[Dict[str, Any]],
+        collection_name: str,
+        milvus_instance: str
+    ) -> None:
+        """Delete the rows of documents by chunk id (rollback of a failed insert_documents)"""
+        by_document: Dict[str, List[str]] = {}
+        for doc in documents:
+            if doc.get("chunk_id"):
+                by_document.setdefault(doc["document_id"], []).append(doc["chunk_id"])
+        if len(documents) > sum(len(chunk_ids) for chunk_ids in by_document.values()):
+            logger.warning(f"Rows without chunk ids cannot be rolled back in {collection_name}")
+
+        window = max(1, settings.MILVUS_INSERT_BATCH_SIZE)
+        for document_id, chunk_ids in by_document.items():
+            for start in range(0, len(chunk_ids), window):
+                chunk_list = ", ".join(f'"{chunk_id}"' for chunk_id in chunk_ids[start:start + window])
+                if not await self.bulk_delete_by_filter(
+                    f'document_id == "{document_id}" and chunk_id in [{chunk_list}]',
+                    collection_name,
+                    milvus_instance,
+                    compact=False
+                ):
+                    logger.error(f"Failed to roll back inserted chunks of document {document_id} in {collection_name}")
+
+    async def _fits_local_store(self, collection_name: str, new_rows: int) -> bool:
+        """Local collections stay local below VECTOR_LOCAL_MAX_ROWS (always, with the local backend)"""
+        if settings.VECTOR_STORE_BACKEND == BACKEND_LOCAL:
+            return True
+        return await self.local_store.count(collection_name) + new_rows <= settings.VECTOR_LOCAL_MAX_ROWS
+
+    async def _insert_local(self, documents: List[Dict[str, Any]], collection_name: str) -> int:
+        """Embed and append documents to the local store in MILVUS_INSERT_BATCH_SIZE windows"""
+        target = resolve_collection(collection_name, layout=LAYOUT_PER_COLLECTION)
+        current_time = int(datetime.now().timestamp() * 1000)
+        window = max(1, settings.MILVUS_INSERT_BATCH_SIZE)
+        inserted = 0
+
+        for start in range(0, len(documents), window):
+            batch = documents[start:start + window]
+            embeddings = await embedding_service.encode_documents([doc["text"] for doc in batch])
+            rows = self._build_insert_rows(batch, embeddings["dense_vectors"], target, current_time)
+            for row, doc in zip(rows, batch):
+                row["text"] = doc["text"]
+            inserted += await self.local_store.insert(collection_name, rows)
+
+        return inserted
+
+    async def _promote_local_collection(self, collection_name: str, milvus_instance: str) -> None:
+        """
+        Move a local collection that outgrew VECTOR_LOCAL_MAX_ROWS to Milvus
+        Stored vectors are copied as-is (no re-embedding); the local copy is dropped afterwards.
+        A Redis lock serializes promotion across workers; whoever gets the lock second finds the
+        local copy gone and has nothing left to move.
+        """
+        lock_key = f"vector:promote:{collection_name}"
+        redis = redis_client.get_client()
+        if redis:
+            deadline = time.monotonic() + PROMOTE_LOCK_TTL_S
+            while not await redis.set(lock_key, "1", nx=True, ex=PROMOTE_LOCK_TTL_S):
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"Timed out waiting for promotion of {collection_name}")
+                await asyncio.sleep(PROMOTE_LOCK_POLL_S)
+
+        try:
+            if not await self.local_store.has_collection(collection_name):
+                logger.info(f"Local collection {collection_name} was already moved to Milvus")
+                return
+
+            client = self._get_client(milvus_instance)
+            target = resolve_collection(collection_name)
+            rows = await self.local_store.fetch_all(collection_name)
+            logger.info(f"Moving local collection {collection_name} ({len(rows)} rows) to {milvus_instance}")
+
+            await self._ensure_milvus_collection(target, milvus_instance)
+
+            window = max(1, settings.MILVUS_INSERT_BATCH_SIZE)
+            for start in range(0, len(rows), window):
+                batch = []
+                for row in rows[start:start + window]:
+                    row = {k: v for k, v in row.items() if k != "id"}
+                    if target.is_partitioned:
+                        row[target.partition_key_field] = target.partition_value
+                    batch.append(row)
+                await self._insert_rows(milvus_instance, client, target.physical_name, batch)
+
+            await self.local_store.drop_collection(collection_name)
+            self.collection_cache[f"{milvus_instance}:{target.physical_name}"] = True
+            await self._ensure_loaded(milvus_instance, target.physical_name, force_check=True)
+        finally:
+            if redis:
+                try:
+                    await redis.delete(lock_key)
+                except Exception as e:
+                    logger.warning(f"Failed to release promotion lock of {collection_name}: {e}")
+
+    async def _ensure_milvus_collection(self, target: CollectionTarget, milvus_instance: str) -> None:
+        """Create the physical Milvus collection if missing (bypasses the local store)"""
+        client = self._get_client(milvus_instance)
+        if await self._call(milvus_instance, client.has_collection, target.physical_name):
+            return
+        created = await self._call(
+            milvus_instance,
+            self._create_collection,
+            collection_name=target.physical_name,
+            client=client,
+            partitioned=target.is_partitioned,
+            timeout=settings.MILVUS_LOAD_TIMEOUT_MS / 1000
+        )
+        if not created:
+            raise RuntimeError(f"Failed to create Milvus collection {target.physical_name}")
+
+    async def _invalidate_retrieval_cache(self, collection_name: str) -> None:
+        """Make cached search results of a logical collection unreachable after a write"""
+        if self.retrieval_cache:
+            await self.retrieval_cache.invalidate(collection_name)
+
+    @staticmethod
+    def _build_insert_rows(
+        documents: List[Dict[str, Any]],
+        dense_vectors: np.ndarray,
+        target: CollectionTarget,
+        created_at: int
+    ) -> List[Dict[str, Any]]:
+        """Build insert rows; vectors stay float32 NumPy rows (no per-element Python floats)"""
+        vectors = np.asarray(dense_vectors, dtype=np.float32)
+        rows = []
+        for doc, vector in zip(documents, vectors):
+            row = {
+                "vector": vector,
+                "text": doc["text"],
+                "document_id": doc["document_id"],
+                "department": doc["department"],
+                "document_source": doc["document_source"],
+                "metadata": doc.get("metadata", {}),
+                "created_at": created_at
+            }
+            if doc.get("chunk_id"):
+                row["chunk_id"] = doc["chunk_id"]
+                # The body lives in the chunk store; Milvus keeps it only as BM25 input
+                if settings.MILVUS_CHUNK_STORE_ENABLED and not settings.MILVUS_HYBRID_SEARCH_ENABLED:
+                    row["text"] = ""
+            if target.is_partitioned:
+                row[target.partition_key_field] = target.partition_value
+            rows.append(row)
+        return rows
+
+    async def _insert_rows(
+        self,
+        milvus_instance: str,
+        client: MilvusClient,
+        physical_name: str,
+        rows: List[Dict[str, Any]]
+    ) -> int:
+        result = await self._call(
+            milvus_instance,
+            client.insert,
+            collection_name=physical_name,
+            data=rows
+        )
+        return int(result.get("insert_count", len(rows))) if isinstance(result, dict) else len(rows)
     
     async def create_department_collections(
         self,
@@ -442,9 +1312,11 @@ class MilvusService:
         logger.info(f"Created collections for department {department_id}: {public_collection}, {private_collection}")
         return results
     
-    def get_collection_stats(self) -> Dict[str, Any]:
+    async def get_collection_stats(self, refresh: bool = False) -> Dict[str, Any]:
         """
         Get comprehensive collection statistics with Milvus 2.6 features
+        Per-collection figures come from the stats collector's snapshot (collected now when
+        refresh is set or no snapshot exists); without the collector every collection is described.
         """
         try:
             stats = {
@@ -463,6 +1335,9 @@ class MilvusService:
                     "metric": settings.MILVUS_METRIC_TYPE,
                     "params": settings.MILVUS_INDEX_PARAMS
                 },
+                "retrieval_cache": self.retrieval_cache.get_stats() if self.retrieval_cache else {"enabled": False},
+                "residency": await self.residency.get_stats() if self.residency else {"enabled": False},
+                "compaction": await self.compaction_scheduler.get_stats() if self.compaction_scheduler else {"enabled": False},
                 "performance_config": {
                     "connection_pool_size": settings.MILVUS_CONNECTION_POOL_SIZE,
                     "query_timeout_ms": settings.MILVUS_QUERY_TIMEOUT_MS,
@@ -482,37 +1357,16 @@ class MilvusService:
                 }
             }
 
-            try:
-                public_collections = self.public_client.list_collections()
-                stats["public_instance"]["collections"] = public_collections
-                stats["public_instance"]["count"] = len(public_collections)
-
-                for collection in public_collections:
-                    try:
-                        desc = self.public_client.describe_collection(collection)
-                        stats["public_instance"][f"{collection}_schema"] = desc
-                    except Exception as e:
-                        logger.debug(f"Failed to describe collection {collection}: {e}")
-
-            except Exception as e:
-                logger.error(f"Failed to get public collections: {e}")
-                stats["public_instance"]["error"] = str(e)
-
-            try:
-                private_collections = self.private_client.list_collections()
-                stats["private_instance"]["collections"] = private_collections
-                stats["private_instance"]["count"] = len(private_collections)
-
-                for collection in private_collections:
-                    try:
-                        desc = self.private_client.describe_collection(collection)
-                        stats["private_instance"][f"{collection}_schema"] = desc
-                    except Exception as e:
-                        logger.debug(f"Failed to describe collection {collection}: {e}")
-
-            except Exception as e:
-                logger.error(f"Failed to get private collections: {e}")
-                stats["private_instance"]["error"] = str(e)
+            if self.stats_collector:
+                snapshot = await self.stats_collector.get_snapshot(refresh=refresh)
+                stats["snapshot"] = {key: snapshot[key] for key in ("collected_at", "duration_s", "age_s")}
+                stats["public_instance"].update(snapshot["instances"].get(DBDocumentPermissionLevel.PUBLIC.value, {}))
+                stats["private_instance"].update(snapshot["instances"].get(DBDocumentPermissionLevel.PRIVATE.value, {}))
+            else:
+                await asyncio.gather(
+                    self._collect_instance_stats(DBDocumentPermissionLevel.PUBLIC.value, stats["public_instance"]),
+                    self._collect_instance_stats(DBDocumentPermissionLevel.PRIVATE.value, stats["private_instance"])
+                )
 
             return stats
 
@@ -525,11 +1379,34 @@ class MilvusService:
                 "error": str(e)
             }
     
+    async def _collect_instance_stats(self, milvus_instance: str, instance_stats: Dict[str, Any]) -> None:
+        """List and describe all collections of one instance (describes run concurrently)"""
+        client = self._get_client(milvus_instance)
+        try:
+            collections = await self._call(milvus_instance, client.list_collections)
+            instance_stats["collections"] = collections
+            instance_stats["count"] = len(collections)
+
+            descriptions = await asyncio.gather(
+                *[self._call(milvus_instance, client.describe_collection, collection) for collection in collections],
+                return_exceptions=True
+            )
+            for collection, desc in zip(collections, descriptions):
+                if isinstance(desc, Exception):
+                    logger.debug(f"Failed to describe collection {collection}: {desc}")
+                else:
+                    instance_stats[f"{collection}_schema"] = desc
+
+        except Exception as e:
+            logger.error(f"Failed to get {milvus_instance} collections: {e}")
+            instance_stats["error"] = str(e)
+
     async def bulk_delete_by_filter(
         self,
         filter_expr: str,
         collection_name: str,
-        milvus_instance: str
+        milvus_instance: str,
+        compact: bool = True
     ) -> bool:
         """
         Bulk delete documents using complex filter expressions
@@ -538,26 +1415,50 @@ class MilvusService:
             filter_expr: Milvus filter expression (e.g., "department == 'hr'")
             collection_name: Target collection
             milvus_instance: Milvus instance type
+            compact: Compact the collection afterwards (skipped for small incremental deletes);
+                with the compaction scheduler the collection is only marked dirty
             
         Returns:
             True if deletion successful
         """
         try:
+            if await self._is_local(collection_name):
+                delete_count = await self.local_store.delete(collection_name, filter_expr)
+                await self._invalidate_retrieval_cache(collection_name)
+                logger.info(f"Bulk deleted {delete_count} documents from local collection {collection_name} with filter: {filter_expr}")
+                return True
+            
             client = self._get_client(milvus_instance)
+            target = resolve_collection(collection_name)
             
-            if not client.has_collection(collection_name):
-                logger.warning(f"Collection {collection_name} does not exist")
+            if not await self._call(milvus_instance, client.has_collection, target.physical_name):
+                logger.warning(f"Collection {target.physical_name} does not exist")
                 return False
             
-            result = client.delete(
-                collection_name=collection_name,
-                filter=filter_expr
+            result = await self._call_loaded(
+                milvus_instance,
+                target.physical_name,
+                client.delete,
+                collection_name=target.physical_name,
+                filter=target.scope_filter(filter_expr)
             )
             
-            delete_count = getattr(result, 'delete_count', 0)
+            await self._invalidate_retrieval_cache(collection_name)
+            if isinstance(result, dict):
+                delete_count = int(result.get("delete_count", 0))
+            else:
+                delete_count = getattr(result, 'delete_count', 0)
             logger.info(f"Bulk deleted {delete_count} documents from {collection_name} with filter: {filter_expr}")
             
-            await self.compact_collection(collection_name, milvus_instance)
+            if self.compaction_scheduler:
+                if not await self.compaction_scheduler.mark_dirty(milvus_instance, target.physical_name, delete_count):
+                    # Redis unavailable: compact now if asked to, otherwise the deletes wait for the next one
+                    if compact:
+                        await self.compact_collection(collection_name, milvus_instance)
+                    else:
+                        logger.info(f"Skipped compaction of {collection_name}: could not mark it dirty")
+            elif compact:
+                await self.compact_collection(collection_name, milvus_instance)
             
             return True
             
@@ -569,43 +1470,188 @@ class MilvusService:
         self,
         collection_name: str,
         milvus_instance: str,
-        new_index_params: Optional[Dict[str, Any]] = None
+        new_index_params: Optional[Dict[str, Any]] = None,
+        profile: Optional[str] = None
     ) -> bool:
         """
         Completely rebuild collection index with new parameters
+        
+        Args:
+            new_index_params: Explicit index params (takes precedence over profile)
+            profile: Index profile name (flat, hnsw, ivf_sq8, ivf_rabitq); when neither is
+                given the profile is selected from the current row count
+        
+        Milvus cannot replace the index of a loaded collection, so the collection is released
+        for the duration of the rebuild; other collections keep serving. A Redis lock keeps
+        other workers from rebuilding the same collection at the same time.
         """
+        collection_name = resolve_collection(collection_name).physical_name
+        lock_key = f"milvus:index_rebuild:{milvus_instance}:{collection_name}"
+        redis = None
         try:
+            redis = redis_client.get_client()
+            if redis and not await redis.set(lock_key, "1", nx=True, ex=INDEX_REBUILD_LOCK_TTL_S):
+                logger.info(f"Index rebuild of {collection_name} already running in another worker")
+                redis = None
+                return False
+
             client = self._get_client(milvus_instance)
             
-            default_params = {
-                "field_name": "vector",
-                "index_type": "HNSW",
-                "metric_type": "COSINE",
-                "params": {"M": 16, "efConstruction": 200}
-            }
+            selected: Optional[IndexProfile] = None
+            if new_index_params:
+                index_params = new_index_params
+            else:
+                row_count = await self.get_collection_row_count(collection_name, milvus_instance)
+                selected = get_index_profile(profile) if profile else select_index_profile(row_count)
+                index_params = build_index_params(selected, row_count)
             
-            index_params = new_index_params if new_index_params else default_params
+            load_timeout = settings.MILVUS_LOAD_TIMEOUT_MS / 1000
             
-            client.release_collection(collection_name)
+            await self._call(milvus_instance, client.release_collection, collection_name)
             
             try:
-                client.drop_index(collection_name, "vector")
+                await self._call(milvus_instance, client.drop_index, collection_name, "vector")
             except Exception:
                 pass 
             
-            client.create_index(
+            await self._call(
+                milvus_instance,
+                client.create_index,
                 collection_name=collection_name,
+                timeout=load_timeout,
                 **index_params
             )
             
-            client.load_collection(collection_name)
+            await self._call(milvus_instance, client.load_collection, collection_name, timeout=load_timeout)
+            await self._ensure_loaded(milvus_instance, collection_name, force_check=True)
+            
+            cache_key = f"{milvus_instance}:{collection_name}"
+            if selected:
+                self.index_profile_cache[cache_key] = selected.name
+            else:
+                self.index_profile_cache.pop(cache_key, None)
             
-            logger.info(f"Successfully rebuilt index for {collection_name}")
+            logger.info(f"Successfully rebuilt index for {collection_name} ({index_params.get('index_type')})")
             return True
             
         except Exception as e:
             logger.error(f"Failed to rebuild index for {collection_name}: {e}")
             return False
+        finally:
+            if redis:
+                try:
+                    await redis.delete(lock_key)
+                except Exception as e:
+                    logger.warning(f"Failed to release index rebuild lock of {collection_name}: {e}")
+
+    async def get_collection_row_count(self, collection_name: str, milvus_instance: str) -> int:
+        """Row count of the physical collection (of the logical collection when served locally)"""
+        if await self._is_local(collection_name):
+            return await self.local_store.count(collection_name)
+        client = self._get_client(milvus_instance)
+        physical_name = resolve_collection(collection_name).physical_name
+        stats = await self._call(milvus_instance, client.get_collection_stats, physical_name)
+        return int(stats.get("row_count", 0))
+
+    async def _get_index_profile(self, milvus_instance: str, physical_name: str) -> IndexProfile:
+        """Index profile of a physical collection (described once, then cached)"""
+        cache_key = f"{milvus_instance}:{physical_name}"
+        name = self.index_profile_cache.get(cache_key)
+        if name:
+            return get_index_profile(name)
+
+        try:
+            client = self._get_client(milvus_instance)
+            index = await self._call(milvus_instance, client.describe_index, physical_name, "vector")
+            profile = profile_for_index_type((index or {}).get("index_type"))
+        except Exception as e:
+            logger.debug(f"Failed to describe index of {physical_name}: {e}")
+            return profile_for_index_type(None)
+
+        self.index_profile_cache[cache_key] = profile.name
+        return profile
+
+    async def ensure_index_profile(self, collection_name: str, milvus_instance: str) -> Optional[str]:
+        """
+        Rebuild the index if the collection has grown into a larger profile
+        The shared partition-key collection is skipped: releasing it would stop search for every tenant.
+
+        Returns:
+            The new profile name if the index was rebuilt, otherwise None
+        """
+        physical_name = resolve_collection(collection_name).physical_name
+        check_key = f"{milvus_instance}:{physical_name}"
+        if check_key in self._index_profile_checks or physical_name == settings.MILVUS_SHARED_COLLECTION_NAME:
+            return None
+
+        self._index_profile_checks.add(check_key)
+        try:
+            row_count = await self.get_collection_row_count(physical_name, milvus_instance)
+            wanted = select_index_profile(row_count)
+            current = await self._get_index_profile(milvus_instance, physical_name)
+            # Only grow into larger profiles automatically; shrinking is an explicit rebuild
+            if list_index_profiles().index(wanted.name) <= list_index_profiles().index(current.name):
+                return None
+
+            logger.info(f"Switching {physical_name} index profile {current.name} -> {wanted.name} ({row_count} rows)")
+            if await self.rebuild_collection_index(physical_name, milvus_instance, profile=wanted.name):
+                return wanted.name
+            return None
+
+        except Exception as e:
+            logger.warning(f"Index profile check failed for {physical_name}: {e}")
+            return None
+        finally:
+            self._index_profile_checks.discard(check_key)
+
+    def _schedule_index_profile_check(self, collection_name: str, milvus_instance: str) -> None:
+        """Run ensure_index_profile in the background after writes (MILVUS_INDEX_AUTO_REBUILD)"""
+        if not (settings.MILVUS_INDEX_AUTO_PROFILE and settings.MILVUS_INDEX_AUTO_REBUILD):
+            return
+        task = asyncio.create_task(self.ensure_index_profile(collection_name, milvus_instance))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    async def ensure_filter_indexes(self, collection_name: str, milvus_instance: str) -> List[str]:
+        """
+        Create configured filter indexes missing on an existing collection (checked once per process)
+
+        Returns:
+            Names of the created indexes
+        """
+        if not settings.MILVUS_FILTER_INDEXES_ENABLED or await self._is_local(collection_name):
+            return []
+
+        physical_name = resolve_collection(collection_name).physical_name
+        cache_key = f"{milvus_instance}:{physical_name}"
+        if cache_key in self.filter_index_cache:
+            return []
+
+        self.filter_index_cache.add(cache_key)
+        try:
+            client = self._get_client(milvus_instance)
+            existing = await self._call(milvus_instance, client.list_indexes, physical_name)
+            return await self._call(
+                milvus_instance,
+                create_filter_indexes,
+                client,
+                physical_name,
+                configured_filter_indexes(),
+                existing or [],
+                timeout=settings.MILVUS_LOAD_TIMEOUT_MS / 1000
+            )
+        except Exception as e:
+            self.filter_index_cache.discard(cache_key)
+            logger.warning(f"Filter index check failed for {physical_name}: {e}")
+            return []
+
+    def _schedule_filter_index_check(self, collection_name: str, milvus_instance: str) -> None:
+        """Backfill filter indexes of an existing collection in the background"""
+        if not settings.MILVUS_FILTER_INDEXES_ENABLED:
+            return
+        task = asyncio.create_task(self.ensure_filter_indexes(collection_name, milvus_instance))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
 
     async def compact_collection(
         self,
@@ -613,9 +1659,10 @@ class MilvusService:
         milvus_instance: str
     ) -> bool:
         """Compact collection to optimize storage"""
+        collection_name = resolve_collection(collection_name).physical_name
         try:
             client = self._get_client(milvus_instance)
-            client.compact(collection_name)
+            await self._call(milvus_instance, client.compact, collection_name)
             logger.info(f"Compacted collection {collection_name}")
             return True
         except Exception as e:
@@ -644,32 +1691,11 @@ class MilvusService:
         try:
             await self.ensure_collection_exists(collection_name, milvus_instance)
             
-            documents = []
-            texts = []
+            documents, stored_chunks = self._prepare_chunks(collection_name, chunks, metadata)
             
-            for i, chunk in enumerate(chunks):
-                if hasattr(chunk, 'page_content'):
-                    text = chunk.page_content
-                elif isinstance(chunk, dict):
-                    text = chunk.get('content', chunk.get('text', str(chunk)))
-                else:
-                    text = str(chunk)
-                
-                texts.append(text)
-                
-                chunk_metadata = metadata.copy()
-                if hasattr(chunk, 'metadata') and isinstance(chunk.metadata, dict):
-                    chunk_metadata.update(chunk.metadata)
-                elif isinstance(chunk, dict) and 'metadata' in chunk:
-                    chunk_metadata.update(chunk['metadata'])
-                
-                documents.append({
-                    "text": text,
-                    "document_id": metadata.get("document_id", "unknown"),
-                    "department": metadata.get("department_id", "unknown"),
-                    "document_source": f"chunk_{i}",
-                    "metadata": chunk_metadata
-                })
+            # Bodies are stored before vectors so every searchable chunk can be hydrated
+            if settings.MILVUS_CHUNK_STORE_ENABLED:
+                await chunk_store.put_many(stored_chunks)
             
             success = await self.insert_documents(
                 documents=documents,
@@ -682,12 +1708,210 @@ class MilvusService:
                 return len(chunks)
             else:
                 logger.error(f"Failed to index chunks into {collection_name}")
+                # insert_documents rolled back its vectors; drop the bodies stored for them
+                if settings.MILVUS_CHUNK_STORE_ENABLED:
+                    await chunk_store.delete_many([chunk["chunk_id"] for chunk in stored_chunks])
                 return 0
                 
         except Exception as e:
             logger.error(f"Error indexing document chunks: {e}")
             raise
 
+    @staticmethod
+    def _prepare_chunks(
+        collection_name: str,
+        chunks: List[Any],
+        metadata: Dict[str, Any]
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Build insert documents and chunk store rows for FileProcessor chunks
+
+        Returns:
+            (documents for insert_documents, rows for chunk_store.put_many), both carrying
+            deterministic chunk ids (see build_chunk_id)
+        """
+        documents = []
+        stored_chunks = []
+        document_id = metadata.get("document_id", "unknown")
+        occurrences: Dict[str, int] = {}
+        
+        for i, chunk in enumerate(chunks):
+            if hasattr(chunk, 'page_content'):
+                text = chunk.page_content
+            elif isinstance(chunk, dict):
+                text = chunk.get('content', chunk.get('text', str(chunk)))
+            else:
+                text = str(chunk)
+            
+            chunk_metadata = metadata.copy()
+            if hasattr(chunk, 'metadata') and isinstance(chunk.metadata, dict):
+                chunk_metadata.update(chunk.metadata)
+            elif isinstance(chunk, dict) and 'metadata' in chunk:
+                chunk_metadata.update(chunk['metadata'])
+            
+            occurrence = occurrences.get(text, 0)
+            occurrences[text] = occurrence + 1
+            chunk_id = build_chunk_id(document_id, text, occurrence)
+            
+            documents.append({
+                "text": text,
+                "chunk_id": chunk_id,
+                "document_id": document_id,
+                "department": metadata.get("department_id", "unknown"),
+                "document_source": f"chunk_{i}",
+                "metadata": chunk_metadata
+            })
+            stored_chunks.append({
+                "chunk_id": chunk_id,
+                "document_id": document_id,
+                "collection_name": collection_name,
+                "chunk_index": i,
+                "content": text,
+                "metadata": chunk_metadata
+            })
+        
+        return documents, stored_chunks
+
+    async def reindex_document_chunks(
+        self,
+        collection_name: str,
+        chunks: List[Any],
+        metadata: Dict[str, Any],
+        milvus_instance: str
+    ) -> Dict[str, int]:
+        """
+        Re-index a new version of a document, touching only changed chunks
+        
+        Chunk ids are derived from content, so the new chunking is diffed against the ids stored for
+        the document: new chunks are embedded and inserted, removed chunks are deleted, unchanged
+        chunks keep their vectors (rows whose position or metadata moved are rewritten from the stored
+        vector). New vectors are inserted before old ones are deleted, so searches never see the
+        document missing. Chunk bodies and positions are upserted in the chunk store once the new
+        vectors are in.
+        
+        Returns:
+            Dictionary with added, removed, unchanged, refreshed and total chunk counts
+        """
+        document_id = metadata.get("document_id", "unknown")
+        documents, stored_chunks = self._prepare_chunks(collection_name, chunks, metadata)
+        
+        existing = await chunk_store.get_document_chunk_ids(document_id) if settings.MILVUS_CHUNK_STORE_ENABLED else {}
+        if not existing:
+            # Nothing to diff against (indexed before chunk ids were stored): insert the new version,
+            # then drop every older row of the document
+            replaced_before = int(datetime.now().timestamp() * 1000)
+            indexed = await self.index_document_chunks(collection_name, chunks, metadata, milvus_instance)
+            if documents and not indexed:
+                raise RuntimeError(f"Failed to index new version of document {document_id}")
+            if not await self.bulk_delete_by_filter(
+                f'document_id == "{document_id}" and created_at < {replaced_before}',
+                collection_name,
+                milvus_instance,
+                compact=False
+            ):
+                raise RuntimeError(f"Failed to delete previous version of document {document_id}")
+            return {"added": indexed, "removed": 0, "unchanged": 0, "refreshed": 0, "total": len(documents)}
+        
+        new_ids = {doc["chunk_id"] for doc in documents}
+        added = [doc for doc in documents if doc["chunk_id"] not in existing]
+        unchanged = [doc for doc in documents if doc["chunk_id"] in existing]
+        removed = [chunk_id for chunk_id in existing if chunk_id not in new_ids]
+        
+        if added and not await self.insert_documents(added, collection_name, milvus_instance):
+            raise RuntimeError(f"Failed to insert {len(added)} new chunks of document {document_id}")
+        
+        await chunk_store.put_many(stored_chunks)
+        refreshed = await self._refresh_unchanged_rows(collection_name, unchanged, milvus_instance)
+        
+        if removed:
+            chunk_list = ", ".join(f'"{chunk_id}"' for chunk_id in removed)
+            deleted = await self.bulk_delete_by_filter(
+                f'document_id == "{document_id}" and chunk_id in [{chunk_list}]',
+                collection_name,
+                milvus_instance,
+                compact=False
+            )
+            if not deleted:
+                raise RuntimeError(f"Failed to delete {len(removed)} removed chunks of document {document_id}")
+            await chunk_store.delete_many(removed)
+        
+        stats = {
+            "added": len(added),
+            "removed": len(removed),
+            "unchanged": len(unchanged),
+            "refreshed": refreshed,
+            "total": len(documents)
+        }
+        logger.info(f"Re-indexed document {document_id} in {collection_name}: {stats}")
+        return stats
+
+    async def _refresh_unchanged_rows(
+        self,
+        collection_name: str,
+        documents: List[Dict[str, Any]],
+        milvus_instance: str
+    ) -> int:
+        """
+        Rewrite rows of unchanged chunks whose document_source or metadata differ from the new version
+        (file renamed, chunk moved), reusing the stored vectors; Milvus rows are upserted by primary key
+
+        Returns:
+            Number of rewritten rows
+        """
+        if not documents:
+            return 0
+        
+        by_chunk = {doc["chunk_id"]: doc for doc in documents}
+        document_id = documents[0]["document_id"]
+        
+        def is_stale(row: Dict[str, Any]) -> bool:
+            doc = by_chunk.get(row.get("chunk_id"))
+            return bool(doc) and (row.get("document_source") != doc["document_source"] or row.get("metadata") != doc["metadata"])
+        
+        def refreshed_row(row: Dict[str, Any]) -> Dict[str, Any]:
+            doc = by_chunk[row["chunk_id"]]
+            return {**row, "document_source": doc["document_source"], "metadata": doc["metadata"]}
+        
+        if await self._is_local(collection_name):
+            stale = [
+                row for row in await self.local_store.fetch_all(collection_name)
+                if row.get("document_id") == document_id and is_stale(row)
+            ]
+            if stale:
+                chunk_list = ", ".join(f'"{row["chunk_id"]}"' for row in stale)
+                await self.local_store.delete(collection_name, f'document_id == "{document_id}" and chunk_id in [{chunk_list}]')
+                await self.local_store.insert(collection_name, [refreshed_row(row) for row in stale])
+                await self._invalidate_retrieval_cache(collection_name)
+            return len(stale)
+        
+        client = self._get_client(milvus_instance)
+        target = resolve_collection(collection_name)
+        chunk_ids = list(by_chunk)
+        output_fields = self._row_output_fields(include_vector=True)
+        if target.is_partitioned:
+            output_fields.append(target.partition_key_field)
+        window = max(1, settings.MILVUS_INSERT_BATCH_SIZE)
+        refreshed = 0
+        
+        for start in range(0, len(chunk_ids), window):
+            chunk_list = ", ".join(f'"{chunk_id}"' for chunk_id in chunk_ids[start:start + window])
+            rows = await self._call_loaded(
+                milvus_instance,
+                target.physical_name,
+                client.query,
+                collection_name=target.physical_name,
+                filter=target.scope_filter(f'document_id == "{document_id}" and chunk_id in [{chunk_list}]'),
+                output_fields=output_fields
+            )
+            stale = [refreshed_row(row) for row in rows if is_stale(row)]
+            if stale:
+                await self._call_loaded(milvus_instance, target.physical_name, client.upsert, collection_name=target.physical_name, data=stale)
+                refreshed += len(stale)
+        
+        if refreshed:
+            await self._invalidate_retrieval_cache(collection_name)
+        return refreshed
+
     async def delete_document_vectors(
         self,
         collection_name: str,
@@ -727,6 +1951,8 @@ class MilvusService:
                 private_result = False
             
             success = public_result or private_result
+            if settings.MILVUS_CHUNK_STORE_ENABLED:
+                await chunk_store.delete_document(document_id)
             if success:
                 logger.info(f"Successfully deleted vectors for document {document_id} from {collection_name}")
             else:
@@ -752,26 +1978,49 @@ class MilvusService:
         Example: json_path="metadata.category", value="hr", operator="=="
         """
         try:
-            await self.ensure_collection_exists(collection_name, milvus_instance)
-            client = self._get_client(milvus_instance)
-
-            filter_expr = f"metadata['{json_path}'] {operator} {repr(value)}"
-
-            search_results = client.search(
-                collection_name=collection_name,
-                data=[[0.0] * settings.EMBEDDING_DIMENSIONS],
-                limit=top_k,
-                search_params={"metric_type": settings.MILVUS_METRIC_TYPE},
-                output_fields=["text", "document_id", "department", "document_source", "metadata"],
-                filter=filter_expr
+            search_results = await self._filter_only_search(
+                collection_name,
+                milvus_instance,
+                f"metadata['{json_path}'] {operator} {repr(value)}",
+                top_k
             )
 
-            return self._process_search_results(search_results, 0.0, "json_path")
+            results = self._process_search_results(search_results, 0.0, "json_path")
+            return await self.hydrate_results(results, collection_name, milvus_instance)
 
         except Exception as e:
             logger.error(f"JSON path search failed: {e}")
             return []
 
+    async def _filter_only_search(
+        self,
+        collection_name: str,
+        milvus_instance: str,
+        filter_expr: str,
+        top_k: int
+    ) -> List:
+        """Filter-driven lookup (zero query vector) in Milvus or the local store; raw hits"""
+        await self.ensure_collection_exists(collection_name, milvus_instance)
+        output_fields = self._row_output_fields()
+        zero_vector = np.zeros(settings.EMBEDDING_DIMENSIONS, dtype=np.float32)
+
+        if await self._is_local(collection_name):
+            return await self.local_store.search(collection_name, zero_vector, top_k, filter_expr, output_fields)
+
+        client = self._get_client(milvus_instance)
+        target = resolve_collection(collection_name)
+        await self._ensure_loaded(milvus_instance, target.physical_name)
+        return await self._call(
+            milvus_instance,
+            client.search,
+            collection_name=target.physical_name,
+            data=[zero_vector.tolist()],
+            limit=top_k,
+            search_params={"metric_type": settings.MILVUS_METRIC_TYPE},
+            output_fields=output_fields,
+            filter=target.scope_filter(filter_expr)
+        )
+
     async def add_dynamic_field(
         self,
         collection_name: str,
@@ -790,17 +2039,22 @@ class MilvusService:
                 return False
 
             client = self._get_client(milvus_instance)
+            target = resolve_collection(collection_name)
 
             update_data = {
                 f"metadata['{field_name}']": field_value
             }
 
-            result = client.upsert(
-                collection_name=collection_name,
+            result = await self._call_loaded(
+                milvus_instance,
+                target.physical_name,
+                client.upsert,
+                collection_name=target.physical_name,
                 data=[update_data],
-                filter=filter_expr
+                filter=target.scope_filter(filter_expr)
             )
 
+            await self._invalidate_retrieval_cache(collection_name)
             logger.info(f"Added dynamic field '{field_name}' to documents matching: {filter_expr}")
             return True
 
@@ -820,24 +2074,18 @@ class MilvusService:
         Search documents within time range using timestamp field
         """
         try:
-            await self.ensure_collection_exists(collection_name, milvus_instance)
-            client = self._get_client(milvus_instance)
-
             start_timestamp = int(start_time.timestamp() * 1000)
             end_timestamp = int((end_time or datetime.now()).timestamp() * 1000)
 
-            filter_expr = f"created_at >= {start_timestamp} and created_at <= {end_timestamp}"
-
-            search_results = client.search(
-                collection_name=collection_name,
-                data=[[0.0] * settings.EMBEDDING_DIMENSIONS],
-                limit=top_k,
-                search_params={"metric_type": settings.MILVUS_METRIC_TYPE},
-                output_fields=["text", "document_id", "department", "document_source", "metadata", "created_at"],
-                filter=filter_expr
+            search_results = await self._filter_only_search(
+                collection_name,
+                milvus_instance,
+                f"created_at >= {start_timestamp} and created_at <= {end_timestamp}",
+                top_k
             )
 
-            return self._process_search_results(search_results, 0.0, "time_range")
+            results = self._process_search_results(search_results, 0.0, "time_range")
+            return await self.hydrate_results(results, collection_name, milvus_instance)
 
         except Exception as e:
             logger.error(f"Time range search failed: {e}")
@@ -891,6 +2139,8 @@ class MilvusService:
         """Clear collection existence cache"""
         self.collection_cache.clear()
         self.function_cache.clear()
+        self.index_profile_cache.clear()
+        self.filter_index_cache.clear()
         logger.info("Cleared Milvus collection and function cache")
 
 
@@ -0,0 +1,78 @@
+"""
+Maximal Marginal Relevance (MMR) re-ranking of search candidates
+Vectorized in NumPy: one candidate matrix, one similarity product, O(top_k * n) greedy selection.
+"""
+from typing import Any, Dict, List
+
+import numpy as np
+
+
+def mmr_select(
+    query_vector: np.ndarray,
+    candidate_vectors: np.ndarray,
+    top_k: int,
+    lambda_mult: float = 0.5
+) -> List[int]:
+    """
+    Select candidate indices by MMR
+
+    Args:
+        query_vector: L2-normalized query embedding, shape (dim,)
+        candidate_vectors: L2-normalized candidate embeddings, shape (n, dim)
+        top_k: Number of candidates to keep
+        lambda_mult: 1.0 = pure relevance, 0.0 = pure diversity
+
+    Returns:
+        Selected candidate indices in MMR order
+    """
+    n = candidate_vectors.shape[0]
+    if n == 0 or top_k <= 0:
+        return []
+
+    candidates = np.asarray(candidate_vectors, dtype=np.float32)
+    relevance = candidates @ np.asarray(query_vector, dtype=np.float32)
+    pairwise = candidates @ candidates.T
+    max_redundancy = np.full(n, -np.inf, dtype=np.float32)
+    available = np.ones(n, dtype=bool)
+    selected: List[int] = []
+
+    for _ in range(min(top_k, n)):
+        if selected:
+            scores = lambda_mult * relevance - (1.0 - lambda_mult) * max_redundancy
+        else:
+            scores = relevance.copy()
+        scores[~available] = -np.inf
+
+        best = int(np.argmax(scores))
+        selected.append(best)
+        available[best] = False
+        np.maximum(max_redundancy, pairwise[best], out=max_redundancy)
+
+    return selected
+
+
+def apply_mmr(
+    results: List[Dict[str, Any]],
+    query_vector: np.ndarray,
+    top_k: int,
+    lambda_mult: float = 0.5,
+    vector_key: str = "vector"
+) -> List[Dict[str, Any]]:
+    """
+    Re-rank search results that carry their vectors under vector_key.
+    Results without a vector are appended after the MMR selection; vectors are stripped from the output.
+    """
+    with_vectors = [r for r in results if r.get(vector_key) is not None]
+    without_vectors = [r for r in results if r.get(vector_key) is None]
+
+    if with_vectors:
+        matrix = np.vstack([np.asarray(r[vector_key], dtype=np.float32) for r in with_vectors])
+        order = mmr_select(query_vector, matrix, top_k, lambda_mult)
+        ranked = [with_vectors[i] for i in order]
+    else:
+        ranked = []
+
+    ranked.extend(without_vectors[:max(0, top_k - len(ranked))])
+    for result in ranked:
+        result.pop(vector_key, None)
+    return ranked
@@ -0,0 +1,157 @@
+"""
+Versioned retrieval result cache
+Search results are cached per logical collection under that collection's current version.
+Writes bump the version (Redis INCR), so stale entries become unreachable without key scans
+and simply expire by TTL. Milvus searches run at Bounded consistency and may miss rows written in
+the last moments, so writes bump the version once more after visibility_delay_s: results cached
+from a search that did not see the write are dropped too.
+"""
+import asyncio
+import hashlib
+import json
+import re
+import time
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from services.cache.redis_service import redis_client
+from services.embedding.query_embedding_cache import normalize_query_text
+from workflows.monitoring.prometheus import RETRIEVAL_CACHE_REQUESTS, RETRIEVAL_CACHE_SAVED_SECONDS
+from utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+_TENANT_PREFIX = re.compile(r"^([0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12})-")
+
+
+def tenant_from_collection(collection_name: str) -> str:
+    """Tenant id of a {tenant_id}-{department_id}-public/private collection name"""
+    match = _TENANT_PREFIX.match(collection_name)
+    return match.group(1) if match else "unknown"
+
+
+class RetrievalCache:
+    """
+    Retrieval cache keyed by (collection, collection version, embedding model version, normalized
+    query text, search parameters). The query text, not its vector, is hashed: the same query embeds
+    to slightly different vectors depending on which cache tier served it (float16 round-trips).
+    """
+
+    KEY_PREFIX = "retrieval"
+
+    def __init__(self, ttl_seconds: int = 3600, visibility_delay_s: float = 5.0):
+        self.ttl_seconds = ttl_seconds
+        self.visibility_delay_s = visibility_delay_s
+        self._stats: Dict[str, Dict[str, float]] = defaultdict(lambda: {"hits": 0, "misses": 0, "saved_seconds": 0.0})
+        self._delayed_bumps: set = set()
+
+    def _version_key(self, collection_name: str) -> str:
+        return f"{self.KEY_PREFIX}:version:{collection_name}"
+
+    def build_key(
+        self,
+        collection_name: str,
+        version: int,
+        query: str,
+        query_vector: np.ndarray,
+        params: Dict[str, Any],
+        model_version: str = ""
+    ) -> str:
+        digest = hashlib.sha256(model_version.encode("utf-8"))
+        text = normalize_query_text(query or "")
+        if text:
+            digest.update(text.encode("utf-8"))
+        else:
+            # No query text (vector-only lookups): hash the vector at float16 precision
+            digest.update(np.asarray(query_vector, dtype=np.float16).tobytes())
+        digest.update(json.dumps(params, sort_keys=True, default=str).encode("utf-8"))
+        return f"{self.KEY_PREFIX}:{collection_name}:v{version}:{digest.hexdigest()}"
+
+    async def get(
+        self,
+        collection_name: str,
+        query: str,
+        query_vector: np.ndarray,
+        params: Dict[str, Any],
+        model_version: str = ""
+    ) -> Tuple[Optional[str], Optional[List[Dict[str, Any]]]]:
+        """
+        Look up cached results
+
+        Returns:
+            (cache key to store under on a miss, cached results or None);
+            the key is None when the cache is unavailable
+        """
+        start = time.perf_counter()
+        try:
+            client = redis_client.get_client()
+            if not client:
+                return None, None
+
+            version = int(await client.get(self._version_key(collection_name)) or 0)
+            key = self.build_key(collection_name, version, query, query_vector, params, model_version)
+            cached = await client.get(key)
+        except Exception as e:
+            logger.warning(f"Retrieval cache lookup failed for {collection_name}: {e}")
+            return None, None
+
+        tenant = tenant_from_collection(collection_name)
+        if cached is None:
+            self._stats[tenant]["misses"] += 1
+            RETRIEVAL_CACHE_REQUESTS.labels(tenant=tenant, result="miss").inc()
+            return key, None
+
+        entry = json.loads(cached)
+        saved = max(0.0, entry.get("search_seconds", 0.0) - (time.perf_counter() - start))
+        self._stats[tenant]["hits"] += 1
+        self._stats[tenant]["saved_seconds"] += saved
+        RETRIEVAL_CACHE_REQUESTS.labels(tenant=tenant, result="hit").inc()
+        RETRIEVAL_CACHE_SAVED_SECONDS.labels(tenant=tenant).inc(saved)
+        return key, entry["results"]
+
+    async def set(self, key: str, results: List[Dict[str, Any]], search_seconds: float) -> None:
+        """Store results with the latency of the search that produced them"""
+        try:
+            client = redis_client.get_client()
+            if client:
+                payload = json.dumps({"results": results, "search_seconds": search_seconds}, ensure_ascii=False, default=str)
+                await client.set(key, payload, ex=self.ttl_seconds)
+        except Exception as e:
+            logger.warning(f"Retrieval cache store failed: {e}")
+
+    async def invalidate(self, collection_name: str) -> None:
+        """
+        Bump the collection version so every cached entry for it becomes unreachable, and bump it
+        again once the write is visible to Bounded-consistency searches
+        """
+        await self._bump(collection_name)
+        if self.visibility_delay_s > 0:
+            task = asyncio.create_task(self._bump_later(collection_name))
+            self._delayed_bumps.add(task)
+            task.add_done_callback(self._delayed_bumps.discard)
+
+    async def _bump(self, collection_name: str) -> None:
+        try:
+            client = redis_client.get_client()
+            if client:
+                await client.incr(self._version_key(collection_name))
+        except Exception as e:
+            logger.error(f"Failed to invalidate retrieval cache for {collection_name}: {e}")
+
+    async def _bump_later(self, collection_name: str) -> None:
+        await asyncio.sleep(self.visibility_delay_s)
+        await self._bump(collection_name)
+
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        """Hit rate and saved search latency per tenant for this process"""
+        stats = {}
+        for tenant, values in self._stats.items():
+            lookups = values["hits"] + values["misses"]
+            stats[tenant] = {
+                **values,
+                "saved_seconds": round(values["saved_seconds"], 3),
+                "hit_rate": round(values["hits"] / lookups, 4) if lookups else 0.0
+            }
+        return stats
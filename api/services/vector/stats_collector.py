@@ -0,0 +1,184 @@
+"""
+Background Milvus collection stats
+Row counts, vector index state and load state of every collection on both instances are refreshed
+concurrently on an interval and stored as one snapshot in Redis, so the maintainer dashboard reads
+figures instead of describing hundreds of collections per request. One worker refreshes per interval
+(Redis lock); every worker mirrors the snapshot into its Prometheus gauges.
+"""
+import asyncio
+import json
+import time
+from typing import TYPE_CHECKING, Any, Dict, Optional, Set, Tuple
+
+from services.cache.redis_service import redis_client
+from workflows.monitoring.prometheus import (
+    MILVUS_COLLECTION_LOADED,
+    MILVUS_COLLECTION_PENDING_INDEX_ROWS,
+    MILVUS_COLLECTION_ROWS,
+    MILVUS_STATS_REFRESH_SECONDS,
+)
+from common.types import DBDocumentPermissionLevel
+from utils.logging import get_logger
+
+if TYPE_CHECKING:
+    from services.vector.milvus_service import MilvusService
+
+logger = get_logger(__name__)
+
+
+def _load_state_name(load_state: Any) -> str:
+    state = load_state.get("state") if isinstance(load_state, dict) else load_state
+    return (getattr(state, "name", None) or str(state)).split(".")[-1]
+
+
+class CollectionStatsCollector:
+    """Periodically collects per-collection stats into a Redis snapshot and Prometheus gauges"""
+
+    SNAPSHOT_KEY = "milvus:stats:snapshot"
+    LOCK_KEY = "milvus:stats:lock"
+
+    def __init__(self, service: "MilvusService", interval_s: int = 60):
+        self.service = service
+        self.interval_s = interval_s
+        self._snapshot: Optional[Dict[str, Any]] = None
+        self._gauge_labels: Set[Tuple[str, str]] = set()
+        self._task: Optional[asyncio.Task] = None
+
+    async def _collection_stats(self, milvus_instance: str, physical_name: str) -> Dict[str, Any]:
+        client = self.service._get_client(milvus_instance)
+        stats, index, load_state = await asyncio.gather(
+            self.service._call(milvus_instance, client.get_collection_stats, physical_name),
+            self.service._call(milvus_instance, client.describe_index, physical_name, "vector"),
+            self.service._call(milvus_instance, client.get_load_state, physical_name),
+            return_exceptions=True
+        )
+        result: Dict[str, Any] = {}
+        if not isinstance(stats, BaseException):
+            result["row_count"] = int(stats.get("row_count", 0))
+        if not isinstance(index, BaseException) and index:
+            result.update({
+                "index_type": index.get("index_type"),
+                "index_state": str(index.get("state", "")) or None,
+                "indexed_rows": int(index.get("indexed_rows", 0)),
+                "pending_index_rows": int(index.get("pending_index_rows", 0)),
+            })
+        if not isinstance(load_state, BaseException):
+            result["load_state"] = _load_state_name(load_state)
+        errors = [str(e) for e in (stats, index, load_state) if isinstance(e, BaseException)]
+        if errors:
+            result["errors"] = errors
+        return result
+
+    async def _instance_stats(self, milvus_instance: str) -> Dict[str, Any]:
+        try:
+            client = self.service._get_client(milvus_instance)
+            names = await self.service._call(milvus_instance, client.list_collections)
+            # Calls are bounded by the instance's thread pool and concurrency limit
+            stats = await asyncio.gather(*[self._collection_stats(milvus_instance, name) for name in names])
+            collections = dict(zip(names, stats))
+            return {
+                "count": len(collections),
+                "loaded": sum(1 for s in collections.values() if s.get("load_state") == "Loaded"),
+                "total_rows": sum(s.get("row_count", 0) for s in collections.values()),
+                "collections": collections,
+            }
+        except Exception as e:
+            logger.error(f"Failed to collect stats of {milvus_instance}: {e}")
+            return {"error": str(e), "collections": {}}
+
+    async def collect(self) -> Dict[str, Any]:
+        """Collect a fresh snapshot of both instances, store it and update gauges"""
+        start = time.perf_counter()
+        instances = (DBDocumentPermissionLevel.PUBLIC.value, DBDocumentPermissionLevel.PRIVATE.value)
+        results = await asyncio.gather(*[self._instance_stats(instance) for instance in instances])
+        duration = time.perf_counter() - start
+
+        snapshot = {
+            "collected_at": time.time(),
+            "duration_s": round(duration, 3),
+            "instances": dict(zip(instances, results)),
+        }
+        MILVUS_STATS_REFRESH_SECONDS.observe(duration)
+        self._apply(snapshot)
+
+        try:
+            client = redis_client.get_client()
+            if client:
+                await client.set(self.SNAPSHOT_KEY, json.dumps(snapshot, default=str), ex=self.interval_s * 3)
+        except Exception as e:
+            logger.warning(f"Failed to store collection stats snapshot: {e}")
+
+        logger.debug(f"Collected Milvus collection stats in {duration:.2f}s")
+        return snapshot
+
+    def _apply(self, snapshot: Dict[str, Any]) -> None:
+        """Keep the snapshot and mirror it into gauges (dropping series of removed collections)"""
+        self._snapshot = snapshot
+        labels = set()
+        for milvus_instance, instance_stats in snapshot.get("instances", {}).items():
+            for name, stats in instance_stats.get("collections", {}).items():
+                labels.add((milvus_instance, name))
+                MILVUS_COLLECTION_ROWS.labels(instance=milvus_instance, collection=name).set(stats.get("row_count", 0))
+                MILVUS_COLLECTION_PENDING_INDEX_ROWS.labels(instance=milvus_instance, collection=name).set(
+                    stats.get("pending_index_rows", 0)
+                )
+                MILVUS_COLLECTION_LOADED.labels(instance=milvus_instance, collection=name).set(
+                    1 if stats.get("load_state") == "Loaded" else 0
+                )
+
+        for milvus_instance, name in self._gauge_labels - labels:
+            for gauge in (MILVUS_COLLECTION_ROWS, MILVUS_COLLECTION_PENDING_INDEX_ROWS, MILVUS_COLLECTION_LOADED):
+                try:
+                    gauge.remove(milvus_instance, name)
+                except KeyError:
+                    pass
+        self._gauge_labels = labels
+
+    async def _read_shared(self) -> Optional[Dict[str, Any]]:
+        try:
+            client = redis_client.get_client()
+            raw = await client.get(self.SNAPSHOT_KEY) if client else None
+            return json.loads(raw) if raw else None
+        except Exception as e:
+            logger.debug(f"Failed to read collection stats snapshot: {e}")
+            return None
+
+    async def get_snapshot(self, refresh: bool = False) -> Dict[str, Any]:
+        """Latest snapshot (shared one from Redis, else this worker's); collected now if none exists"""
+        if not refresh:
+            snapshot = await self._read_shared() or self._snapshot
+            if snapshot:
+                return {**snapshot, "age_s": round(time.time() - snapshot["collected_at"], 1)}
+        snapshot = await self.collect()
+        return {**snapshot, "age_s": 0.0}
+
+    async def refresh_once(self) -> None:
+        """Collect if this worker holds the refresh lock for the interval, otherwise mirror the shared snapshot"""
+        client = redis_client.get_client()
+        if client and not await client.set(self.LOCK_KEY, "1", nx=True, ex=max(1, self.interval_s - 1)):
+            snapshot = await self._read_shared()
+            if snapshot:
+                self._apply(snapshot)
+            return
+        await self.collect()
+
+    async def _loop(self) -> None:
+        while True:
+            try:
+                await self.refresh_once()
+            except Exception as e:
+                logger.error(f"Collection stats refresh failed: {e}")
+            await asyncio.sleep(self.interval_s)
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
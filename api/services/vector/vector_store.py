@@ -0,0 +1,62 @@
+"""
+Vector store backend interface
+MilvusService serves each logical collection either from Milvus or from a backend implementing
+this interface (the in-process LocalVectorStore). Search results use the Milvus hit layout
+({"id", "distance", "entity"}) so both paths share result processing.
+"""
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+BACKEND_MILVUS = "milvus"
+BACKEND_LOCAL = "local"
+BACKEND_AUTO = "auto"
+
+
+class BaseVectorStore(ABC):
+    """Base class for vector store backends (collections addressed by logical name)"""
+
+    @abstractmethod
+    async def has_collection(self, collection_name: str) -> bool:
+        pass
+
+    @abstractmethod
+    async def ensure_collection(self, collection_name: str) -> bool:
+        """Create the collection if missing; returns True when it exists afterwards"""
+        pass
+
+    @abstractmethod
+    async def insert(self, collection_name: str, rows: List[Dict[str, Any]]) -> int:
+        """Insert rows (scalar fields plus "vector"); returns the number of inserted rows"""
+        pass
+
+    @abstractmethod
+    async def search(
+        self,
+        collection_name: str,
+        query_vector: np.ndarray,
+        limit: int,
+        filter_expr: Optional[str] = None,
+        output_fields: Optional[List[str]] = None
+    ) -> List[List[Dict[str, Any]]]:
+        """Top-k search; returns one hit list per query, best first"""
+        pass
+
+    @abstractmethod
+    async def delete(self, collection_name: str, filter_expr: str) -> int:
+        """Delete rows matching a filter expression; returns the number of deleted rows"""
+        pass
+
+    @abstractmethod
+    async def count(self, collection_name: str) -> int:
+        pass
+
+    @abstractmethod
+    async def fetch_all(self, collection_name: str) -> List[Dict[str, Any]]:
+        """All rows with float32 vectors (used to move a collection to another backend)"""
+        pass
+
+    @abstractmethod
+    async def drop_collection(self, collection_name: str) -> None:
+        pass
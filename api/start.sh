@@ -1,9 +1,59 @@
 #!/bin/bash
 set -e
 
+# Boolean env values as pydantic settings read them; the default must match config/settings.py
+is_enabled() {
+	case "$(echo "$1" | tr '[:upper:]' '[:lower:]')" in
+		true|1|yes|on) return 0 ;;
+		*) return 1 ;;
+	esac
+}
+
+SERVICE_PIDS=()
+
+# Run a background service and restart it whenever it exits; SIGTERM stops the service and the loop
+supervise() {
+	local name="$1"
+	shift
+	(
+		child=""
+		trap 'if [ -n "$child" ]; then kill -TERM "$child" 2>/dev/null; wait "$child" 2>/dev/null; fi; exit 0' TERM INT
+		while true; do
+			"$@" &
+			child=$!
+			status=0
+			wait "$child" || status=$?
+			echo "${name} exited with status ${status}, restarting in ${RESTART_DELAY_S:-5}s..."
+			# Sleep in the background so a signal is handled without waiting out the delay
+			sleep "${RESTART_DELAY_S:-5}" &
+			wait $! || true
+		done
+	) &
+	SERVICE_PIDS+=("$!")
+}
+
+stop_services() {
+	for pid in "${SERVICE_PIDS[@]}"; do
+		kill -TERM "$pid" 2>/dev/null || true
+	done
+	for pid in "${SERVICE_PIDS[@]}"; do
+		wait "$pid" 2>/dev/null || true
+	done
+}
+
+if is_enabled "${EMBEDDING_SERVER_ENABLED:-false}"; then
+	echo "Starting shared embedding server..."
+	supervise "Embedding server" python -m services.embedding.embedding_server
+fi
+
+if is_enabled "${INGESTION_WORKER_ENABLED:-true}"; then
+	echo "Starting document ingestion worker..."
+	supervise "Ingestion worker" python -m services.documents.ingestion_worker
+fi
+
 if [ "${ENV}" = "production" ] || [ "${ENV}" = "prod" ]; then
 	echo "Starting in Production Mode..."
-	exec gunicorn main:app \
+	gunicorn main:app \
 		--bind=0.0.0.0:8000 \
 		--workers=${WORKERS:-4} \
 		--worker-class=uvicorn.workers.UvicornWorker \
@@ -11,8 +61,21 @@ if [ "${ENV}" = "production" ] || [ "${ENV}" = "prod" ]; then
 		--max-requests-jitter=${MAX_REQUESTS_JITTER:-100} \
 		--timeout=${TIMEOUT:-120} \
 		--graceful-timeout=${GRACEFUL_TIMEOUT:-60} \
-		--log-level=${LOG_LEVEL:-info}
+		--log-level=${LOG_LEVEL:-info} &
 else
 	echo "Starting in Development Mode..."
-	exec uvicorn main:app --host=0.0.0.0 --port=8000 --reload --log-level=debug
-fi 
\ No newline at end of file
+	uvicorn main:app --host=0.0.0.0 --port=8000 --reload --log-level=debug &
+fi
+SERVER_PID=$!
+
+# The container's stop signal reaches this shell only: forward it, then stop the background services
+trap 'kill -TERM "$SERVER_PID" 2>/dev/null || true' TERM INT
+# A trapped signal interrupts wait before the server has finished its graceful shutdown
+wait "$SERVER_PID" || true
+while kill -0 "$SERVER_PID" 2>/dev/null; do
+	wait "$SERVER_PID" || true
+done
+status=0
+wait "$SERVER_PID" || status=$?
+stop_services
+exit "$status"
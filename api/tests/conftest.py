@@ -0,0 +1,88 @@
+"""
+Shared fixtures: an in-memory Redis (fakeredis) wired into redis_client and a recording
+fake of the MilvusClient calls the vector services make.
+"""
+import os
+
+# Keep the module-level milvus_service from connecting to Milvus at import time
+os.environ.setdefault("VECTOR_STORE_BACKEND", "local")
+os.environ.setdefault("VECTOR_LOCAL_STORE_DIR", "/tmp/aichatbot-test-vector-store")
+
+import fakeredis
+import pytest
+
+from config.settings import get_settings
+from services.cache.redis_service import redis_client
+from tests.fakes import FakeChunkStore, FakeEmbeddings, FakeMilvusClient, FakeMilvusService
+
+
+@pytest.fixture
+async def fake_redis():
+    """Text (decoded) and binary fake clients sharing one server, installed into redis_client"""
+    server = fakeredis.FakeServer()
+    text = fakeredis.FakeAsyncRedis(server=server, decode_responses=True)
+    binary = fakeredis.FakeAsyncRedis(server=server, decode_responses=False)
+
+    saved = (redis_client.redis_client, redis_client.binary_client, redis_client._initialized)
+    redis_client.redis_client, redis_client.binary_client, redis_client._initialized = text, binary, True
+    yield text
+    redis_client.redis_client, redis_client.binary_client, redis_client._initialized = saved
+    await text.aclose()
+    await binary.aclose()
+
+
+@pytest.fixture
+def milvus_client():
+    return FakeMilvusClient()
+
+
+@pytest.fixture
+def milvus(milvus_client):
+    return FakeMilvusService(milvus_client)
+
+
+@pytest.fixture
+def milvus_service(monkeypatch, milvus_client):
+    """The real MilvusService singleton talking to the fake client on both instances"""
+    from services.vector.milvus_service import milvus_service as service
+
+    monkeypatch.setattr(get_settings(), "VECTOR_STORE_BACKEND", "milvus")
+    monkeypatch.setattr(service, "public_client", milvus_client)
+    monkeypatch.setattr(service, "private_client", milvus_client)
+    monkeypatch.setattr(service, "local_store", None)
+    monkeypatch.setattr(service, "residency", None)
+    monkeypatch.setattr(service, "index_profile_cache", {})
+    return service
+
+
+@pytest.fixture
+def chunk_rows(monkeypatch):
+    """In-memory chunk store installed into the vector service"""
+    from services.vector import milvus_service as milvus_module
+
+    store = FakeChunkStore()
+    monkeypatch.setattr(milvus_module, "chunk_store", store)
+    return store
+
+
+@pytest.fixture
+def embeddings(monkeypatch):
+    """Deterministic document embeddings installed into the vector service"""
+    from services.vector import milvus_service as milvus_module
+
+    fake = FakeEmbeddings(get_settings().EMBEDDING_DIMENSIONS)
+    monkeypatch.setattr(milvus_module, "embedding_service", fake)
+    return fake
+
+
+@pytest.fixture
+def local_vector_service(monkeypatch, tmp_path, chunk_rows, embeddings):
+    """The MilvusService singleton on the local backend, storing into tmp_path"""
+    from services.vector.local_store import LocalVectorStore
+    from services.vector.milvus_service import milvus_service as service
+
+    settings = get_settings()
+    monkeypatch.setattr(settings, "VECTOR_STORE_BACKEND", "local")
+    monkeypatch.setattr(service, "local_store", LocalVectorStore(str(tmp_path), settings.EMBEDDING_DIMENSIONS))
+    monkeypatch.setattr(service, "retrieval_cache", None)
+    return service
@@ -0,0 +1,165 @@
+"""
+Recording fakes of the MilvusClient surface used by the vector services
+"""
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from services.dataclasses.milvus import IndexProfile
+from services.vector.index_profiles import PROFILE_HNSW, get_index_profile
+
+
+class FakeMilvusClient:
+    """Records calls; collection names must be str, as pymilvus rejects anything else"""
+
+    def __init__(self):
+        self.calls: List[Tuple[str, tuple, dict]] = []
+        self.row_counts: Dict[str, int] = {}
+        self.load_states: Dict[str, str] = {}
+        self.indexes: Dict[str, Dict[str, Any]] = {}
+        self.compaction_id = 0
+        self.rows: Dict[str, List[Dict[str, Any]]] = {}
+        self.fail_inserts_after: Optional[int] = None
+
+    def _record(self, method: str, collection_name: Any, *args, **kwargs) -> None:
+        if not isinstance(collection_name, str):
+            raise TypeError(f"collection_name must be str, got {type(collection_name).__name__}")
+        self.calls.append((method, (collection_name,) + args, kwargs))
+
+    def _require_loaded(self, collection_name) -> None:
+        if self.load_states.get(collection_name) == "NotLoad":
+            raise RuntimeError(f"collection not loaded: {collection_name}")
+
+    def called(self, method: str) -> List[tuple]:
+        return [args for name, args, _ in self.calls if name == method]
+
+    def release_collection(self, collection_name, **kwargs):
+        self._record("release_collection", collection_name, **kwargs)
+        self.load_states[collection_name] = "NotLoad"
+
+    def load_collection(self, collection_name, **kwargs):
+        self._record("load_collection", collection_name, **kwargs)
+        self.load_states[collection_name] = "Loaded"
+
+    def get_load_state(self, collection_name, **kwargs):
+        self._record("get_load_state", collection_name, **kwargs)
+        return {"state": self.load_states.get(collection_name, "NotLoad")}
+
+    def drop_index(self, collection_name, index_name, **kwargs):
+        self._record("drop_index", collection_name, index_name, **kwargs)
+        self.indexes.pop(collection_name, None)
+
+    def create_index(self, collection_name, **kwargs):
+        self._record("create_index", collection_name, **kwargs)
+        self.indexes[collection_name] = {"index_type": kwargs.get("index_type")}
+
+    def create_collection(self, collection_name, **kwargs):
+        self._record("create_collection", collection_name, **kwargs)
+        self.indexes[collection_name] = {"index_type": kwargs["index_params"]["index_type"]}
+
+    def has_collection(self, collection_name, **kwargs):
+        return collection_name in self.row_counts or collection_name in self.load_states
+
+    def compact(self, collection_name, **kwargs):
+        self._record("compact", collection_name, **kwargs)
+        self.compaction_id += 1
+        return self.compaction_id
+
+    def get_collection_stats(self, collection_name, **kwargs):
+        self._record("get_collection_stats", collection_name, **kwargs)
+        return {"row_count": self.row_counts.get(collection_name, 0)}
+
+    def describe_index(self, collection_name, index_name, **kwargs):
+        self._record("describe_index", collection_name, index_name, **kwargs)
+        return self.indexes.get(collection_name, {})
+
+    def list_collections(self, **kwargs):
+        return sorted(set(self.row_counts) | set(self.load_states))
+
+    def query(self, collection_name, **kwargs):
+        self._record("query", collection_name, **kwargs)
+        self._require_loaded(collection_name)
+        return [dict(row) for row in self.rows.get(collection_name, [])]
+
+    def upsert(self, collection_name, data, **kwargs):
+        self._record("upsert", collection_name, data, **kwargs)
+        self._require_loaded(collection_name)
+        return {"upsert_count": len(data)}
+
+    def insert(self, collection_name, data, **kwargs):
+        self._record("insert", collection_name, data, **kwargs)
+        if self.fail_inserts_after is not None and len(self.called("insert")) > self.fail_inserts_after:
+            raise RuntimeError("insert failed")
+        return {"insert_count": len(data)}
+
+    def delete(self, collection_name, **kwargs):
+        self._record("delete", collection_name, **kwargs)
+        self._require_loaded(collection_name)
+        return {"delete_count": 0}
+
+    def search(self, collection_name, **kwargs):
+        self._record("search", collection_name, **kwargs)
+        return [[]]
+
+
+class FakeMilvusService:
+    """The slice of MilvusService the residency, compaction and stats helpers call back into"""
+
+    def __init__(self, client: FakeMilvusClient, index_profile: str = PROFILE_HNSW):
+        self.client = client
+        self.index_profile = get_index_profile(index_profile)
+
+    def _get_client(self, milvus_instance: str) -> FakeMilvusClient:
+        return self.client
+
+    async def _call(self, milvus_instance: str, func, *args, timeout: Optional[float] = None, **kwargs):
+        return func(*args, **kwargs)
+
+    async def _get_index_profile(self, milvus_instance: str, physical_name: str) -> IndexProfile:
+        return self.index_profile
+
+    async def get_collection_row_count(self, collection_name: str, milvus_instance: str) -> int:
+        return self.client.get_collection_stats(collection_name)["row_count"]
+
+    async def compact_collection(self, collection_name: str, milvus_instance: str) -> bool:
+        self.client.compact(collection_name)
+        return True
+
+
+class FakeChunkStore:
+    """In-memory ChunkStore keyed by chunk id"""
+
+    def __init__(self):
+        self.rows: Dict[str, Dict[str, Any]] = {}
+
+    async def put_many(self, chunks: List[Dict[str, Any]]) -> None:
+        for chunk in chunks:
+            self.rows[chunk["chunk_id"]] = dict(chunk)
+
+    async def get_many(self, chunk_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        return {chunk_id: self.rows[chunk_id] for chunk_id in chunk_ids if chunk_id in self.rows}
+
+    async def get_document_chunk_ids(self, document_id: str) -> Dict[str, int]:
+        return {chunk_id: row["chunk_index"] for chunk_id, row in self.rows.items() if row["document_id"] == document_id}
+
+    async def delete_many(self, chunk_ids: List[str]) -> int:
+        return sum(self.rows.pop(chunk_id, None) is not None for chunk_id in chunk_ids)
+
+    async def delete_document(self, document_id: str) -> int:
+        return await self.delete_many([cid for cid, row in self.rows.items() if row["document_id"] == document_id])
+
+
+class FakeEmbeddings:
+    """Deterministic encode_documents; records every embedded text"""
+
+    def __init__(self, dimension: int):
+        self.dimension = dimension
+        self.model_version = "test:fake"
+        self.encoded: List[str] = []
+
+    async def encode_documents(self, documents: List[str]) -> Dict[str, Any]:
+        self.encoded.extend(documents)
+        vectors = np.zeros((len(documents), self.dimension), dtype=np.float32)
+        for i, text in enumerate(documents):
+            vectors[i, hash(text) % self.dimension] = 1.0
+        return {"dense_vectors": vectors}
@@ -0,0 +1,73 @@
+import uuid
+from contextlib import asynccontextmanager
+
+from sqlalchemy.dialects.postgresql import asyncpg
+
+from services.documents import chunk_store as chunk_store_module
+from services.documents.chunk_store import WRITE_BATCH_ROWS, ChunkStore, build_chunk_id
+
+ASYNCPG_MAX_PARAMS = 32767
+
+
+class RecordingSession:
+    """Compiles executed statements for asyncpg and records their bind parameter counts"""
+
+    def __init__(self):
+        self.param_counts = []
+
+    async def execute(self, stmt):
+        compiled = stmt.compile(dialect=asyncpg.dialect(), compile_kwargs={"render_postcompile": True})
+        self.param_counts.append(len(compiled.params))
+        return type("Result", (), {"rowcount": 1})()
+
+
+def _install(monkeypatch):
+    session = RecordingSession()
+    opened = []
+
+    @asynccontextmanager
+    async def db_context():
+        opened.append(session)
+        yield session
+
+    monkeypatch.setattr(chunk_store_module, "get_db_context", db_context)
+    return session, opened
+
+
+def _chunks(document_id, count):
+    return [
+        {
+            "chunk_id": build_chunk_id(document_id, f"chunk {i}"),
+            "document_id": document_id,
+            "collection_name": "tenant-dept-public",
+            "chunk_index": i,
+            "content": f"chunk {i}",
+            "metadata": {"page": i},
+        }
+        for i in range(count)
+    ]
+
+
+async def test_put_many_stays_under_asyncpg_parameter_limit(monkeypatch):
+    session, opened = _install(monkeypatch)
+
+    await ChunkStore().put_many(_chunks(str(uuid.uuid4()), 12000))
+
+    assert len(opened) == 1
+    assert len(session.param_counts) == -(-12000 // WRITE_BATCH_ROWS)
+    assert max(session.param_counts) <= ASYNCPG_MAX_PARAMS
+
+
+async def test_delete_many_batches_ids(monkeypatch):
+    session, _ = _install(monkeypatch)
+    ids = [str(uuid.uuid4()) for _ in range(40000)]
+
+    assert await ChunkStore().delete_many(ids) == len(session.param_counts)
+    assert max(session.param_counts) <= ASYNCPG_MAX_PARAMS
+    assert sum(session.param_counts) == 40000
+
+
+def test_chunk_id_is_deterministic_per_document_text_and_occurrence():
+    assert build_chunk_id("doc", "Hello  world") == build_chunk_id("doc", "Hello  world")
+    assert build_chunk_id("doc", "text") != build_chunk_id("doc", "text", occurrence=1)
+    assert build_chunk_id("doc", "text") != build_chunk_id("other", "text")
@@ -0,0 +1,104 @@
+import time
+
+from services.vector.collection_residency import MIN_IDLE_BEFORE_RELEASE_S, CollectionResidencyManager
+from config.settings import get_settings
+
+settings = get_settings()
+
+INSTANCE = "milvus_public"
+
+
+async def _seed(fake_redis, manager, accesses, memory=None):
+    await fake_redis.zadd(manager._access_key(INSTANCE), accesses)
+    if memory:
+        await fake_redis.hset(manager._memory_key(INSTANCE), mapping=memory)
+
+
+async def test_over_count_budget_releases_least_recently_used(fake_redis, milvus, milvus_client):
+    manager = CollectionResidencyManager(milvus, max_loaded=2)
+    now = time.time()
+    await _seed(fake_redis, manager, {"coll_a": now - 3000, "coll_b": now - 2000, "coll_c": now - 1000})
+
+    released = await manager.enforce_budget(INSTANCE)
+
+    assert released == ["coll_a"]
+    assert milvus_client.called("release_collection") == [("coll_a",)]
+    assert await fake_redis.zrange(manager._access_key(INSTANCE), 0, -1) == ["coll_b", "coll_c"]
+
+
+async def test_over_memory_budget_releases_until_within_budget(fake_redis, milvus, milvus_client):
+    manager = CollectionResidencyManager(milvus, max_loaded=100, memory_budget_mb=1)
+    now = time.time()
+    half_mb = 512 * 1024
+    await _seed(
+        fake_redis, manager,
+        {"coll_a": now - 3000, "coll_b": now - 2000, "coll_c": now - 1000},
+        {"coll_a": half_mb, "coll_b": half_mb, "coll_c": half_mb}
+    )
+
+    released = await manager.enforce_budget(INSTANCE)
+
+    assert released == ["coll_a"]
+    assert await fake_redis.hgetall(manager._memory_key(INSTANCE)) == {"coll_b": str(half_mb), "coll_c": str(half_mb)}
+
+
+async def test_kept_recent_and_shared_collections_are_not_released(fake_redis, milvus, milvus_client):
+    manager = CollectionResidencyManager(milvus, max_loaded=1)
+    now = time.time()
+    await _seed(fake_redis, manager, {
+        settings.MILVUS_SHARED_COLLECTION_NAME: now - 5000,
+        "coll_keep": now - 4000,
+        "coll_recent": now - MIN_IDLE_BEFORE_RELEASE_S / 2,
+    })
+
+    released = await manager.enforce_budget(INSTANCE, keep="coll_keep")
+
+    assert released == []
+    assert milvus_client.called("release_collection") == []
+
+
+async def test_release_idle_releases_collections_past_idle_timeout(fake_redis, milvus, milvus_client):
+    manager = CollectionResidencyManager(milvus, max_loaded=100, idle_release_s=600)
+    now = time.time()
+    await _seed(fake_redis, manager, {"coll_idle": now - 1200, "coll_active": now - 100})
+
+    released = await manager.release_idle()
+
+    assert released == ["coll_idle"]
+    assert milvus_client.called("release_collection") == [("coll_idle",)]
+
+
+async def test_ensure_loaded_loads_released_collection(fake_redis, milvus, milvus_client):
+    manager = CollectionResidencyManager(milvus, max_loaded=100)
+
+    await manager.ensure_loaded(INSTANCE, "coll_a")
+
+    assert milvus_client.called("load_collection") == [("coll_a",)]
+    assert [name for name, _ in await fake_redis.zrange(manager._access_key(INSTANCE), 0, -1, withscores=True)] == ["coll_a"]
+
+
+async def test_delete_from_released_collection_loads_it_first(fake_redis, milvus_service, milvus_client, monkeypatch):
+    from services.vector.collection_layout import resolve_collection
+
+    physical = resolve_collection("coll_a").physical_name
+    monkeypatch.setattr(milvus_service, "residency", CollectionResidencyManager(milvus_service, max_loaded=10))
+    milvus_client.row_counts[physical] = 10
+    milvus_client.release_collection(physical)
+
+    assert await milvus_service.bulk_delete_by_filter('document_id == "doc"', "coll_a", INSTANCE, compact=False)
+
+    assert milvus_client.load_states[physical] == "Loaded"
+    assert [name for name, _, _ in milvus_client.calls if name in ("load_collection", "delete")] == ["load_collection", "delete"]
+
+
+async def test_delete_retries_after_another_worker_released_the_collection(fake_redis, milvus_service, milvus_client, monkeypatch):
+    from services.vector.collection_layout import resolve_collection
+
+    physical = resolve_collection("coll_a").physical_name
+    monkeypatch.setattr(milvus_service, "residency", CollectionResidencyManager(milvus_service, max_loaded=10))
+    milvus_client.row_counts[physical] = 10
+    await milvus_service.residency.ensure_loaded(INSTANCE, physical, force_check=True)
+    milvus_client.release_collection(physical)
+
+    assert await milvus_service.bulk_delete_by_filter('document_id == "doc"', "coll_a", INSTANCE, compact=False)
+    assert milvus_client.load_states[physical] == "Loaded"
@@ -0,0 +1,77 @@
+import time
+
+from services.vector.compaction_scheduler import CompactionScheduler, in_peak_hours, parse_peak_hours
+from utils.datetime_utils import DateTimeManager
+
+PUBLIC = "milvus_public"
+
+
+async def test_run_once_compacts_collections_past_window(fake_redis, milvus, milvus_client):
+    scheduler = CompactionScheduler(milvus, window_s=3600, deleted_ratio=0.5)
+    await scheduler.mark_dirty(PUBLIC, "coll_due", 10)
+    await scheduler.mark_dirty(PUBLIC, "coll_recent", 10)
+    await fake_redis.hset(scheduler._last_key(PUBLIC), "coll_recent", time.time() - 60)
+    milvus_client.row_counts["coll_recent"] = 1000
+
+    compacted = await scheduler.run_once()
+
+    assert compacted == ["coll_due"]
+    assert milvus_client.called("compact") == [("coll_due",)]
+    assert await fake_redis.hgetall(scheduler._deleted_key(PUBLIC)) == {"coll_recent": "10"}
+    assert "coll_due" in await fake_redis.hgetall(scheduler._last_key(PUBLIC))
+
+
+async def test_run_once_compacts_on_deleted_ratio_within_window(fake_redis, milvus, milvus_client):
+    scheduler = CompactionScheduler(milvus, window_s=3600, deleted_ratio=0.2)
+    await scheduler.mark_dirty(PUBLIC, "coll_a", 300)
+    await fake_redis.hset(scheduler._last_key(PUBLIC), "coll_a", time.time() - 60)
+    milvus_client.row_counts["coll_a"] = 1000
+
+    assert await scheduler.run_once() == ["coll_a"]
+
+
+async def test_run_once_skips_peak_hours_unless_forced(fake_redis, milvus, milvus_client):
+    hour = DateTimeManager._now().hour
+    scheduler = CompactionScheduler(milvus, peak_hours=f"{hour}-{hour + 1}")
+    await scheduler.mark_dirty(PUBLIC, "coll_a", 5)
+
+    assert await scheduler.run_once() == []
+    assert await scheduler.run_once(force=True) == ["coll_a"]
+    assert await fake_redis.hgetall(scheduler._deleted_key(PUBLIC)) == {}
+
+
+async def test_deletes_during_compaction_stay_dirty(fake_redis, milvus, milvus_client):
+    scheduler = CompactionScheduler(milvus)
+    await scheduler.mark_dirty(PUBLIC, "coll_a", 5)
+
+    original = milvus.compact_collection
+
+    async def compact_with_racing_delete(collection_name, milvus_instance):
+        await scheduler.mark_dirty(PUBLIC, "coll_a", 3)
+        return await original(collection_name, milvus_instance)
+
+    milvus.compact_collection = compact_with_racing_delete
+    await scheduler.run_once(force=True)
+
+    assert await fake_redis.hgetall(scheduler._deleted_key(PUBLIC)) == {"coll_a": "3"}
+
+
+def test_peak_hours_wrap_midnight():
+    ranges = parse_peak_hours("22-6, 12-13")
+    assert in_peak_hours(23, ranges) and in_peak_hours(3, ranges) and in_peak_hours(12, ranges)
+    assert not in_peak_hours(6, ranges) and not in_peak_hours(13, ranges)
+
+
+async def test_delete_without_redis_respects_compact_false(milvus_service, milvus_client, monkeypatch):
+    from services.cache.redis_service import redis_client
+
+    monkeypatch.setattr(redis_client, "get_client", lambda: None)
+    monkeypatch.setattr(milvus_service, "compaction_scheduler", CompactionScheduler(milvus_service))
+    monkeypatch.setattr(milvus_service, "collection_cache", {})
+    milvus_client.row_counts["coll_a"] = 10
+
+    assert await milvus_service.bulk_delete_by_filter('document_id == "doc"', "coll_a", PUBLIC, compact=False)
+    assert milvus_client.called("compact") == []
+
+    assert await milvus_service.bulk_delete_by_filter('document_id == "doc"', "coll_a", PUBLIC)
+    assert len(milvus_client.called("compact")) == 1
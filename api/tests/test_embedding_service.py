@@ -0,0 +1,36 @@
+import numpy as np
+
+from config.settings import get_settings
+from services.embedding import embedding_service as embedding_module
+from services.embedding.embedding_service import EmbeddingService
+from utils.lazy_model import ModelRegistry
+
+settings = get_settings()
+
+
+class TorchFallbackBackend:
+    """What create_embedding_backend returns when the ONNX model fails to load"""
+
+    name = "torch"
+    tokenizer = None
+
+    def encode(self, texts, batch_size=None):
+        return np.ones((len(texts), 4), dtype=np.float32)
+
+
+async def test_model_version_follows_backend_that_loaded(fake_redis, monkeypatch):
+    monkeypatch.setattr(settings, "EMBEDDING_BACKEND", "onnx_int8")
+    monkeypatch.setattr(embedding_module, "model_registry", ModelRegistry())
+    monkeypatch.setattr(embedding_module, "create_embedding_backend", lambda name: TorchFallbackBackend())
+    service = EmbeddingService(use_server=False, use_query_cache=True, use_chunk_store=True)
+
+    try:
+        await service.encode_queries(["hello"])
+    finally:
+        await service.shutdown()
+
+    expected = f"{settings.EMBEDDING_MODEL_REVISION}:torch"
+    assert service.model_version == expected
+    assert service._query_cache.model_version == expected
+    assert service._chunk_store.model_version == expected
+    assert await fake_redis.keys(f"*{settings.EMBEDDING_MODEL_REVISION}:onnx_int8*") == []
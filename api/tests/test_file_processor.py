@@ -0,0 +1,55 @@
+from utils import file_processor as file_processor_module
+from utils.file_processor import FileProcessor
+from utils.lazy_model import LazyModel
+
+
+class FakeTokenizer:
+    def encode(self, text):
+        return text.split()
+
+
+def _flaky_loader(failures):
+    calls = []
+
+    def load():
+        calls.append(None)
+        if len(calls) <= failures:
+            raise OSError("model download interrupted")
+        return FakeTokenizer()
+
+    return load, calls
+
+
+async def test_failed_model_load_is_retried_on_next_file(monkeypatch):
+    load, calls = _flaky_loader(failures=1)
+    monkeypatch.setattr(file_processor_module, "docling_converter_handle", None)
+    processor = FileProcessor(enable_hybrid_chunking=False)
+    processor._tokenizer_handle = LazyModel("tokenizer:test", load)
+
+    await processor._ensure_models()
+    assert processor.tokenizer is None
+    assert processor._models_resolved is False
+
+    await processor._ensure_models()
+    assert isinstance(processor.tokenizer, FakeTokenizer)
+    assert processor._models_resolved is True
+
+    await processor._ensure_models()
+    assert len(calls) == 2
+
+
+def test_docling_loader_initializes_the_pdf_pipeline(monkeypatch):
+    initialized = []
+
+    class RecordingConverter:
+        def __init__(self, format_options):
+            self.format_options = format_options
+
+        def initialize_pipeline(self, input_format):
+            initialized.append(input_format)
+
+    monkeypatch.setattr(file_processor_module, "DocumentConverter", RecordingConverter)
+
+    file_processor_module._build_docling_converter()
+
+    assert initialized == [file_processor_module.InputFormat.PDF]
@@ -0,0 +1,91 @@
+import asyncio
+
+import pytest
+
+from config.settings import get_settings
+from services.vector.index_profiles import (
+    PROFILE_FLAT,
+    PROFILE_HNSW,
+    PROFILE_IVF_SQ8,
+    build_search_params,
+    get_index_profile,
+    select_index_profile,
+)
+
+settings = get_settings()
+
+PUBLIC = "milvus_public"
+
+
+@pytest.mark.parametrize("rows, expected", [
+    (0, PROFILE_FLAT),
+    (settings.MILVUS_INDEX_FLAT_MAX_ROWS + 1, PROFILE_HNSW),
+    (settings.MILVUS_INDEX_HNSW_MAX_ROWS + 1, PROFILE_IVF_SQ8),
+])
+def test_select_index_profile_by_row_count(monkeypatch, rows, expected):
+    monkeypatch.setattr(settings, "MILVUS_USE_RABITQ_COMPRESSION", True)
+    assert select_index_profile(rows).name == expected
+
+
+def test_hnsw_ef_is_at_least_limit():
+    params = build_search_params(get_index_profile(PROFILE_HNSW), limit=500)
+    assert params["params"]["ef"] >= 500
+
+
+async def test_auto_rebuild_is_opt_in(monkeypatch, milvus_service):
+    started = []
+
+    async def record_check(*args):
+        started.append(args)
+
+    monkeypatch.setattr(milvus_service, "ensure_index_profile", record_check)
+
+    milvus_service._schedule_index_profile_check("coll_a", PUBLIC)
+    monkeypatch.setattr(settings, "MILVUS_INDEX_AUTO_REBUILD", True)
+    milvus_service._schedule_index_profile_check("coll_a", PUBLIC)
+    await asyncio.sleep(0)
+
+    assert started == [("coll_a", PUBLIC)]
+
+
+async def test_shared_collection_is_never_rebuilt_automatically(monkeypatch, milvus_service, milvus_client):
+    shared = settings.MILVUS_SHARED_COLLECTION_NAME
+    milvus_client.row_counts[shared] = settings.MILVUS_INDEX_HNSW_MAX_ROWS + 1
+    milvus_client.indexes[shared] = {"index_type": "HNSW"}
+
+    assert await milvus_service.ensure_index_profile(shared, PUBLIC) is None
+    assert milvus_client.called("release_collection") == []
+
+
+async def test_ensure_index_profile_upgrades_grown_collection(fake_redis, milvus_service, milvus_client):
+    milvus_client.row_counts["coll_a"] = settings.MILVUS_INDEX_FLAT_MAX_ROWS + 1
+    milvus_client.indexes["coll_a"] = {"index_type": "FLAT"}
+
+    assert await milvus_service.ensure_index_profile("coll_a", PUBLIC) == PROFILE_HNSW
+    assert milvus_client.indexes["coll_a"] == {"index_type": "HNSW"}
+    assert await fake_redis.keys("milvus:index_rebuild:*") == []
+
+
+async def test_rebuild_skipped_while_another_worker_holds_the_lock(fake_redis, milvus_service, milvus_client):
+    milvus_client.row_counts["coll_a"] = 10
+    await fake_redis.set(f"milvus:index_rebuild:{PUBLIC}:coll_a", "1")
+
+    assert await milvus_service.rebuild_collection_index("coll_a", PUBLIC, profile=PROFILE_HNSW) is False
+    assert milvus_client.called("release_collection") == []
+    assert await fake_redis.get(f"milvus:index_rebuild:{PUBLIC}:coll_a") == "1"
+
+
+@pytest.mark.parametrize("auto_rebuild, partitioned, expected", [
+    (False, False, "HNSW"),
+    (True, False, "FLAT"),
+    (True, True, "HNSW"),
+])
+def test_new_collection_starts_on_flat_only_when_rebuilt(
+    monkeypatch, milvus_service, milvus_client, auto_rebuild, partitioned, expected
+):
+    monkeypatch.setattr(settings, "MILVUS_INDEX_AUTO_REBUILD", auto_rebuild)
+    monkeypatch.setattr(settings, "MILVUS_HYBRID_SEARCH_ENABLED", False)
+    monkeypatch.setattr(settings, "MILVUS_FILTER_INDEXES_ENABLED", False)
+
+    assert milvus_service._create_collection("coll_new", milvus_client, partitioned=partitioned)
+    assert milvus_client.indexes["coll_new"] == {"index_type": expected}
@@ -0,0 +1,74 @@
+import asyncio
+from contextlib import asynccontextmanager
+
+from services.documents import document_service as document_service_module
+from services.documents.document_service import DocumentService
+
+
+class ScriptedSession:
+    """Returns the scripted rowcounts for successive statements"""
+
+    def __init__(self, rowcounts):
+        self.rowcounts = list(rowcounts)
+        self.executed = 0
+
+    async def execute(self, stmt):
+        self.executed += 1
+        return type("Result", (), {"rowcount": self.rowcounts.pop(0)})()
+
+    async def commit(self):
+        pass
+
+
+def _install_db_context(monkeypatch, session):
+    @asynccontextmanager
+    async def db_context():
+        yield session
+
+    monkeypatch.setattr(document_service_module, "get_db_context", db_context)
+
+
+def _fast_sleep(monkeypatch):
+    sleep = asyncio.sleep
+
+    async def no_wait(delay, *args, **kwargs):
+        await sleep(0)
+
+    monkeypatch.setattr(asyncio, "sleep", no_wait)
+
+
+async def test_heartbeat_renews_lease_until_claim_is_lost(monkeypatch):
+    session = ScriptedSession([1, 1, 0])
+    _install_db_context(monkeypatch, session)
+    _fast_sleep(monkeypatch)
+    claimed_at = object()
+    lease = {"at": claimed_at}
+
+    await DocumentService(session)._renew_ingestion_lease("doc", lease)
+
+    assert session.executed == 3
+    assert lease["at"] is not claimed_at
+
+
+async def test_heartbeat_survives_transient_db_errors(monkeypatch):
+    session = ScriptedSession([0])
+    calls = []
+
+    @asynccontextmanager
+    async def flaky_context():
+        calls.append(None)
+        if len(calls) == 1:
+            raise ConnectionError("db down")
+        yield session
+
+    monkeypatch.setattr(document_service_module, "get_db_context", flaky_context)
+    _fast_sleep(monkeypatch)
+
+    await DocumentService(session)._renew_ingestion_lease("doc", {"at": None})
+
+    assert len(calls) == 2
+
+
+async def test_final_status_requires_the_lease():
+    assert await DocumentService(ScriptedSession([1]))._release_ingestion_lease("doc", {"at": None}, chunk_count=3)
+    assert not await DocumentService(ScriptedSession([0]))._release_ingestion_lease("doc", {"at": None}, chunk_count=3)
@@ -0,0 +1,19 @@
+import asyncio
+
+from services.documents.document_service import INGESTION_WORKER_HEARTBEAT_KEY, DocumentService
+from services.documents.ingestion_worker import IngestionWorker
+
+
+async def test_uploads_fall_back_inline_without_worker_heartbeat(fake_redis):
+    assert await DocumentService._ingestion_worker_alive() is False
+
+    heartbeat = asyncio.create_task(IngestionWorker(1, 60)._heartbeat_loop())
+    await asyncio.sleep(0.01)
+    heartbeat.cancel()
+
+    assert await fake_redis.ttl(INGESTION_WORKER_HEARTBEAT_KEY) > 0
+    assert await DocumentService._ingestion_worker_alive() is True
+
+
+async def test_worker_heartbeat_unknown_without_redis():
+    assert await DocumentService._ingestion_worker_alive() is False
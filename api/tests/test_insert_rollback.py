@@ -0,0 +1,45 @@
+from common.types import DBDocumentPermissionLevel
+from config.settings import get_settings
+from services.documents.chunk_store import build_chunk_id
+from services.vector.collection_layout import resolve_collection
+
+settings = get_settings()
+
+COLLECTION = "tenant-dept-public"
+PUBLIC = DBDocumentPermissionLevel.PUBLIC.value
+META = {"document_id": "doc", "department_id": "dept"}
+
+
+def _chunks(count):
+    return [{"content": f"chunk {i}", "metadata": {}} for i in range(count)]
+
+
+async def test_failed_window_rolls_back_local_rows_and_chunk_bodies(local_vector_service, embeddings, chunk_rows, monkeypatch):
+    monkeypatch.setattr(settings, "MILVUS_INSERT_BATCH_SIZE", 2)
+    encode = embeddings.encode_documents
+
+    async def fail_second_window(documents):
+        if embeddings.encoded:
+            raise RuntimeError("embedding failed")
+        return await encode(documents)
+
+    monkeypatch.setattr(embeddings, "encode_documents", fail_second_window)
+
+    assert await local_vector_service.index_document_chunks(COLLECTION, _chunks(5), META, PUBLIC) == 0
+
+    assert await local_vector_service.local_store.fetch_all(COLLECTION) == []
+    assert chunk_rows.rows == {}
+
+
+async def test_failed_window_deletes_inserted_milvus_rows(fake_redis, milvus_service, milvus_client, embeddings, chunk_rows, monkeypatch):
+    physical = resolve_collection(COLLECTION).physical_name
+    monkeypatch.setattr(settings, "MILVUS_INSERT_BATCH_SIZE", 2)
+    monkeypatch.setattr(milvus_service, "collection_cache", {f"{PUBLIC}:{physical}": True})
+    milvus_client.row_counts[physical] = 0
+    milvus_client.fail_inserts_after = 1
+
+    assert await milvus_service.index_document_chunks(COLLECTION, _chunks(5), META, PUBLIC) == 0
+
+    deleted_filters = " ".join(kwargs["filter"] for name, _, kwargs in milvus_client.calls if name == "delete")
+    assert all(build_chunk_id("doc", f"chunk {i}") in deleted_filters for i in range(5))
+    assert chunk_rows.rows == {}
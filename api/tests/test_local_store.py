@@ -0,0 +1,41 @@
+import asyncio
+
+import pytest
+
+from common.types import DBDocumentPermissionLevel
+from services.vector.collection_layout import resolve_collection
+from services.vector.local_store import compile_filter
+
+COLLECTION = "tenant-dept-public"
+PUBLIC = DBDocumentPermissionLevel.PUBLIC.value
+META = {"document_id": "doc", "department_id": "dept"}
+
+
+def test_filter_keeps_and_inside_quoted_values():
+    predicate = compile_filter('filename == "r and d.pdf" and document_id in ["a and b", "c"]')
+
+    assert predicate({"filename": "r and d.pdf", "document_id": "a and b"})
+    assert not predicate({"filename": "r", "document_id": "a and b"})
+
+
+def test_filter_rejects_unterminated_quote():
+    with pytest.raises(ValueError):
+        compile_filter('filename == "r and d.pdf')
+
+
+async def test_concurrent_promotions_copy_rows_once(fake_redis, local_vector_service, milvus_client, monkeypatch):
+    physical = resolve_collection(COLLECTION).physical_name
+    monkeypatch.setattr(local_vector_service, "public_client", milvus_client)
+    monkeypatch.setattr(local_vector_service, "residency", None)
+    milvus_client.row_counts[physical] = 0
+    chunks = [{"content": f"chunk {i}", "metadata": {}} for i in range(3)]
+    assert await local_vector_service.index_document_chunks(COLLECTION, chunks, META, PUBLIC) == 3
+
+    await asyncio.gather(
+        local_vector_service._promote_local_collection(COLLECTION, PUBLIC),
+        local_vector_service._promote_local_collection(COLLECTION, PUBLIC),
+    )
+
+    assert sum(len(args[1]) for args in milvus_client.called("insert")) == 3
+    assert not await local_vector_service.local_store.has_collection(COLLECTION)
+    assert not await fake_redis.exists(f"vector:promote:{COLLECTION}")
@@ -0,0 +1,10 @@
+from services.cache.redis_service import RedisService
+
+
+def test_text_client_decodes_and_binary_client_does_not():
+    service = RedisService()
+    service._build_clients()
+
+    assert service.redis_client.connection_pool.connection_kwargs["decode_responses"] is True
+    assert service.binary_client.connection_pool.connection_kwargs["decode_responses"] is False
+    assert service.redis_client.connection_pool is not service.binary_client.connection_pool
@@ -0,0 +1,84 @@
+import pytest
+
+from common.types import DBDocumentPermissionLevel
+from config.settings import get_settings
+
+settings = get_settings()
+
+COLLECTION = "tenant-dept-public"
+PUBLIC = DBDocumentPermissionLevel.PUBLIC.value
+
+
+def _chunks(texts, file_name):
+    return [{"content": text, "metadata": {"file_name": file_name}} for text in texts]
+
+
+async def _rows(service):
+    return {row["chunk_id"]: row for row in await service.local_store.fetch_all(COLLECTION)}
+
+
+async def test_unchanged_chunks_get_new_position_and_metadata_without_reembedding(local_vector_service, embeddings):
+    meta = {"document_id": "doc", "department_id": "dept"}
+    await local_vector_service.index_document_chunks(COLLECTION, _chunks(["a", "b"], "old.pdf"), meta, PUBLIC)
+    embeddings.encoded.clear()
+
+    stats = await local_vector_service.reindex_document_chunks(COLLECTION, _chunks(["new", "b"], "new.pdf"), meta, PUBLIC)
+
+    assert embeddings.encoded == ["new"]
+    assert stats == {"added": 1, "removed": 1, "unchanged": 1, "refreshed": 1, "total": 2}
+    rows = await _rows(local_vector_service)
+    assert len(rows) == 2
+    unchanged = next(row for row in rows.values() if row["text"] == "b")
+    assert unchanged["document_source"] == "chunk_1"
+    assert unchanged["metadata"]["file_name"] == "new.pdf"
+
+
+async def test_rows_already_current_are_not_rewritten(local_vector_service):
+    meta = {"document_id": "doc", "department_id": "dept"}
+    await local_vector_service.index_document_chunks(COLLECTION, _chunks(["a", "b"], "f.pdf"), meta, PUBLIC)
+
+    stats = await local_vector_service.reindex_document_chunks(COLLECTION, _chunks(["a", "b", "c"], "f.pdf"), meta, PUBLIC)
+
+    assert stats["refreshed"] == 0
+    assert len(await _rows(local_vector_service)) == 3
+
+
+async def test_replace_without_chunk_ids_keeps_old_vectors_when_insert_fails(local_vector_service, chunk_rows, monkeypatch):
+    meta = {"document_id": "doc", "department_id": "dept"}
+    await local_vector_service.index_document_chunks(COLLECTION, _chunks(["a", "b"], "f.pdf"), meta, PUBLIC)
+    chunk_rows.rows.clear()
+    before = await _rows(local_vector_service)
+
+    async def failing_insert(*args, **kwargs):
+        return False
+
+    monkeypatch.setattr(local_vector_service, "insert_documents", failing_insert)
+    with pytest.raises(RuntimeError):
+        await local_vector_service.reindex_document_chunks(COLLECTION, _chunks(["c"], "f.pdf"), meta, PUBLIC)
+
+    assert (await _rows(local_vector_service)).keys() == before.keys()
+
+
+async def test_replace_without_chunk_ids_drops_previous_version(local_vector_service, chunk_rows):
+    meta = {"document_id": "doc", "department_id": "dept"}
+    await local_vector_service.index_document_chunks(COLLECTION, _chunks(["a", "b"], "f.pdf"), meta, PUBLIC)
+    chunk_rows.rows.clear()
+
+    stats = await local_vector_service.reindex_document_chunks(COLLECTION, _chunks(["a", "c"], "f.pdf"), meta, PUBLIC)
+
+    assert stats["added"] == 2
+    assert sorted(row["text"] for row in (await _rows(local_vector_service)).values()) == ["a", "c"]
+
+
+async def test_milvus_rows_of_moved_chunks_are_upserted_by_primary_key(fake_redis, milvus_service, milvus_client):
+    moved = {"chunk_id": "c1", "document_source": "chunk_1", "metadata": {"file_name": "new.pdf"}, "document_id": "doc"}
+    current = {"chunk_id": "c2", "document_source": "chunk_2", "metadata": {"file_name": "new.pdf"}, "document_id": "doc"}
+    milvus_client.rows[COLLECTION] = [
+        {"id": 11, "chunk_id": "c1", "document_source": "chunk_0", "metadata": {"file_name": "old.pdf"}, "vector": [0.1]},
+        {"id": 12, "chunk_id": "c2", "document_source": "chunk_2", "metadata": {"file_name": "new.pdf"}, "vector": [0.2]},
+    ]
+
+    assert await milvus_service._refresh_unchanged_rows(COLLECTION, [moved, current], PUBLIC) == 1
+
+    (_, data), = milvus_client.called("upsert")
+    assert data == [{"id": 11, "chunk_id": "c1", "document_source": "chunk_1", "metadata": {"file_name": "new.pdf"}, "vector": [0.1]}]
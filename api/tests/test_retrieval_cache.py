@@ -0,0 +1,36 @@
+import asyncio
+
+import numpy as np
+
+from services.vector.retrieval_cache import RetrievalCache
+
+COLLECTION = "coll_docs"
+PARAMS = {"top_k": 5, "score_threshold": 0.2, "filter": None, "hybrid": False, "mmr_lambda": None}
+
+
+def test_key_ignores_vector_noise_and_query_formatting():
+    cache = RetrievalCache()
+    vector = np.random.default_rng(0).random(8, dtype=np.float32)
+    noisy = vector.astype(np.float16).astype(np.float32)
+
+    key = cache.build_key(COLLECTION, 1, " What is  RAG?", vector, PARAMS, "rev:onnx_int8")
+
+    assert cache.build_key(COLLECTION, 1, "What is RAG?", noisy, PARAMS, "rev:onnx_int8") == key
+    assert cache.build_key(COLLECTION, 1, "What is RAG?", vector, PARAMS, "rev:torch") != key
+    assert cache.build_key(COLLECTION, 1, "What is RAG?", vector, {**PARAMS, "top_k": 10}, "rev:onnx_int8") != key
+
+
+async def test_invalidate_bumps_version_again_after_visibility_delay(fake_redis):
+    cache = RetrievalCache(visibility_delay_s=0.05)
+    vector = np.ones(4, dtype=np.float32)
+
+    await cache.invalidate(COLLECTION)
+    # A search racing the write still sees the old rows and caches them under the bumped version
+    key, _ = await cache.get(COLLECTION, "query", vector, PARAMS)
+    await cache.set(key, [{"id": "stale"}], 0.1)
+    assert (await cache.get(COLLECTION, "query", vector, PARAMS))[1] == [{"id": "stale"}]
+
+    await asyncio.sleep(0.1)
+
+    assert await fake_redis.get(cache._version_key(COLLECTION)) == "2"
+    assert (await cache.get(COLLECTION, "query", vector, PARAMS))[1] is None
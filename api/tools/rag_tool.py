@@ -6,13 +6,15 @@ from langchain_core.tools import BaseTool
 from langchain_core.callbacks import AsyncCallbackManagerForToolRun, CallbackManagerForToolRun
 from pydantic import BaseModel
 
-from common.types import AccessLevel, DBDocumentPermissionLevel
+from common.types import AccessLevel
+from config.settings import get_settings
 
 from models.models import RAGSearchInput
 from utils.logging import get_logger
 import json
 
 logger = get_logger(__name__)
+settings = get_settings()
 
 
 class RAGSearchTool(BaseTool):
@@ -205,116 +207,86 @@ class RAGSearchTool(BaseTool):
                         "requested_access_levels": access_levels,
                         "effective_access_levels": []
                     }, ensure_ascii=False, indent=2)
-                
-                all_results = []
-                search_summary = {
-                    "collections_searched": [],
-                    "collections_failed": [],
-                    "total_results_by_collection": {}
-                }
-                
-                for collection_name in all_accessible_collections:
-                    try:
-                        if collection_name.endswith("_public"):
-                            milvus_instance = DBDocumentPermissionLevel.PUBLIC.value
-                            collection_type = "public"
-                        else:
-                            milvus_instance = DBDocumentPermissionLevel.PRIVATE.value
-                            collection_type = "private"
-                        
-                        collection_results = await milvus_service.search_documents(
-                            query=query,
-                            collection_name=collection_name,
-                            milvus_instance=milvus_instance,
-                            top_k=10,
-                            score_threshold=0.7
-                        )
-                        
-                        for result in collection_results:
-                            result["collection"] = collection_name
-                            result["collection_type"] = collection_type
-                            result["milvus_instance"] = milvus_instance
-                        
-                        all_results.extend(collection_results)
-                        search_summary["collections_searched"].append(collection_name)
-                        search_summary["total_results_by_collection"][collection_name] = len(collection_results)
-                        
-                    except Exception as e:
-                        logger.warning(f"Failed to search collection {collection_name}: {e}")
-                        search_summary["collections_failed"].append({
-                            "collection": collection_name,
-                            "error": str(e)
-                        })
-                        continue
-                
-                if not all_results:
-                    return json.dumps({
-                        "context": "",
-                        "documents": [],
-                        "message": f"No relevant documents found in {department} collections for your query",
-                        "department": department,
-                        "requested_access_levels": access_levels,
-                        "effective_access_levels": effective_access_levels,
-                        "search_summary": search_summary
-                    }, ensure_ascii=False, indent=2)
-                
-                all_results.sort(key=lambda x: x.get("score", 0.0), reverse=True)
-                top_results = all_results[:15]  
 
-                context_parts = []
-                documents = []
-                
-                for result in top_results:
-                    content = result.get("content", "")
-                    metadata = result.get("metadata", {})
-                    
-                    if content and content not in context_parts: 
-                        context_parts.append(content)
-                    
-                    documents.append({
-                        "document_id": result.get("id", metadata.get("document_id", "unknown")),
-                        "content": content,
-                        "score": round(result.get("score", 0.0), 3),
-                        "source": metadata.get("document_source", "Unknown"),
-                        "department": metadata.get("department", department),
-                        "collection": result.get("collection", "unknown"),
-                        "collection_type": result.get("collection_type", "unknown"),
-                        "datetime": metadata.get("created_at", metadata.get("timestamp", "Unknown")),
-                        "metadata": metadata
-                    })
-                
-                context = "\n\n---\n\n".join(context_parts)
-                
-                results_by_access_level = {}
-                for level in effective_access_levels:
-                    level_results = [doc for doc in documents if (
-                        (level == AccessLevel.PUBLIC.value and doc["collection_type"] == "public") or
-                        (level == AccessLevel.PRIVATE.value and doc["collection_type"] == "private")
-                    )]
-                    results_by_access_level[level] = len(level_results)
-                
-                result = {
-                    "context": context,
-                    "documents": documents,
-                    "total_results": len(all_results),
-                    "displayed_results": len(top_results),
+            search = await milvus_service.search_collections(
+                query=query,
+                collection_names=all_accessible_collections,
+                top_k=settings.RAG_SEARCH_TOP_K,
+                final_top_k=settings.RAG_SEARCH_FINAL_TOP_K,
+                score_threshold=settings.RAG_SCORE_THRESHOLD
+            )
+            search_summary = {
+                "collections_searched": search["collections_searched"],
+                "collections_failed": search["collections_failed"],
+                "total_results_by_collection": search["total_results_by_collection"]
+            }
+            top_results = search["results"]
+
+            if not top_results:
+                return json.dumps({
+                    "context": "",
+                    "documents": [],
+                    "message": f"No relevant documents found in {department} collections for your query",
                     "department": department,
                     "requested_access_levels": access_levels,
                     "effective_access_levels": effective_access_levels,
-                    "results_by_access_level": results_by_access_level,
-                    "search_summary": search_summary,
-                    "search_metadata": {
-                        "query": query,
-                        "top_k_per_collection": 10,
-                        "final_top_k": 15,
-                        "score_threshold": 0.7,
-                        "search_method": "multi_collection_vector_search",
-                        "collections_count": len(all_accessible_collections)
-                    }
-                }
+                    "search_summary": search_summary
+                }, ensure_ascii=False, indent=2)
+
+            context_parts = []
+            documents = []
+            
+            for result in top_results:
+                content = result.get("content", "")
+                metadata = result.get("metadata", {})
                 
-                return json.dumps(result, ensure_ascii=False, indent=2)
+                if content and content not in context_parts: 
+                    context_parts.append(content)
                 
+                documents.append({
+                    "document_id": result.get("id", metadata.get("document_id", "unknown")),
+                    "content": content,
+                    "score": round(result.get("score", 0.0), 3),
+                    "source": metadata.get("document_source", "Unknown"),
+                    "department": metadata.get("department", department),
+                    "collection": result.get("collection", "unknown"),
+                    "collection_type": result.get("collection_type", "unknown"),
+                    "datetime": metadata.get("created_at", metadata.get("timestamp", "Unknown")),
+                    "metadata": metadata
+                })
+            
+            context = "\n\n---\n\n".join(context_parts)
+            
+            results_by_access_level = {}
+            for level in effective_access_levels:
+                level_results = [doc for doc in documents if (
+                    (level == AccessLevel.PUBLIC.value and doc["collection_type"] == "public") or
+                    (level == AccessLevel.PRIVATE.value and doc["collection_type"] == "private")
+                )]
+                results_by_access_level[level] = len(level_results)
+            
+            result = {
+                "context": context,
+                "documents": documents,
+                "total_results": search["total_results"],
+                "displayed_results": len(top_results),
+                "department": department,
+                "requested_access_levels": access_levels,
+                "effective_access_levels": effective_access_levels,
+                "results_by_access_level": results_by_access_level,
+                "search_summary": search_summary,
+                "search_metadata": {
+                    "query": query,
+                    "top_k_per_collection": settings.RAG_SEARCH_TOP_K,
+                    "final_top_k": settings.RAG_SEARCH_FINAL_TOP_K,
+                    "score_threshold": settings.RAG_SCORE_THRESHOLD,
+                    "search_method": "multi_collection_fused_search",
+                    "collections_count": len(all_accessible_collections)
+                }
+            }
+            
+            return json.dumps(result, ensure_ascii=False, indent=2)
+            
         except Exception as e:
             logger.error(f"RAG search failed: {e}")
             error_result = {
@@ -55,10 +55,60 @@ try:
 except ImportError:
     PDFPLUMBER_AVAILABLE = False
 
+from utils.lazy_model import LazyModel, model_registry
 from utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+
+def _load_tokenizer(tokenizer_name: str):
+    """Load AutoTokenizer from HuggingFace for token-based chunking."""
+    tokenizer = AutoTokenizer.from_pretrained(
+        tokenizer_name,
+        trust_remote_code=True
+    )
+    logger.info(f"Successfully initialized tokenizer: {tokenizer_name}")
+    return tokenizer
+
+
+def get_tokenizer_handle(tokenizer_name: str) -> LazyModel:
+    """Shared lazy tokenizer handle for the given HuggingFace model name."""
+    return model_registry.register(
+        f"tokenizer:{tokenizer_name}",
+        lambda: _load_tokenizer(tokenizer_name)
+    )
+
+
+def _build_docling_converter():
+    """Setup Docling DocumentConverter for advanced document processing."""
+    pipeline_options = PdfPipelineOptions()
+    
+    if is_arm:
+        pipeline_options.generate_page_images = False
+        pipeline_options.images_scale = 0.5
+    else:
+        pipeline_options.generate_page_images = True
+        pipeline_options.images_scale = 1.0
+        
+    pipeline_options.do_table_structure = True
+    pipeline_options.table_structure_options.do_cell_matching = True
+    
+    converter = DocumentConverter(
+        format_options={
+            InputFormat.PDF: PdfFormatOption(pipeline_options=pipeline_options)
+        }
+    )
+    # The layout and table models load with the pipeline, not the converter; load them here so
+    # warm-up pays that cost instead of the first PDF upload
+    converter.initialize_pipeline(InputFormat.PDF)
+    logger.info("Docling DocumentConverter initialized successfully")
+    return converter
+
+
+docling_converter_handle: Optional[LazyModel] = (
+    model_registry.register("docling_converter", _build_docling_converter) if DOCLING_AVAILABLE else None
+)
+
 class FileProcessor:
     """
     Advanced document processor with HybridChunker for automatic token-aware chunking.
@@ -84,7 +134,10 @@ class FileProcessor:
                  max_tokens: int = 1500,
                  enable_hybrid_chunking: bool = True):
         """
-        Initialize FileProcessor with AutoTokenizer and HybridChunker.
+        Initialize FileProcessor configuration.
+        
+        The tokenizer and Docling converter are process-wide lazy models shared by all
+        processors; they are resolved on the first processed file (or by startup warm-up).
         
         Args:
             tokenizer_name: HuggingFace tokenizer model name
@@ -95,24 +148,45 @@ class FileProcessor:
         self.max_tokens = max_tokens
         self.enable_hybrid_chunking = enable_hybrid_chunking
         
-        self._initialize_tokenizer()
-        self._initialize_chunkers()
+        self.tokenizer = None
+        self.hybrid_chunker = None
+        self.text_splitter = None
+        self.docling_converter = None
+        self._models_resolved = False
+        
+        self._tokenizer_handle = get_tokenizer_handle(tokenizer_name)
         self._check_dependencies()
-        self._setup_docling_converter()
         
         logger.info(f"FileProcessor initialized - Tokenizer: {tokenizer_name} | Max tokens: {max_tokens} | Hybrid chunking: {enable_hybrid_chunking} | Threads: {thread_count}")
     
-    def _initialize_tokenizer(self):
-        """Load AutoTokenizer from HuggingFace for token-based chunking."""
-        try:
-            self.tokenizer = AutoTokenizer.from_pretrained(
-                self.tokenizer_name,
-                trust_remote_code=True
-            )
-            logger.info(f"Successfully initialized tokenizer: {self.tokenizer_name}")
-        except Exception as e:
-            logger.error(f"Failed to initialize tokenizer {self.tokenizer_name}: {e}")
-            self.tokenizer = None
+    async def _ensure_models(self):
+        """
+        Resolve shared tokenizer and Docling converter without blocking the event loop.
+        A handle that failed to load is retried on the next call; resolution is only cached
+        once every available model is loaded.
+        """
+        if self._models_resolved:
+            return
+        
+        if self.tokenizer is None:
+            try:
+                self.tokenizer = await self._tokenizer_handle.aget()
+            except Exception as e:
+                logger.error(f"Failed to initialize tokenizer {self.tokenizer_name}: {e}")
+                self.tokenizer = None
+            
+            self._initialize_chunkers()
+        
+        if docling_converter_handle and self.docling_converter is None:
+            try:
+                self.docling_converter = await docling_converter_handle.aget()
+            except Exception as e:
+                logger.error(f"Failed to initialize Docling converter: {e}")
+                self.docling_converter = None
+        
+        self._models_resolved = self.tokenizer is not None and (
+            docling_converter_handle is None or self.docling_converter is not None
+        )
     
     def _initialize_chunkers(self):
         """Initialize HybridChunker with AutoTokenizer for automatic token calculation."""
@@ -168,34 +242,6 @@ class FileProcessor:
             logger.error(f"Failed to initialize text splitter: {e}")
             self.text_splitter = RecursiveCharacterTextSplitter(chunk_size=1500, chunk_overlap=200)
     
-    def _setup_docling_converter(self):
-        """Setup Docling DocumentConverter for advanced document processing."""
-        if DOCLING_AVAILABLE:
-            try:
-                pipeline_options = PdfPipelineOptions()
-                
-                if is_arm:
-                    pipeline_options.generate_page_images = False
-                    pipeline_options.images_scale = 0.5
-                else:
-                    pipeline_options.generate_page_images = True
-                    pipeline_options.images_scale = 1.0
-                    
-                pipeline_options.do_table_structure = True
-                pipeline_options.table_structure_options.do_cell_matching = True
-                
-                self.docling_converter = DocumentConverter(
-                    format_options={
-                        InputFormat.PDF: PdfFormatOption(pipeline_options=pipeline_options)
-                    }
-                )
-                logger.info("Docling DocumentConverter initialized successfully")
-            except Exception as e:
-                logger.error(f"Failed to initialize Docling converter: {e}")
-                self.docling_converter = None
-        else:
-            self.docling_converter = None
-    
     def _check_dependencies(self):
         """Check and log available document processing dependencies."""
         if DOCLING_AVAILABLE:
@@ -308,6 +354,7 @@ class FileProcessor:
             if metadata:
                 base_metadata.update(metadata)
             
+            await self._ensure_models()
             chunks = await self._extract_and_chunk_with_strategy(file_path, file_extension, base_metadata)
             
             for i, chunk in enumerate(chunks):
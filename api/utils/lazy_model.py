@@ -0,0 +1,133 @@
+"""
+Lazy model handles
+Heavy models (embedding backend, tokenizer, Docling converter) are loaded on first use
+or by a background warm-up started from the application lifespan, never at import time.
+"""
+import asyncio
+import threading
+import time
+from typing import Any, Callable, Dict, Generic, Optional, TypeVar
+
+from utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+STATE_PENDING = "pending"
+STATE_LOADING = "loading"
+STATE_READY = "ready"
+STATE_FAILED = "failed"
+
+
+class LazyModel(Generic[T]):
+    """
+    Load-once handle for a heavy model, shared by threads and the event loop.
+    The loader runs at most once at a time; a failed load is recorded and retried on next use.
+    """
+
+    def __init__(self, name: str, loader: Callable[[], T]):
+        self.name = name
+        self._loader = loader
+        self._lock = threading.Lock()
+        self._value: Optional[T] = None
+        self._state = STATE_PENDING
+        self._error: Optional[str] = None
+        self._load_seconds: Optional[float] = None
+
+    @property
+    def is_ready(self) -> bool:
+        return self._state == STATE_READY
+
+    def get(self) -> T:
+        """Return the model, loading it on the calling thread if needed (blocking)"""
+        if self._state == STATE_READY:
+            return self._value
+
+        with self._lock:
+            if self._state == STATE_READY:
+                return self._value
+
+            self._state = STATE_LOADING
+            start = time.perf_counter()
+            try:
+                value = self._loader()
+            except Exception as e:
+                self._state = STATE_FAILED
+                self._error = str(e)
+                logger.error(f"Failed to load model '{self.name}': {e}")
+                raise
+
+            self._value = value
+            self._load_seconds = time.perf_counter() - start
+            self._error = None
+            self._state = STATE_READY
+            logger.info(f"Model '{self.name}' loaded in {self._load_seconds:.1f}s")
+            return value
+
+    async def aget(self) -> T:
+        """Return the model, loading it in a worker thread so the event loop is never blocked"""
+        if self._state == STATE_READY:
+            return self._value
+        return await asyncio.to_thread(self.get)
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "state": self._state,
+            "load_seconds": round(self._load_seconds, 2) if self._load_seconds is not None else None,
+            "error": self._error
+        }
+
+
+class ModelRegistry:
+    """Process-wide registry of lazy model handles used for warm-up and readiness"""
+
+    def __init__(self):
+        self._models: Dict[str, LazyModel] = {}
+        self._lock = threading.Lock()
+        self._warmup_task: Optional[asyncio.Task] = None
+
+    def register(self, name: str, loader: Callable[[], T]) -> LazyModel[T]:
+        """Register a model loader; an existing handle with the same name is shared"""
+        with self._lock:
+            handle = self._models.get(name)
+            if handle is None:
+                handle = LazyModel(name, loader)
+                self._models[name] = handle
+            return handle
+
+    def get(self, name: str) -> Optional[LazyModel]:
+        return self._models.get(name)
+
+    async def warmup(self) -> None:
+        """Load every registered model, one at a time to avoid competing for CPU and memory"""
+        for handle in list(self._models.values()):
+            try:
+                await handle.aget()
+            except Exception as e:
+                logger.warning(f"Warm-up of model '{handle.name}' failed, it will load on first use: {e}")
+
+    def start_warmup(self) -> asyncio.Task:
+        """Start warm-up in the background; requests are served while models load"""
+        if self._warmup_task is None or self._warmup_task.done():
+            self._warmup_task = asyncio.create_task(self.warmup())
+        return self._warmup_task
+
+    async def stop_warmup(self) -> None:
+        """Cancel a warm-up still in progress (a load already running in a thread finishes on its own)"""
+        if self._warmup_task and not self._warmup_task.done():
+            self._warmup_task.cancel()
+            try:
+                await self._warmup_task
+            except asyncio.CancelledError:
+                pass
+        self._warmup_task = None
+
+    def is_ready(self) -> bool:
+        return all(handle.is_ready for handle in self._models.values())
+
+    def status(self) -> Dict[str, Dict[str, Any]]:
+        return {name: handle.status() for name, handle in self._models.items()}
+
+
+model_registry = ModelRegistry()
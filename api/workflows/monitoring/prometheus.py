@@ -1 +1,82 @@
-# Prometheus monitoring workflow
\ No newline at end of file
+"""
+Prometheus metrics shared across services
+Exposed through the /metrics endpoint registered in main.py
+"""
+from prometheus_client import Counter, Gauge, Histogram
+
+# Embedding
+EMBEDDING_QUERY_CACHE_REQUESTS = Counter(
+    "embedding_query_cache_requests_total",
+    "Query embedding cache lookups by tier and result",
+    ["tier", "result"],
+)
+
+EMBEDDING_CHUNK_STORE_REQUESTS = Counter(
+    "embedding_chunk_store_requests_total",
+    "Document chunk embedding store lookups by result (hit = chunk not re-embedded)",
+    ["result"],
+)
+
+# Retrieval
+RETRIEVAL_CACHE_REQUESTS = Counter(
+    "retrieval_cache_requests_total",
+    "Retrieval result cache lookups per collection search, by tenant and result",
+    ["tenant", "result"],
+)
+
+RETRIEVAL_CACHE_SAVED_SECONDS = Counter(
+    "retrieval_cache_saved_seconds_total",
+    "Search latency avoided by retrieval cache hits, by tenant",
+    ["tenant"],
+)
+
+# Milvus collection residency
+MILVUS_LOADED_COLLECTIONS = Gauge(
+    "milvus_loaded_collections",
+    "Collections currently loaded in query-node memory, by instance",
+    ["instance"],
+)
+
+MILVUS_COLLECTION_LOAD_SECONDS = Histogram(
+    "milvus_collection_load_seconds",
+    "Time to load and warm up a released collection on first access, by instance",
+    ["instance"],
+    buckets=(0.5, 1, 2.5, 5, 10, 20, 30, 60, 120),
+)
+
+MILVUS_COLLECTION_RELEASES = Counter(
+    "milvus_collection_releases_total",
+    "Collections released from query-node memory, by instance and reason (idle, count, memory)",
+    ["instance", "reason"],
+)
+
+MILVUS_COMPACTIONS = Counter(
+    "milvus_compactions_total",
+    "Scheduled collection compactions, by instance and trigger (window, ratio, forced)",
+    ["instance", "trigger"],
+)
+
+# Milvus collection stats (refreshed in the background by CollectionStatsCollector)
+MILVUS_COLLECTION_ROWS = Gauge(
+    "milvus_collection_rows",
+    "Row count per physical collection",
+    ["instance", "collection"],
+)
+
+MILVUS_COLLECTION_PENDING_INDEX_ROWS = Gauge(
+    "milvus_collection_pending_index_rows",
+    "Rows not yet covered by the vector index, per physical collection",
+    ["instance", "collection"],
+)
+
+MILVUS_COLLECTION_LOADED = Gauge(
+    "milvus_collection_loaded",
+    "Whether a physical collection is loaded in query-node memory (1) or not (0)",
+    ["instance", "collection"],
+)
+
+MILVUS_STATS_REFRESH_SECONDS = Histogram(
+    "milvus_stats_refresh_seconds",
+    "Time to collect stats of all collections on both instances",
+    buckets=(0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)